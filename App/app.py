@@ -20,14 +20,17 @@ def index():
 @app.route('/ui_event', methods=['POST'])
 def handle_ui_event():
     data = request.json
-    event_type = data.get("event")
-    text_content = data.get("text")
-    flask_logger.info(f"UI Event Received: {event_type}, Text Snippet: {str(text_content)[:70] if text_content else 'N/A'}...")
-    message_to_send = {"event": event_type}
-    if text_content is not None:
-        message_to_send["text"] = str(text_content)
-    message_queue.put(f"data: {json.dumps(message_to_send)}\n\n")
-    return jsonify({"status": "event_received", "event": event_type}), 200
+    # Jarvis batches bursts as {"events": [...]}; a single event is posted on its own.
+    events = data.get("events") if isinstance(data.get("events"), list) else [data]
+    for item in events:
+        event_type = item.get("event")
+        text_content = item.get("text")
+        flask_logger.info(f"UI Event Received: {event_type}, Text Snippet: {str(text_content)[:70] if text_content else 'N/A'}...")
+        message_to_send = {"event": event_type}
+        if text_content is not None:
+            message_to_send["text"] = str(text_content)
+        message_queue.put(f"data: {json.dumps(message_to_send)}\n\n")
+    return jsonify({"status": "event_received", "events": len(events)}), 200
 
 @app.route('/listen_events')
 def listen_events():
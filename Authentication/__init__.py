@@ -1,2 +1,7 @@
-from .jarvis_vision import run_jarvis_vision_deepface
-__all__ = ["run_jarvis_vision_deepface"]
\ No newline at end of file
+from utils.lazy_loader import lazy_attr
+from .person_tracker import PersonTracker
+from .presence_service import PresenceService
+
+# DeepFace and YOLO are only imported when a visual check actually runs.
+run_jarvis_vision_deepface = lazy_attr("Authentication.jarvis_vision", "run_jarvis_vision_deepface")
+__all__ = ["run_jarvis_vision_deepface", "PersonTracker", "PresenceService"]
\ No newline at end of file
@@ -1,8 +1,11 @@
-from ultralytics import YOLO
 from deepface import DeepFace
 import cv2
 import numpy as np
+import functools
 import os
+import threading
+from utils.model_registry import YOLO_DEFAULT_IMGSZ, get_yolo_model, model_registry
+from .person_tracker import identify_master
 
 YOLO_MODEL_PATH = "yolov8n.pt"
 KNOWN_FACE_IMAGE_PATH = "C:/Users/Debajyoti/OneDrive/Desktop/Jarves full agent/Authentication/master_image.jpg"
@@ -19,27 +22,224 @@ MASTER_SYMBOL = "★"
 PERSON_SYMBOL = "👤"
 JARVIS_ONLINE_SYMBOL = "💡"
 
+# DeepFace.verify's own cut-offs, used when deepface cannot report one; JARVIS_FACE_MATCH_THRESHOLD overrides.
+DEFAULT_COSINE_THRESHOLDS = {"VGG-Face": 0.68, "Facenet": 0.40, "Facenet512": 0.30, "ArcFace": 0.68, "SFace": 0.593}
+FACE_MATCH_THRESHOLD = os.getenv("JARVIS_FACE_MATCH_THRESHOLD")
+
+# Face localization ahead of recognition: auto (YuNet if its model is present, else Haar) | yunet | haar | off.
+FACE_LOCATOR = os.getenv("JARVIS_FACE_LOCATOR", "auto").lower()
+YUNET_MODEL_PATH = os.getenv("JARVIS_YUNET_MODEL", "models/face_detection_yunet_2023mar.onnx")
+# Person ROIs are shrunk so their longest side is at most this many pixels before looking for a face.
+FACE_LOCATE_MAX_SIDE = int(os.getenv("JARVIS_FACE_LOCATE_MAX_SIDE", "320"))
+FACE_SCORE_THRESHOLD = float(os.getenv("JARVIS_FACE_SCORE_THRESHOLD", "0.8"))
+# Extra context kept around the face box, as a fraction of its size.
+FACE_CROP_MARGIN = float(os.getenv("JARVIS_FACE_CROP_MARGIN", "0.2"))
+FACE_MIN_SIZE_PX = 20
+
+_master_embeddings = {}
+_master_embeddings_lock = threading.Lock()
+
+
+class _YuNetLocator:
+    name = "yunet"
+
+    def __init__(self, model_path):
+        self.detector = cv2.FaceDetectorYN.create(model_path, "", (FACE_LOCATE_MAX_SIDE, FACE_LOCATE_MAX_SIDE),
+                                                  FACE_SCORE_THRESHOLD, 0.3, 50)
+        self.lock = threading.Lock()
+
+    def detect(self, small_bgr):
+        """(x, y, w, h, right_eye, left_eye) per face; the eyes as they appear left and right in the image."""
+        h, w = small_bgr.shape[:2]
+        with self.lock:
+            self.detector.setInputSize((w, h))
+            _, faces = self.detector.detect(small_bgr)
+        if faces is None:
+            return []
+        return [(*f[0:4], (f[4], f[5]), (f[6], f[7])) for f in faces]
+
+
+class _HaarLocator:
+    name = "haar"
+
+    def __init__(self):
+        self.cascade = cv2.CascadeClassifier(os.path.join(cv2.data.haarcascades, "haarcascade_frontalface_default.xml"))
+        if self.cascade.empty():
+            raise IOError("OpenCV's frontal face Haar cascade could not be loaded.")
+
+    def detect(self, small_bgr):
+        gray = cv2.equalizeHist(cv2.cvtColor(small_bgr, cv2.COLOR_BGR2GRAY))
+        faces = self.cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5, minSize=(FACE_MIN_SIZE_PX // 2, FACE_MIN_SIZE_PX // 2))
+        return [(x, y, w, h, None, None) for x, y, w, h in faces]
+
+
+def _load_face_locator():
+    if FACE_LOCATOR in ("auto", "yunet"):
+        if hasattr(cv2, "FaceDetectorYN") and os.path.exists(YUNET_MODEL_PATH):
+            return _YuNetLocator(YUNET_MODEL_PATH)
+        if FACE_LOCATOR == "yunet":
+            print(f"YuNet face detector unavailable (model '{YUNET_MODEL_PATH}' or OpenCV >= 4.5.4 missing); using Haar.")
+    return _HaarLocator()
+
+
+def get_face_locator():
+    """Shared face localizer, or None when JARVIS_FACE_LOCATOR=off (DeepFace then detects faces itself)."""
+    if FACE_LOCATOR == "off":
+        return None
+    if not model_registry.is_registered("face_locator"):
+        model_registry.register("face_locator", _load_face_locator)
+    return model_registry.get("face_locator")
+
+
+def _align(crop, right_eye, left_eye):
+    """Rotates the crop so the eyes are level."""
+    angle = np.degrees(np.arctan2(left_eye[1] - right_eye[1], left_eye[0] - right_eye[0]))
+    if abs(angle) < 1.0:
+        return crop
+    center = ((right_eye[0] + left_eye[0]) / 2.0, (right_eye[1] + left_eye[1]) / 2.0)
+    rotation = cv2.getRotationMatrix2D(center, angle, 1.0)
+    return cv2.warpAffine(crop, rotation, (crop.shape[1], crop.shape[0]), flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+
+
+def locate_face(roi_bgr, locator=None):
+    """
+    Aligned crop of the largest face in a person ROI, found on a copy downscaled to
+    FACE_LOCATE_MAX_SIDE and cut from the full-resolution ROI; None when there is no face.
+    """
+    locator = locator or get_face_locator()
+    h, w = roi_bgr.shape[:2]
+    scale = min(1.0, FACE_LOCATE_MAX_SIDE / float(max(h, w)))
+    small = cv2.resize(roi_bgr, (max(1, int(w * scale)), max(1, int(h * scale))), interpolation=cv2.INTER_AREA) if scale < 1.0 else roi_bgr
+    faces = locator.detect(small)
+    if not len(faces):
+        return None
+    fx, fy, fw, fh, right_eye, left_eye = max(faces, key=lambda f: f[2] * f[3])
+    fx, fy, fw, fh = fx / scale, fy / scale, fw / scale, fh / scale
+    if min(fw, fh) < FACE_MIN_SIZE_PX:
+        return None
+    mx, my = fw * FACE_CROP_MARGIN, fh * FACE_CROP_MARGIN
+    x1, y1 = int(max(0, fx - mx)), int(max(0, fy - my))
+    x2, y2 = int(min(w, fx + fw + mx)), int(min(h, fy + fh + my))
+    if x1 >= x2 or y1 >= y2:
+        return None
+    crop = roi_bgr[y1:y2, x1:x2]
+    if right_eye is not None and left_eye is not None:
+        crop = _align(crop, (right_eye[0] / scale - x1, right_eye[1] / scale - y1), (left_eye[0] / scale - x1, left_eye[1] / scale - y1))
+    return crop
+
+
+def _embeddings_of(img, pre_cropped=False):
+    """
+    Unit-length DeepFace embeddings (one row per face found) of an image path or BGR array.
+    `pre_cropped` images are a single face from `locate_face` and skip DeepFace's own detection.
+    """
+    if pre_cropped:
+        faces = DeepFace.represent(img_path=img, model_name=DEEPFACE_MODEL_NAME, enforce_detection=False, detector_backend='skip')
+    else:
+        faces = DeepFace.represent(img_path=img, model_name=DEEPFACE_MODEL_NAME, enforce_detection=True, detector_backend='opencv')
+    vectors = np.asarray([face["embedding"] for face in faces], dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _master_image_embeddings(known_face_img_path):
+    """The master is cropped by the same locator as the probes, so both sides of the match look alike."""
+    locator = get_face_locator()
+    if locator is not None:
+        image = cv2.imread(known_face_img_path)
+        face = locate_face(image, locator) if image is not None else None
+        if face is not None:
+            return _embeddings_of(face, pre_cropped=True)
+        print(f"No face found in {known_face_img_path} by the {locator.name} locator; letting DeepFace detect it.")
+    return _embeddings_of(known_face_img_path)
+
+
+def master_embedding_cache_path(known_face_img_path):
+    locator = "deepface" if FACE_LOCATOR == "off" else get_face_locator().name
+    return f"{os.path.splitext(known_face_img_path)[0]}.{DEEPFACE_MODEL_NAME}.{locator}.npy"
+
+
+def get_master_embeddings(known_face_img_path=KNOWN_FACE_IMAGE_PATH):
+    """
+    Embeddings of the master image, computed once. They persist next to the image as a .npy that is
+    recomputed when the image is newer than it.
+    """
+    with _master_embeddings_lock:
+        cached = _master_embeddings.get(known_face_img_path)
+        if cached is not None:
+            return cached
+        cache_path = master_embedding_cache_path(known_face_img_path)
+        embeddings = None
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(known_face_img_path):
+            try:
+                embeddings = np.load(cache_path)
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable master embedding cache {cache_path}: {e}")
+        if embeddings is None:
+            embeddings = _master_image_embeddings(known_face_img_path)
+            try:
+                np.save(cache_path, embeddings)
+            except OSError as e:
+                print(f"Could not persist the master embedding to {cache_path}: {e}")
+        _master_embeddings[known_face_img_path] = embeddings
+        return embeddings
+
+
+@functools.lru_cache(maxsize=None)
+def face_match_threshold():
+    if FACE_MATCH_THRESHOLD:
+        return float(FACE_MATCH_THRESHOLD)
+    try:
+        from deepface.modules.verification import find_threshold
+        return find_threshold(DEEPFACE_MODEL_NAME, DEEPFACE_DISTANCE_METRIC)
+    except ImportError:
+        pass
+    try:
+        from deepface.commons.distance import findThreshold
+        return findThreshold(DEEPFACE_MODEL_NAME, DEEPFACE_DISTANCE_METRIC)
+    except ImportError:
+        return DEFAULT_COSINE_THRESHOLDS.get(DEEPFACE_MODEL_NAME, 0.40)
+
+
+def master_distance(person_roi_bgr, known_face_img_path=KNOWN_FACE_IMAGE_PATH):
+    """
+    Cosine distance between the face in the ROI and the master; raises ValueError without a face.
+    With a face locator only its crop is embedded, otherwise every face DeepFace finds in the ROI.
+    """
+    locator = get_face_locator()
+    if locator is not None:
+        face = locate_face(person_roi_bgr, locator)
+        if face is None:
+            raise ValueError("No face in the person ROI.")
+        probe = _embeddings_of(face, pre_cropped=True)
+    else:
+        probe = _embeddings_of(person_roi_bgr)
+    return float((1.0 - probe @ get_master_embeddings(known_face_img_path).T).min())
+
 def load_yolo_model_and_check_known_face():
-    print("Loading YOLO model...")
     try:
-        yolo_model = YOLO(YOLO_MODEL_PATH)
+        # Shared with MainAgent.tools; only the first call (or the first after an idle unload) loads weights.
+        yolo_model = get_yolo_model(YOLO_MODEL_PATH)
     except Exception as e:
         print(f"Error loading YOLO model: {e}")
         return None
-    print("YOLO model loaded.")
 
     print(f"Checking known face image path: {KNOWN_FACE_IMAGE_PATH}")
     if not os.path.exists(KNOWN_FACE_IMAGE_PATH):
         print(f"Error: Known face image file not found at '{KNOWN_FACE_IMAGE_PATH}'. Please update the path.")
         return None
     print("Known face image path is valid.")
+    try:
+        get_master_embeddings(KNOWN_FACE_IMAGE_PATH)
+    except Exception as e:
+        print(f"Error embedding the known face image: {e}")
+        return None
     return yolo_model
 
 def detect_persons_yolo(frame, yolo_model):
     person_boxes_coords = []
     annotated_frame_by_yolo = frame.copy()
 
-    yolo_results_list = yolo_model.predict(frame, classes=[PERSON_CLASS_ID], verbose=False, conf=YOLO_CONFIDENCE_THRESHOLD)
+    yolo_results_list = yolo_model.predict(frame, imgsz=YOLO_DEFAULT_IMGSZ, classes=[PERSON_CLASS_ID], verbose=False, conf=YOLO_CONFIDENCE_THRESHOLD)
 
     if yolo_results_list:
         res = yolo_results_list[0]
@@ -50,19 +250,49 @@ def detect_persons_yolo(frame, yolo_model):
             person_boxes_coords.append(list(map(int, box_data.xyxy[0].tolist())))
     return person_boxes_coords, annotated_frame_by_yolo
 
-def verify_if_me_with_deepface(person_roi_bgr, known_face_img_path):
+def match_master(person_roi_bgr, known_face_img_path=KNOWN_FACE_IMAGE_PATH):
+    """True if the face in the ROI is the master, False if it is someone else, None when no face is visible."""
     if person_roi_bgr.size == 0:
-        return False
+        return None
     try:
-        result = DeepFace.verify(img1_path=known_face_img_path,
-                                 img2_path=person_roi_bgr,
-                                 model_name=DEEPFACE_MODEL_NAME,
-                                 distance_metric=DEEPFACE_DISTANCE_METRIC,
-                                 enforce_detection=True,
-                                 detector_backend='opencv')
-        return result['verified']
-    except ValueError as ve:
-        return False
+        return master_distance(person_roi_bgr, known_face_img_path) <= face_match_threshold()
+    except ValueError:
+        return None
     except Exception as e:
         print(f"Error during DeepFace verification: {e}")
-        return False
\ No newline at end of file
+        return None
+
+def verify_if_me_with_deepface(person_roi_bgr, known_face_img_path):
+    return match_master(person_roi_bgr, known_face_img_path) is True
+
+
+def evaluate_frame(frame, yolo_model, require_single_person=False, tracker=None):
+    """
+    Persons YOLO finds in `frame` and which of them DeepFace verifies as the master.
+    `online` is the activation rule: exactly one person in view, and it is the master.
+    With `require_single_person`, frames that cannot satisfy it skip DeepFace altogether.
+    With a `PersonTracker`, a person keeps the verdict of their track until the tracker asks
+    for it again (see `identify_master`); `verifications` counts the DeepFace calls this frame made.
+    """
+    all_detected_person_boxes, annotated_frame = detect_persons_yolo(frame, yolo_model)
+    h_frame, w_frame = frame.shape[:2]
+
+    def verify(i):
+        x1, y1, x2, y2 = all_detected_person_boxes[i]
+        x1_c, y1_c = max(0, x1), max(0, y1)
+        x2_c, y2_c = min(w_frame, x2), min(h_frame, y2)
+        if x1_c >= x2_c or y1_c >= y2_c:
+            return None
+        return match_master(frame[y1_c:y2_c, x1_c:x2_c], KNOWN_FACE_IMAGE_PATH)
+
+    verify_boxes = not require_single_person or len(all_detected_person_boxes) == 1
+    master_indices, verifications = identify_master(all_detected_person_boxes, verify, tracker, verify_boxes)
+    my_recognized_boxes_coords = [tuple(all_detected_person_boxes[i]) for i in master_indices]
+
+    return {
+        "persons": len(all_detected_person_boxes),
+        "master_boxes": my_recognized_boxes_coords,
+        "online": len(all_detected_person_boxes) == 1 and len(my_recognized_boxes_coords) == 1,
+        "verifications": verifications,
+        "annotated_frame": annotated_frame,
+    }
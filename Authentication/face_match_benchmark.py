@@ -0,0 +1,126 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import cv2
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Authentication import face_detector
+from Authentication.face_detector import (DEEPFACE_DISTANCE_METRIC, DEEPFACE_MODEL_NAME, KNOWN_FACE_IMAGE_PATH,
+                                          YOLO_MODEL_PATH, detect_persons_yolo, get_master_embeddings,
+                                          master_embedding_cache_path, verify_if_me_with_deepface)
+from utils.model_registry import get_yolo_model
+
+
+def collect_rois(video_path: str, max_frames: int, use_yolo: bool) -> Dict[str, Any]:
+    """Decodes the recording once and crops the person boxes, so both matchers see identical inputs."""
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        sys.exit(f"Could not open video {video_path}.")
+    yolo_model = get_yolo_model(YOLO_MODEL_PATH) if use_yolo else None
+    frames: List[List[Any]] = []
+    detect_s = 0.0
+    while len(frames) < max_frames:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        if yolo_model is None:
+            frames.append([frame])
+            continue
+        start = time.perf_counter()
+        boxes, _ = detect_persons_yolo(frame, yolo_model)
+        detect_s += time.perf_counter() - start
+        h, w = frame.shape[:2]
+        rois = [frame[max(0, y1):min(h, y2), max(0, x1):min(w, x2)] for x1, y1, x2, y2 in boxes]
+        frames.append([roi for roi in rois if roi.size])
+    cap.release()
+    return {"frames": frames, "detect_s": detect_s}
+
+
+def verify_per_call(person_roi_bgr, known_face_img_path: str) -> bool:
+    """The previous matcher: DeepFace.verify re-reads and re-embeds the master image on every call."""
+    if person_roi_bgr.size == 0:
+        return False
+    try:
+        result = face_detector.DeepFace.verify(img1_path=known_face_img_path, img2_path=person_roi_bgr,
+                                               model_name=DEEPFACE_MODEL_NAME, distance_metric=DEEPFACE_DISTANCE_METRIC,
+                                               enforce_detection=True, detector_backend='opencv')
+        return result['verified']
+    except ValueError:
+        return False
+
+
+def run_matcher(name: str, matcher: Callable[[Any, str], bool], frames: List[List[Any]], detect_s: float,
+                known_face: str) -> Dict[str, Any]:
+    call_ms: List[float] = []
+    verdicts: List[bool] = []
+    start = time.perf_counter()
+    for rois in frames:
+        for roi in rois:
+            t0 = time.perf_counter()
+            verdicts.append(bool(matcher(roi, known_face)))
+            call_ms.append((time.perf_counter() - t0) * 1000)
+    match_s = time.perf_counter() - start
+    return {
+        "matcher": name, "frames": len(frames), "rois": len(call_ms), "matches": sum(verdicts),
+        "match_s": round(match_s, 3),
+        "fps": round(len(frames) / (match_s + detect_s), 2) if frames and match_s + detect_s > 0 else None,
+        "match_only_fps": round(len(frames) / match_s, 2) if frames and match_s > 0 else None,
+        "call_ms_p50": round(statistics.median(call_ms), 1) if call_ms else None,
+        "call_ms_max": round(max(call_ms), 1) if call_ms else None,
+        "verdicts": verdicts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Frames per second of master-face matching, per-call DeepFace.verify vs. the cached embedding.")
+    parser.add_argument("video", help="Recorded video to replay (e.g. a webcam capture of the master and others).")
+    parser.add_argument("--known-face", default=KNOWN_FACE_IMAGE_PATH)
+    parser.add_argument("--frames", type=int, default=100, help="Frames to replay from the start of the video.")
+    parser.add_argument("--no-yolo", action="store_true", help="Match the whole frame instead of YOLO person crops.")
+    parser.add_argument("--cold", action="store_true", help="Delete the persisted .npy first to time the one-off embedding.")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.known_face):
+        sys.exit(f"Known face image not found: {args.known_face}")
+    collected = collect_rois(args.video, args.frames, use_yolo=not args.no_yolo)
+    frames, detect_s = collected["frames"], collected["detect_s"]
+    print(f"{len(frames)} frames, {sum(len(r) for r in frames)} person crops, YOLO {detect_s:.2f}s total.")
+
+    before = run_matcher("deepface.verify per call", verify_per_call, frames, detect_s, args.known_face)
+
+    cache_path = master_embedding_cache_path(args.known_face)
+    if args.cold and os.path.exists(cache_path):
+        os.remove(cache_path)
+    face_detector._master_embeddings.clear()
+    t0 = time.perf_counter()
+    get_master_embeddings(args.known_face)
+    startup_ms = (time.perf_counter() - t0) * 1000
+    after = run_matcher("cached embedding", verify_if_me_with_deepface, frames, detect_s, args.known_face)
+    after["embedding_startup_ms"] = round(startup_ms, 1)
+
+    agreement = sum(a == b for a, b in zip(before["verdicts"], after["verdicts"]))
+    print(f"\n{'matcher':<26} {'fps':>7} {'match fps':>10} {'p50 ms':>8} {'max ms':>8} {'matches':>8}")
+    for row in (before, after):
+        print(f"{row['matcher']:<26} {str(row['fps']):>7} {str(row['match_only_fps']):>10} "
+              f"{str(row['call_ms_p50']):>8} {str(row['call_ms_max']):>8} {row['matches']:>8}")
+    print(f"\nMaster embedding ready in {startup_ms:.0f} ms ({'computed' if args.cold else 'from cache if present'}).")
+    if before["rois"]:
+        print(f"Verdict agreement: {agreement}/{before['rois']} crops.")
+    if before["fps"] and after["fps"]:
+        print(f"Speed-up: {after['fps'] / before['fps']:.2f}x end-to-end, "
+              f"{(after['match_only_fps'] or 0) / (before['match_only_fps'] or 1):.2f}x matching only.")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"before": before, "after": after, "agreement": agreement, "detect_s": detect_s}, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,10 @@
-from ultralytics import YOLO
 from deepface import DeepFace
 import cv2
 import numpy as np
 import os
 import pyttsx3
-from .face_detector import load_yolo_model_and_check_known_face,detect_persons_yolo,verify_if_me_with_deepface
+from .face_detector import load_yolo_model_and_check_known_face,evaluate_frame
+from .person_tracker import PersonTracker
 
 YOLO_MODEL_PATH = "yolov8n.pt"
 KNOWN_FACE_IMAGE_PATH = "C:/Users/Debajyoti/OneDrive/Desktop/Jarves full agent/Authentication/master_image.jpg"
@@ -55,6 +55,7 @@ def run_jarvis_vision_deepface():
     print(f"Starting Jarvis visual detection with DeepFace ({DEEPFACE_MODEL_NAME})... Max attempts: {MAX_DETECTION_ATTEMPTS}. Press 'q' to quit early.")
 
     attempt_count = 0
+    tracker = PersonTracker()
 
     while attempt_count < MAX_DETECTION_ATTEMPTS:
         ret, frame = cap.read()
@@ -65,26 +66,12 @@ def run_jarvis_vision_deepface():
 
         attempt_count += 1
 
-        all_detected_person_boxes, annotated_frame = detect_persons_yolo(frame, yolo_model)
-        num_total_persons_detected = len(all_detected_person_boxes)
-        num_persons_recognized_as_me = 0
-        my_recognized_boxes_coords = []
-
-        if num_total_persons_detected > 0:
-            for (x1, y1, x2, y2) in all_detected_person_boxes:
-                h_frame, w_frame = frame.shape[:2]
-                x1_c, y1_c = max(0, x1), max(0, y1)
-                x2_c, y2_c = min(w_frame, x2), min(h_frame, y2)
-
-                if x1_c >= x2_c or y1_c >= y2_c:
-                    continue
-                person_roi_bgr = frame[y1_c:y2_c, x1_c:x2_c]
-
-                if verify_if_me_with_deepface(person_roi_bgr, KNOWN_FACE_IMAGE_PATH):
-                    num_persons_recognized_as_me += 1
-                    my_recognized_boxes_coords.append((x1, y1, x2, y2))
-
-        jarvis_is_online_for_me = (num_total_persons_detected == 1 and num_persons_recognized_as_me == 1)
+        evaluation = evaluate_frame(frame, yolo_model, tracker=tracker)
+        annotated_frame = evaluation["annotated_frame"]
+        num_total_persons_detected = evaluation["persons"]
+        my_recognized_boxes_coords = evaluation["master_boxes"]
+        num_persons_recognized_as_me = len(my_recognized_boxes_coords)
+        jarvis_is_online_for_me = evaluation["online"]
 
         if jarvis_is_online_for_me:
             speak("Hello Master, Jarvis is online.")
@@ -134,6 +121,9 @@ def run_jarvis_vision_deepface():
         print("Max detection attempts reached. Master not detected under required conditions.")
         speak("Visual detection timed out. Master not confirmed.")
 
+    print(f"DeepFace verifications: {tracker.stats['verifications']} for {tracker.stats['boxes']} person boxes "
+          f"({tracker.stats['cached']} from cached track verdicts, {tracker.stats['no_face']} without a visible face, "
+          f"{tracker.stats['tracks']} tracks).")
     print("Jarvis visual detection routine finished.")
     return False
 
@@ -0,0 +1,146 @@
+import itertools
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Minimum IoU for a new box to continue an existing track.
+TRACK_MATCH_IOU = float(os.getenv("JARVIS_TRACK_MATCH_IOU", "0.3"))
+# A tracked box whose IoU with the box it was verified on drops below this is verified again.
+TRACK_REVERIFY_IOU = float(os.getenv("JARVIS_TRACK_REVERIFY_IOU", "0.6"))
+# Seconds a cached identity verdict is trusted.
+TRACK_VERDICT_TTL_S = float(os.getenv("JARVIS_TRACK_VERDICT_TTL", "3"))
+# Frames a track survives without a matching box before it is dropped.
+TRACK_MAX_MISSED = int(os.getenv("JARVIS_TRACK_MAX_MISSED", "5"))
+
+
+def box_iou(a: Sequence[float], b: Sequence[float]) -> float:
+    ix1, iy1 = max(a[0], b[0]), max(a[1], b[1])
+    ix2, iy2 = min(a[2], b[2]), min(a[3], b[3])
+    inter = max(0.0, ix2 - ix1) * max(0.0, iy2 - iy1)
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union > 0 else 0.0
+
+
+def _centroid_distance(a: Sequence[float], b: Sequence[float]) -> float:
+    return (((a[0] + a[2]) - (b[0] + b[2])) ** 2 + ((a[1] + a[3]) - (b[1] + b[3])) ** 2) ** 0.5 / 2.0
+
+
+class PersonTracker:
+    """
+    Associates person boxes across frames (greedy IoU, falling back to centroid distance for
+    fast movement) and caches an identity verdict per track. `update()` marks a track for
+    verification when it is new, was missing from any frame since its last update (someone else
+    may have stepped into the spot), its box has moved away from the box it was verified on,
+    or its verdict is older than `verdict_ttl_s`; `record()` stores the result.
+    """
+
+    def __init__(self, match_iou: float = TRACK_MATCH_IOU, reverify_iou: float = TRACK_REVERIFY_IOU,
+                 verdict_ttl_s: float = TRACK_VERDICT_TTL_S, max_missed: int = TRACK_MAX_MISSED,
+                 clock: Callable[[], float] = time.monotonic):
+        self.match_iou = match_iou
+        self.reverify_iou = reverify_iou
+        self.verdict_ttl_s = verdict_ttl_s
+        self.max_missed = max_missed
+        self.clock = clock
+        self.tracks: Dict[int, Dict[str, Any]] = {}
+        self.stats = {"boxes": 0, "verifications": 0, "cached": 0, "no_face": 0, "tracks": 0}
+        self._ids = itertools.count(1)
+
+    def _associate(self, boxes: List[Sequence[float]]) -> Dict[int, int]:
+        """Box index -> track id, best IoU pairs first."""
+        pairs = sorted(((box_iou(track["box"], box), track_id, i)
+                        for track_id, track in self.tracks.items() for i, box in enumerate(boxes)), reverse=True)
+        assigned: Dict[int, int] = {}
+        used = set()
+        for iou, track_id, i in pairs:
+            if iou < self.match_iou:
+                break
+            if i not in assigned and track_id not in used:
+                assigned[i] = track_id
+                used.add(track_id)
+        for i, box in enumerate(boxes):
+            if i in assigned:
+                continue
+            size = max(box[2] - box[0], box[3] - box[1])
+            candidates = [(_centroid_distance(track["box"], box), track_id) for track_id, track in self.tracks.items()
+                          if track_id not in used]
+            if candidates:
+                distance, track_id = min(candidates)
+                if distance < 0.5 * size:
+                    assigned[i] = track_id
+                    used.add(track_id)
+        return assigned
+
+    def update(self, boxes: Sequence[Sequence[float]]) -> List[Dict[str, Any]]:
+        """One track per box, in the order of `boxes`, each with `needs_verification` and the cached `verdict`."""
+        boxes = [tuple(box) for box in boxes]
+        now = self.clock()
+        assigned = self._associate(boxes)
+        matched = set(assigned.values())
+        for track_id in list(self.tracks):
+            if track_id not in matched:
+                self.tracks[track_id]["missed"] += 1
+                if self.tracks[track_id]["missed"] > self.max_missed:
+                    del self.tracks[track_id]
+        result = []
+        for i, box in enumerate(boxes):
+            track_id = assigned.get(i)
+            if track_id is None:
+                track_id = next(self._ids)
+                self.tracks[track_id] = {"id": track_id, "verdict": None, "verified_at": 0.0, "verified_box": None}
+                self.stats["tracks"] += 1
+            track = self.tracks[track_id]
+            was_missing = track.get("missed", 0) > 0
+            track["box"] = box
+            track["missed"] = 0
+            track["needs_verification"] = (track["verdict"] is None
+                                           or was_missing
+                                           or now - track["verified_at"] > self.verdict_ttl_s
+                                           or box_iou(box, track["verified_box"]) < self.reverify_iou)
+            self.stats["boxes"] += 1
+            result.append(track)
+        return result
+
+    def record(self, track: Dict[str, Any], verdict: bool):
+        track["verdict"] = bool(verdict)
+        track["verified_at"] = self.clock()
+        track["verified_box"] = track["box"]
+        track["needs_verification"] = False
+        self.stats["verifications"] += 1
+
+    def reset(self):
+        self.tracks.clear()
+
+
+def identify_master(boxes: Sequence[Sequence[float]], verify: Callable[[int], Optional[bool]],
+                    tracker: Optional[PersonTracker] = None, verify_boxes: bool = True) -> Tuple[List[int], int]:
+    """
+    Indices of `boxes` that are the master, and how many verifications ran.
+    `verify(i)` checks box i and returns True/False, or None when it cannot tell (no face visible);
+    an undecided track stays unverified instead of caching "not the master".
+    With a tracker, cached verdicts are reused, except a positive one for the only person in view:
+    that frame can activate Jarvis, so it is always verified afresh. `verify_boxes=False` only
+    reuses cached verdicts.
+    """
+    tracks = tracker.update(boxes) if tracker is not None else [None] * len(boxes)
+    masters: List[int] = []
+    verifications = 0
+    for i, track in enumerate(tracks):
+        if track is not None and not track["needs_verification"] and not (track["verdict"] and len(boxes) == 1):
+            tracker.stats["cached"] += 1
+            if track["verdict"]:
+                masters.append(i)
+            continue
+        if not verify_boxes:
+            continue
+        verdict = verify(i)
+        if verdict is None:
+            if tracker is not None:
+                tracker.stats["no_face"] += 1
+            continue
+        verifications += 1
+        if track is not None:
+            tracker.record(track, verdict)
+        if verdict:
+            masters.append(i)
+    return masters, verifications
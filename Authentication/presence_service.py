@@ -0,0 +1,200 @@
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from utils.resource_locks import resource_lock
+
+logger = logging.getLogger("PresenceService")
+
+PRESENCE_ENABLED = os.getenv("JARVIS_PRESENCE", "true").lower() in ("1", "true", "yes")
+PRESENCE_CAMERA_INDEX = int(os.getenv("JARVIS_PRESENCE_CAMERA", "0"))
+# Frames checked per second at most; the CPU budget below may stretch the interval further.
+PRESENCE_FPS = float(os.getenv("JARVIS_PRESENCE_FPS", "0.5"))
+# Share of one core the checks may use on average (0.15 = 15%).
+PRESENCE_CPU_BUDGET = float(os.getenv("JARVIS_PRESENCE_CPU_BUDGET", "0.15"))
+# Seconds after an activation before the master can activate Jarvis visually again.
+PRESENCE_COOLDOWN_S = float(os.getenv("JARVIS_PRESENCE_COOLDOWN", "60"))
+# Consecutive positive frames needed before activating.
+PRESENCE_CONFIRM_FRAMES = int(os.getenv("JARVIS_PRESENCE_CONFIRM_FRAMES", "1"))
+# The camera is closed between checks that are further apart than this (seconds).
+PRESENCE_KEEP_OPEN_S = float(os.getenv("JARVIS_PRESENCE_KEEP_OPEN", "5"))
+
+
+def _master_checker() -> Callable[[Any], Dict[str, Any]]:
+    """YOLO + DeepFace master check from face_detector; loaded on the service thread so startup never waits on it."""
+    from .face_detector import evaluate_frame, load_yolo_model_and_check_known_face
+    yolo_model = load_yolo_model_and_check_known_face()
+    if yolo_model is None:
+        raise RuntimeError("YOLO model or the known face image is unavailable.")
+    return lambda frame: evaluate_frame(frame, yolo_model, require_single_person=True)
+
+
+class PresenceService:
+    """
+    Watches the camera at a low duty cycle on a background thread and sets `activated` when the
+    master is in view. The wake loop waits on this event together with the microphone instead of
+    blocking on a visual check.
+
+    - At most `fps` frames per second; after each check the next one is pushed back so the checks
+      average at most `cpu_budget` of one core.
+    - The camera is only open while running and not paused, and only when no tool holds the
+      "camera" resource lock. `pause()` releases it (e.g. while a command runs); so does a check
+      interval longer than PRESENCE_KEEP_OPEN_S.
+    - After an activation nothing is checked for `cooldown_s`.
+    """
+
+    def __init__(self, checker_factory: Callable[[], Callable[[Any], Dict[str, Any]]] = _master_checker,
+                 camera_index: int = PRESENCE_CAMERA_INDEX, fps: float = PRESENCE_FPS,
+                 cpu_budget: float = PRESENCE_CPU_BUDGET, cooldown_s: float = PRESENCE_COOLDOWN_S,
+                 confirm_frames: int = PRESENCE_CONFIRM_FRAMES, capture_factory: Optional[Callable[[int], Any]] = None):
+        self.checker_factory = checker_factory
+        self.camera_index = camera_index
+        self.fps = fps
+        self.cpu_budget = cpu_budget
+        self.cooldown_s = cooldown_s
+        self.confirm_frames = max(1, confirm_frames)
+        self.capture_factory = capture_factory
+        self.activated = threading.Event()
+        self.last_detection: Optional[Dict[str, Any]] = None
+        self.stats = {"frames": 0, "checks": 0, "activations": 0, "camera_busy": 0, "check_cpu_s": 0.0, "errors": 0}
+        self._running = threading.Event()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._cooldown_until = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._cap = None
+        self._camera_lock = resource_lock("camera")
+        self._holds_camera = False
+
+    @property
+    def alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "PresenceService":
+        if not self.alive:
+            self._stop.clear()
+            self._running.set()
+            self._thread = threading.Thread(target=self._run, name="JarvisPresence", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def pause(self):
+        """Stops checking and releases the camera until `resume()`."""
+        self._running.clear()
+        self._wake.set()
+
+    def resume(self):
+        self._running.set()
+        self._wake.set()
+
+    def consume(self) -> Optional[Dict[str, Any]]:
+        """The pending activation, if any; clears `activated` and starts the cooldown."""
+        if not self.activated.is_set():
+            return None
+        self.activated.clear()
+        self._cooldown_until = time.monotonic() + self.cooldown_s
+        return self.last_detection
+
+    def _open_camera(self) -> bool:
+        if self._cap is not None:
+            return True
+        if not self._camera_lock.acquire(blocking=False):
+            self.stats["camera_busy"] += 1
+            return False
+        self._holds_camera = True
+        if self.capture_factory is not None:
+            cap = self.capture_factory(self.camera_index)
+        else:
+            import cv2
+            cap = cv2.VideoCapture(self.camera_index)
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        if not cap.isOpened():
+            cap.release()
+            self._release_camera()
+            raise IOError(f"Could not open camera index {self.camera_index}.")
+        self._cap = cap
+        return True
+
+    def _release_camera(self):
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+        if self._holds_camera:
+            self._holds_camera = False
+            self._camera_lock.release()
+
+    def _sleep(self, seconds: float):
+        self._wake.wait(max(0.0, seconds))
+        self._wake.clear()
+
+    def _run(self):
+        try:
+            check = self.checker_factory()
+        except Exception as e:
+            logger.error(f"Presence detection unavailable: {e}")
+            return
+        logger.info(f"Presence detection running: up to {self.fps} fps, {self.cpu_budget:.0%} CPU budget, "
+                    f"{self.cooldown_s}s cooldown.")
+        positives = 0
+        try:
+            while not self._stop.is_set():
+                now = time.monotonic()
+                if not self._running.is_set() or self.activated.is_set() or now < self._cooldown_until:
+                    self._release_camera()
+                    positives = 0
+                    self._sleep(min(1.0, max(0.05, self._cooldown_until - now)) if self._running.is_set() else 1.0)
+                    continue
+                try:
+                    if not self._open_camera():
+                        self._sleep(1.0 / self.fps)
+                        continue
+                except IOError as e:
+                    self.stats["errors"] += 1
+                    logger.warning(f"{e} Retrying in 10s.")
+                    self._sleep(10.0)
+                    continue
+                # Drop the frame the driver buffered since the last check; it may be seconds old.
+                self._cap.grab()
+                ok, frame = self._cap.read()
+                if not ok:
+                    self.stats["errors"] += 1
+                    self._release_camera()
+                    self._sleep(1.0)
+                    continue
+                self.stats["frames"] += 1
+                started, cpu_start = time.monotonic(), time.process_time()
+                try:
+                    verdict = check(frame)
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    logger.warning(f"Presence check failed: {e}")
+                    verdict = {"online": False}
+                cpu_s = time.process_time() - cpu_start
+                self.stats["checks"] += 1
+                self.stats["check_cpu_s"] += cpu_s
+                positives = positives + 1 if verdict.get("online") else 0
+                if positives >= self.confirm_frames:
+                    positives = 0
+                    self.last_detection = {"at": time.monotonic(), "persons": verdict.get("persons"),
+                                           "master_boxes": verdict.get("master_boxes")}
+                    self.stats["activations"] += 1
+                    self._release_camera()
+                    logger.info("Master detected by the presence service.")
+                    self.activated.set()
+                    continue
+                interval = max(1.0 / self.fps, cpu_s / self.cpu_budget if self.cpu_budget > 0 else 0.0)
+                if interval > PRESENCE_KEEP_OPEN_S:
+                    self._release_camera()
+                self._sleep(interval - (time.monotonic() - started))
+        except Exception as e:
+            logger.error(f"Presence service stopped: {e}", exc_info=True)
+        finally:
+            self._release_camera()
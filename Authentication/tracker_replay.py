@@ -0,0 +1,187 @@
+import argparse
+import json
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from person_tracker import PersonTracker, identify_master
+
+FPS = 30.0
+# (person id, is_master, box, face visible) for every person in view, per frame.
+Person = Tuple[str, bool, Tuple[int, int, int, int], bool]
+Scene = List[List[Person]]
+# Scenes where a stranger replaces the master in the same box within a single frame. No tracker
+# can tell those apart, so the stale "master" label left on the stranger is reported but
+# tolerated; activation never trusts a cached positive, so it cannot let the stranger in.
+INSTANT_SWAP_SCENES = ("swap_gap_0",)
+
+
+def _jitter(frame: int, amplitude: int = 3) -> int:
+    return (frame * 7) % (2 * amplitude + 1) - amplitude
+
+
+def _standing(frame: int, x: int) -> Tuple[int, int, int, int]:
+    return (x + _jitter(frame), 80, x + 200 + _jitter(frame), 470)
+
+
+BYSTANDER_X = 420
+
+
+def scene_strangers_waiting(frames: int) -> Scene:
+    """Two strangers stand in view; Jarvis must never activate."""
+    return [[("a", False, _standing(f, 20), True), ("b", False, _standing(f, BYSTANDER_X), True)] for f in range(frames)]
+
+
+def scene_walker_then_master(frames: int) -> Scene:
+    """The master stands still while a stranger walks across the room and leaves."""
+    scene = []
+    for f in range(frames):
+        people = [("master", True, _standing(f, 20), True)]
+        x = 250 + 5 * f
+        if x < 640:
+            people.append(("walker", False, (x, 90, x + 150, 460), True))
+        scene.append(people)
+    return scene
+
+
+def scene_master_looks_away(frames: int) -> Scene:
+    """The master's face is hidden at times, including when the bystander leaves."""
+    scene = []
+    for f in range(frames):
+        face_visible = not (f < 30 or 60 <= f < 70)
+        people = [("master", True, _standing(f, 20), face_visible)]
+        if f < 60:
+            people.append(("bystander", False, _standing(f, BYSTANDER_X), True))
+        scene.append(people)
+    return scene
+
+
+def scene_stranger_leans_in(frames: int) -> Scene:
+    """A lone stranger steps towards the camera, so the box grows well past the one that was verified."""
+    scene = []
+    for f in range(frames):
+        grow = min(f, 90) * 2
+        scene.append([("stranger", False, (220 - grow, 100 - grow // 2, 420 + grow, 470), True)])
+    return scene
+
+
+def scene_swap(gap: int) -> Callable[[int], Scene]:
+    """With a bystander in view, the master leaves and a stranger takes the same spot `gap` frames later; then the bystander leaves."""
+    def build(frames: int) -> Scene:
+        scene = []
+        for f in range(frames):
+            people: List[Person] = []
+            if f < frames * 2 // 5:
+                people.append(("master", True, _standing(f, 20), True))
+            elif f >= frames * 2 // 5 + gap:
+                people.append(("stranger", False, _standing(f + 1, 24), True))
+            if f < frames * 4 // 5:
+                people.append(("bystander", False, _standing(f, BYSTANDER_X), True))
+            scene.append(people)
+        return scene
+    return build
+
+
+SCENES: Dict[str, Callable[[int], Scene]] = {
+    "strangers_waiting": scene_strangers_waiting,
+    "walker_then_master": scene_walker_then_master,
+    "master_looks_away": scene_master_looks_away,
+    "stranger_leans_in": scene_stranger_leans_in,
+    "swap_gap_0": scene_swap(0),
+    "swap_gap_1": scene_swap(1),
+    "swap_gap_2": scene_swap(2),
+    "swap_gap_5": scene_swap(5),
+}
+
+
+def expected_activation(scene: Scene) -> Optional[int]:
+    """First frame where the master is alone in view with the face visible."""
+    for index, people in enumerate(scene):
+        if len(people) == 1 and people[0][1] and people[0][3]:
+            return index
+    return None
+
+
+def replay(scene: Scene) -> Dict[str, Any]:
+    """
+    Runs the frames through identify_master with a tracker on a simulated clock, like
+    run_jarvis_vision_deepface: the replay stops at the first activation. A verification returns
+    the ground truth of the person at that box (None when the face is hidden), so every wrong
+    verdict comes from a stale or swapped track.
+    """
+    now = [0.0]
+    tracker = PersonTracker(clock=lambda: now[0])
+    stale_frames = 0
+    activated_at = None
+    for index, people in enumerate(scene):
+        now[0] = index / FPS
+        boxes = [box for _, _, box, _ in people]
+        masters, _ = identify_master(boxes, lambda i: people[i][1] if people[i][3] else None, tracker)
+        stale_frames += any((i in masters) != person[1] for i, person in enumerate(people) if person[3] or i in masters)
+        if len(people) == 1 and masters == [0]:
+            activated_at = index
+            break
+    boxes_seen = tracker.stats["boxes"]
+    verifications = tracker.stats["verifications"]
+    return {
+        "frames": len(scene), "person_boxes": boxes_seen, "verifications": verifications,
+        "tracks": tracker.stats["tracks"], "stale_frames": stale_frames,
+        "activated_at": activated_at, "expected_activation": expected_activation(scene),
+        "reduction": round(boxes_seen / verifications, 1) if verifications else None,
+    }
+
+
+def replay_recorded(path: str) -> Dict[str, Any]:
+    """Counts the verifications for recorded detect_persons_yolo boxes (one JSON list of boxes per line)."""
+    now = [0.0]
+    tracker = PersonTracker(clock=lambda: now[0])
+    frames = 0
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            now[0] = frames / FPS
+            identify_master(json.loads(line), lambda i: False, tracker)
+            frames += 1
+    boxes, verifications = tracker.stats["boxes"], tracker.stats["verifications"]
+    return {"frames": frames, "person_boxes": boxes, "verifications": verifications, "tracks": tracker.stats["tracks"],
+            "reduction": round(boxes / verifications, 1) if verifications else None}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replays person boxes through PersonTracker and counts the DeepFace verifications it would request.")
+    parser.add_argument("--frames", type=int, default=150, help="Frames per synthetic scene (MAX_DETECTION_ATTEMPTS is 150).")
+    parser.add_argument("--boxes", help="JSONL of recorded boxes, one list of [x1, y1, x2, y2] per frame, instead of the synthetic scenes.")
+    parser.add_argument("--min-reduction", type=float, default=10.0, help="Fail when person boxes per verification falls below this.")
+    args = parser.parse_args()
+
+    if args.boxes:
+        print(json.dumps(replay_recorded(args.boxes), indent=2))
+        return
+
+    failures = []
+    total_boxes = total_verifications = 0
+    print(f"{'scene':<20} {'frames':>6} {'boxes':>6} {'verifies':>9} {'stale':>6} {'activated':>10} {'expected':>9} {'x fewer':>8}")
+    for name, build in SCENES.items():
+        result = replay(build(args.frames))
+        total_boxes += result["person_boxes"]
+        total_verifications += result["verifications"]
+        print(f"{name:<20} {result['frames']:>6} {result['person_boxes']:>6} {result['verifications']:>9} "
+              f"{result['stale_frames']:>6} {str(result['activated_at']):>10} {str(result['expected_activation']):>9} "
+              f"{str(result['reduction']):>8}")
+        if result["activated_at"] != result["expected_activation"]:
+            failures.append(f"{name}: activated at frame {result['activated_at']}, expected {result['expected_activation']}")
+        if result["stale_frames"] and name not in INSTANT_SWAP_SCENES:
+            failures.append(f"{name}: {result['stale_frames']} frame(s) with a wrong cached verdict")
+    reduction = total_boxes / total_verifications if total_verifications else float("inf")
+    print(f"\nDeepFace verifications: {total_verifications} for {total_boxes} person boxes ({reduction:.1f}x fewer).")
+    if reduction < args.min_reduction:
+        failures.append(f"only {reduction:.1f}x fewer verifications (expected at least {args.min_reduction}x)")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
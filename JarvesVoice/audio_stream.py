@@ -0,0 +1,287 @@
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import speech_recognition as sr
+
+logger = logging.getLogger("JarvisAudioStream")
+
+# "auto" uses webrtcvad when it is installed and the mic rate allows it, otherwise the energy detector.
+VAD_MODE = os.getenv("JARVIS_VAD", "auto").lower()
+VAD_AGGRESSIVENESS = int(os.getenv("JARVIS_VAD_AGGRESSIVENESS", "2"))
+PRE_ROLL_S = float(os.getenv("JARVIS_MIC_PRE_ROLL", "0.5"))
+RING_SECONDS = float(os.getenv("JARVIS_MIC_RING_SECONDS", "10"))
+MAX_PHRASE_S = float(os.getenv("JARVIS_MIC_MAX_PHRASE", "15"))
+MIN_SPEECH_S = float(os.getenv("JARVIS_MIC_MIN_SPEECH", "0.2"))
+MAX_PENDING_UTTERANCES = int(os.getenv("JARVIS_MIC_MAX_PENDING", "8"))
+
+_tts_lock = threading.Lock()
+_tts_active = 0
+
+
+@contextmanager
+def tts_playing() -> Iterator[None]:
+    """Marks Jarvis's own speech; the stream neither segments nor publishes audio while it plays."""
+    global _tts_active
+    with _tts_lock:
+        _tts_active += 1
+    try:
+        yield
+    finally:
+        with _tts_lock:
+            _tts_active -= 1
+
+
+def tts_is_playing() -> bool:
+    return _tts_active > 0
+
+
+class _EnergyVAD:
+    """Chunk RMS against a threshold that follows the noise floor (like speech_recognition's dynamic threshold)."""
+
+    def __init__(self, energy_threshold: float, dynamic: bool = True, ratio: float = 1.5, damping: float = 0.15):
+        self.threshold = energy_threshold
+        self.dynamic = dynamic
+        self.ratio = ratio
+        self.damping = damping
+
+    def is_speech(self, samples: np.ndarray, seconds: float) -> bool:
+        rms = float(np.sqrt(np.mean(samples.astype(np.float32) ** 2))) if len(samples) else 0.0
+        speech = rms > self.threshold
+        if not speech and self.dynamic:
+            damping = self.damping ** seconds
+            self.threshold = self.threshold * damping + rms * self.ratio * (1 - damping)
+        return speech
+
+
+class _WebRtcVAD:
+    """webrtcvad on 30 ms frames; a chunk is speech when most of its frames are."""
+
+    def __init__(self, sample_rate: int, aggressiveness: int = VAD_AGGRESSIVENESS):
+        import webrtcvad
+        self._vad = webrtcvad.Vad(aggressiveness)
+        self._frame = int(sample_rate * 0.03)
+        self._rate = sample_rate
+
+    def is_speech(self, samples: np.ndarray, seconds: float) -> bool:
+        frames = [samples[i:i + self._frame] for i in range(0, len(samples) - self._frame + 1, self._frame)]
+        if not frames:
+            return False
+        voiced = sum(1 for f in frames if self._vad.is_speech(f.tobytes(), self._rate))
+        return voiced * 2 >= len(frames)
+
+
+def _build_vad(sample_rate: int, energy_threshold: float):
+    if VAD_MODE in ("auto", "webrtc") and sample_rate in (8000, 16000, 32000, 48000):
+        try:
+            vad = _WebRtcVAD(sample_rate)
+            logger.info(f"Using webrtcvad (aggressiveness {VAD_AGGRESSIVENESS}) at {sample_rate} Hz.")
+            return vad
+        except ImportError:
+            if VAD_MODE == "webrtc":
+                logger.warning("webrtcvad is not installed; falling back to the energy detector.")
+    return _EnergyVAD(energy_threshold)
+
+
+class MicrophoneStream:
+    """
+    Keeps the microphone open on a capture thread. Every chunk goes into a ring buffer and to the
+    raw-chunk subscribers (the wake-word spotter). A voice-activity detector cuts the stream into
+    utterances that include PRE_ROLL_S of audio before speech started; they are queued as
+    `speech_recognition.AudioData` for wake-word and command recognition.
+    """
+
+    def __init__(self, microphone: sr.Microphone, energy_threshold: float = 350, pause_threshold: float = 0.8,
+                 pre_roll_s: float = PRE_ROLL_S, max_phrase_s: float = MAX_PHRASE_S, min_speech_s: float = MIN_SPEECH_S):
+        self.microphone = microphone
+        self.energy_threshold = energy_threshold
+        self.pause_threshold = pause_threshold
+        self.pre_roll_s = pre_roll_s
+        self.max_phrase_s = max_phrase_s
+        self.min_speech_s = min_speech_s
+        self.sample_rate = 0
+        self.sample_width = 2
+        self.stats = {"chunks": 0, "utterances": 0, "dropped_utterances": 0, "discarded_short": 0}
+        self._ring: Deque[Tuple[float, bytes]] = deque()
+        self._utterances: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=MAX_PENDING_UTTERANCES)
+        self._subscribers: List["queue.Queue[bytes]"] = []
+        self._tts_subscribers: List["queue.Queue[bytes]"] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.error: Optional[BaseException] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and self._ready.is_set()
+
+    def start(self, timeout: float = 5.0) -> "MicrophoneStream":
+        """Opens the microphone on the capture thread; raises if it cannot be opened within `timeout`."""
+        if self.running:
+            return self
+        self._stop.clear()
+        self._ready.clear()
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name="JarvisMicCapture", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            self._stop.set()
+            raise RuntimeError(f"Microphone did not open: {self.error or 'timed out'}")
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+    def subscribe(self, maxsize: int = 64, during_tts: bool = False) -> "queue.Queue[bytes]":
+        """
+        Queue receiving every raw chunk from now on; the oldest chunk is dropped when it is full.
+        Chunks captured while Jarvis speaks only go to `during_tts` subscribers (barge-in detection).
+        """
+        q: "queue.Queue[bytes]" = queue.Queue(maxsize=maxsize)
+        with self._lock:
+            (self._tts_subscribers if during_tts else self._subscribers).append(q)
+        return q
+
+    def unsubscribe(self, q: "queue.Queue[bytes]"):
+        with self._lock:
+            for subscribers in (self._subscribers, self._tts_subscribers):
+                if q in subscribers:
+                    subscribers.remove(q)
+
+    def next_utterance(self, timeout: Optional[float] = None, since: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Next queued utterance ({"audio", "started_at", "ended_at", "duration_s"}, monotonic times),
+        skipping those that ended before `since`. None on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                utterance = self._utterances.get(timeout=remaining)
+            except queue.Empty:
+                return None
+            if since is None or utterance["ended_at"] >= since:
+                return utterance
+            logger.debug(f"Skipping stale utterance that ended {since - utterance['ended_at']:.1f}s before it was wanted.")
+
+    def clear_utterances(self) -> int:
+        cleared = 0
+        while True:
+            try:
+                self._utterances.get_nowait()
+                cleared += 1
+            except queue.Empty:
+                return cleared
+
+    def recent_audio(self, seconds: float) -> sr.AudioData:
+        """The last `seconds` of captured audio from the ring buffer."""
+        cutoff = time.monotonic() - seconds
+        with self._lock:
+            data = b"".join(chunk for t, chunk in self._ring if t >= cutoff)
+        return sr.AudioData(data, self.sample_rate, self.sample_width)
+
+    def _publish(self, chunk: bytes, tts_active: bool = False):
+        with self._lock:
+            subscribers = list(self._tts_subscribers) if tts_active else self._subscribers + self._tts_subscribers
+        for q in subscribers:
+            try:
+                q.put_nowait(chunk)
+            except queue.Full:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    pass
+                q.put_nowait(chunk)
+
+    def _emit(self, chunks: List[bytes], started_at: float, ended_at: float, speech_s: float):
+        if speech_s < self.min_speech_s:
+            self.stats["discarded_short"] += 1
+            return
+        audio = sr.AudioData(b"".join(chunks), self.sample_rate, self.sample_width)
+        utterance = {"audio": audio, "started_at": started_at, "ended_at": ended_at,
+                     "duration_s": round(len(audio.frame_data) / (self.sample_rate * self.sample_width), 2)}
+        if self._utterances.full():
+            try:
+                self._utterances.get_nowait()
+                self.stats["dropped_utterances"] += 1
+            except queue.Empty:
+                pass
+        self._utterances.put_nowait(utterance)
+        self.stats["utterances"] += 1
+        logger.debug(f"Utterance queued: {utterance['duration_s']}s ({speech_s:.2f}s voiced).")
+
+    def _run(self):
+        try:
+            source = self.microphone.__enter__()
+        except BaseException as e:
+            self.error = e
+            logger.error(f"Could not open the microphone: {e}")
+            return
+        try:
+            self.sample_rate, self.sample_width = source.SAMPLE_RATE, source.SAMPLE_WIDTH
+            chunk_s = source.CHUNK / self.sample_rate
+            vad = _build_vad(self.sample_rate, self.energy_threshold)
+            ring_len = max(1, int(RING_SECONDS / chunk_s))
+            pre_roll: Deque[bytes] = deque(maxlen=max(1, int(self.pre_roll_s / chunk_s)))
+            self._ring = deque(maxlen=ring_len)
+            current: Optional[List[bytes]] = None
+            started_at = speech_s = silence_s = 0.0
+            self._ready.set()
+            logger.info(f"Microphone stream open: {self.sample_rate} Hz, {chunk_s * 1000:.0f} ms chunks, "
+                        f"{self.pre_roll_s}s pre-roll, {type(vad).__name__}.")
+
+            while not self._stop.is_set():
+                chunk = source.stream.read(source.CHUNK)
+                now = time.monotonic()
+                self.stats["chunks"] += 1
+                with self._lock:
+                    self._ring.append((now, chunk))
+
+                if tts_is_playing():
+                    # Jarvis's own voice: end any utterance in progress and keep it out of the pre-roll.
+                    self._publish(chunk, tts_active=True)
+                    if current is not None:
+                        self._emit(current, started_at, now, speech_s)
+                        current = None
+                    pre_roll.clear()
+                    continue
+
+                self._publish(chunk)
+                speech = vad.is_speech(np.frombuffer(chunk, dtype=np.int16), chunk_s)
+                if current is None:
+                    if speech:
+                        current = list(pre_roll) + [chunk]
+                        started_at = now - chunk_s * len(current)
+                        speech_s, silence_s = chunk_s, 0.0
+                    else:
+                        pre_roll.append(chunk)
+                    continue
+
+                current.append(chunk)
+                if speech:
+                    speech_s += chunk_s
+                    silence_s = 0.0
+                else:
+                    silence_s += chunk_s
+                if silence_s >= self.pause_threshold or len(current) * chunk_s >= self.max_phrase_s:
+                    self._emit(current, started_at, now, speech_s)
+                    current = None
+                    pre_roll.clear()
+        except Exception as e:
+            self.error = e
+            logger.error(f"Microphone capture stopped: {e}", exc_info=True)
+        finally:
+            self._ready.clear()
+            try:
+                self.microphone.__exit__(None, None, None)
+            except Exception:
+                pass
@@ -0,0 +1,110 @@
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger("JarvisBargeIn")
+
+# Phrases that cut Jarvis off when heard at the end of the live transcript while he speaks.
+BARGE_IN_PHRASES: Tuple[str, ...] = tuple(
+    p.strip() for p in os.getenv("JARVIS_BARGE_IN_PHRASES", "stop,jarvis stop,stop jarvis,cancel,that's enough,be quiet").split(",")
+    if p.strip()
+)
+# Names the wake-word spotter listens for; a sentence containing one of them would trigger it.
+WAKE_WORD_NAMES: Tuple[str, ...] = ("jarvis", "jarves")
+
+
+class BargeInMonitor:
+    """
+    Listens to the microphone while Jarvis speaks and calls `on_barge_in` once when the user interrupts:
+    either the on-device wake-word spotter fires, or a streaming transcript ends with one of `phrases`.
+    Phrases that also occur in the sentence Jarvis is saying (`current_text()`) are ignored, and so are
+    wake-word detections while that sentence contains one of `wake_words`, since the microphone hears
+    his own voice too.
+    """
+
+    def __init__(self, audio_stream: Any, on_barge_in: Callable[[Dict[str, Any]], None],
+                 wake_word_detector: Any = None, stt: Any = None, phrases: Tuple[str, ...] = BARGE_IN_PHRASES,
+                 current_text: Callable[[], str] = lambda: "", wake_words: Tuple[str, ...] = WAKE_WORD_NAMES):
+        self.audio_stream = audio_stream
+        self.on_barge_in = on_barge_in
+        self.wake_word_detector = wake_word_detector
+        self.stt = stt if stt is not None and getattr(stt, "streaming", False) else None
+        self.phrases = tuple(sorted((p.lower() for p in phrases), key=len, reverse=True))
+        self.current_text = current_text
+        self.wake_words = tuple(w.lower() for w in wake_words)
+        self.triggered: Optional[Dict[str, Any]] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.wake_word_detector is not None or self.stt is not None
+
+    def start(self) -> "BargeInMonitor":
+        if self.enabled and (self._thread is None or not self._thread.is_alive()):
+            self._stop.clear()
+            self.triggered = None
+            self._thread = threading.Thread(target=self._run, name="JarvisBargeIn", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return " ".join(re.sub(r"[^a-z' ]+", " ", text.lower()).split())
+
+    def _speaking_wake_word(self) -> bool:
+        speaking = f" {self._normalize(self.current_text())} "
+        return any(f" {word} " in speaking for word in self.wake_words)
+
+    def _phrase_at_end(self, transcript: str) -> Optional[str]:
+        words = self._normalize(transcript).split()
+        tail = " ".join(words[-3:])
+        speaking = f" {self._normalize(self.current_text())} "
+        for phrase in self.phrases:
+            if (tail == phrase or tail.endswith(" " + phrase)) and f" {phrase} " not in speaking:
+                return phrase
+        return None
+
+    def _trigger(self, reason: str, **details: Any):
+        self.triggered = {"reason": reason, "at": time.monotonic(), **details}
+        logger.info(f"Barge-in: {self.triggered}")
+        self.on_barge_in(self.triggered)
+
+    def _run(self):
+        subscription = self.audio_stream.subscribe(during_tts=True)
+        try:
+            sample_rate = self.audio_stream.sample_rate
+            if self.wake_word_detector is not None:
+                self.wake_word_detector.reset(sample_rate=sample_rate)
+            recognition = self.stt.start_stream(sample_rate) if self.stt is not None else None
+            while not self._stop.is_set():
+                try:
+                    chunk = subscription.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if self.wake_word_detector is not None:
+                    detection = self.wake_word_detector.process(chunk)
+                    if detection and self._speaking_wake_word():
+                        logger.debug("Ignoring a wake-word detection while Jarvis says his own name.")
+                    elif detection:
+                        self._trigger("wake_word", score=detection.get("score"))
+                        return
+                if recognition is not None:
+                    event = recognition.accept(chunk)
+                    phrase = self._phrase_at_end(event["text"]) if event and event["text"] else None
+                    if phrase:
+                        self._trigger("phrase", phrase=phrase)
+                        return
+        except Exception as e:
+            logger.error(f"Barge-in monitor stopped: {e}", exc_info=True)
+        finally:
+            self.audio_stream.unsubscribe(subscription)
@@ -1,15 +1,22 @@
 import logging
 import speech_recognition as sr
 import time
-import win32com.client
-from typing import Any, Dict, List, Optional, Tuple, Callable
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Callable
 import re
-import requests
-import threading
+import queue
 import os
 import sys
+import threading
+from contextlib import contextmanager
 from dotenv import load_dotenv
-from Authentication import run_jarvis_vision_deepface
+from .sentence_stream import SentenceAccumulator, split_sentences
+from .narrator import NARRATION_WAIT_FOR_FINAL, wait_for_narration
+from .audio_stream import MicrophoneStream, tts_playing
+from .ui_notifier import get_ui_notifier
+from .tts import TTS_WARMUP, TTSCache, TextToSpeech, tool_phrases
+from .barge_in import BargeInMonitor
+from utils.tracing import span, traced
+from utils.speech_to_text import get_stt_backend, listen_streaming
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -22,13 +29,32 @@ if not logger.hasHandlers():
 
 WAKE_WORD_VARIATIONS: Tuple[str, ...] = ("hey jarves", "hey jarvis", "jarvis")
 EXIT_COMMANDS: Tuple[str, ...] = ("goodbye", "stop", "quit", "exit", "shut down", "that's all")
+AGENT_WARMUP_ENABLED = os.getenv("JARVIS_AGENT_WARMUP", "true").lower() in ("1", "true", "yes")
+# "local": on-device keyword spotting over the mic stream (falls back to "google" without enrolled templates).
+WAKE_WORD_ENGINE = os.getenv("JARVIS_WAKE_WORD_ENGINE", "local").lower()
+# Keep the microphone open on a capture thread and take wake words / commands from its utterance queue.
+ALWAYS_ON_MIC = os.getenv("JARVIS_ALWAYS_ON_MIC", "true").lower() in ("1", "true", "yes")
+# Listen for the wake word or "stop" while speaking and cut the rest of the answer off.
+BARGE_IN_ENABLED = os.getenv("JARVIS_BARGE_IN", "true").lower() in ("1", "true", "yes")
+# Answers at least this long are spoken sentence by sentence so they can be interrupted between and within sentences.
+CHUNKED_SPEECH_MIN_CHARS = int(os.getenv("JARVIS_CHUNKED_SPEECH_MIN_CHARS", "160"))
+# Jarvis's own fixed lines; pre-rendered into the speech cache at startup with the tools' status lines.
+FIXED_PHRASES: Tuple[str, ...] = (
+    "Yes Sir?", "I'm listening.", "Understood. Standing by.", "Jarvis systems online.",
+    "I didn't hear a command in time.", "My apologies, I didn't quite catch that command.",
+    "I'm having trouble reaching the speech service for command processing.",
+    "An internal error occurred while I was processing your command.",
+    "Speech service seems to be having an issue.", "Hello Master, Jarvis is online.",
+    "Shutting down systems. Goodbye, sir.",
+)
 
 class Jarvis:
     def __init__(self,
                  wakeup_word: str = "hey jarvis",
                  flask_ui_url: Optional[str] = None,
                  energy_threshold: int = 350,
-                 pause_threshold: float = 0.8
+                 pause_threshold: float = 0.8,
+                 stream_responses: Optional[bool] = None
                 ):
         self.wakeup_word = wakeup_word.lower()
         self.all_wake_words = {self.wakeup_word} | set(WAKE_WORD_VARIATIONS)
@@ -38,22 +64,41 @@ class Jarvis:
         self.speaker = self._initialize_speaker()
         self.recognizer.pause_threshold = pause_threshold
         self.recognizer.energy_threshold = energy_threshold
+        self.stt = get_stt_backend(self.recognizer)
         self.flask_ui_url = flask_ui_url or os.getenv("FLASK_UI_URL", "http://127.0.0.1:5000")
+        if stream_responses is None:
+            stream_responses = os.getenv("JARVIS_STREAM_RESPONSES", "true").lower() in ("1", "true", "yes")
+        self.stream_responses = stream_responses
+        self.ui = get_ui_notifier(self.flask_ui_url) if self.flask_ui_url else None
         if self.flask_ui_url:
             self._notify_ui("jarvis_status", text="Jarvis Initializing")
         self.agent = None
+        self._wake_word_detector = None
+        self.audio_stream: Optional[MicrophoneStream] = None
+        self._command_since: Optional[float] = None
+        self._speech_cancel = threading.Event()
+        self._speaking_text = ""
+        self._interruptible_depth = 0
+        self._barge_in_monitor: Optional[BargeInMonitor] = None
+        self.last_barge_in: Optional[Dict[str, Any]] = None
+        self.presence = None
 
-    def _initialize_speaker(self) -> Optional[win32com.client.Dispatch]:
+    def _initialize_speaker(self) -> Optional[TextToSpeech]:
         try:
-            speaker_obj = win32com.client.Dispatch("SAPI.SpVoice")
-            speaker_obj.Volume = 100
-            speaker_obj.Rate = 0
-            logging.info("SAPI Speaker initialized successfully.")
+            speaker_obj = TextToSpeech(cache=TTSCache())
+            logging.info(f"Speaker initialized with the {speaker_obj.backend.name} backend.")
             return speaker_obj
         except Exception as e:
-            logging.error(f"Failed to initialize SAPI speaker: {e}. Text-to-speech will be unavailable.", exc_info=False)
+            logging.error(f"Failed to initialize the speaker: {e}. Text-to-speech will be unavailable.", exc_info=False)
             return None
 
+    def warm_up_speech(self) -> int:
+        """Queues the fixed phrases that are not in the speech cache yet for background rendering."""
+        if not self.speaker:
+            return 0
+        phrases = [self._sanitize_for_speech(p) for p in FIXED_PHRASES + tuple(tool_phrases())]
+        return self.speaker.warm_up(phrases)
+
     def _sanitize_for_speech(self, text: str) -> str:
         if not isinstance(text, str): text = str(text)
         text = re.sub(r'(\*\*|__)(.*?)(\1)', r'\2', text)
@@ -69,16 +114,8 @@ class Jarvis:
         return text.strip()
 
     def _notify_ui(self, event_type: str, text: Optional[str] = None):
-        if not self.flask_ui_url: return
-        payload = {"event": event_type}
-        if text: payload["text"] = text
-        def send_request_thread():
-            try:
-                requests.post(f"{self.flask_ui_url}/ui_event", json=payload, timeout=0.5)
-            except requests.exceptions.RequestException as e_req:
-                logging.debug(f"UI notification failed for event '{event_type}': {e_req}")
-                pass
-        threading.Thread(target=send_request_thread, daemon=True).start()
+        if self.ui is not None:
+            self.ui.notify(event_type, text)
 
     def speak(self, data: Any):
         text_to_speak_orig = str(data)
@@ -93,97 +130,359 @@ class Jarvis:
                 return
             print(f"Jarvis says: {sanitized_text}")
             self._notify_ui("speaking_start", text=sanitized_text)
-            self.speaker.Speak(sanitized_text)
+            if len(sanitized_text) < CHUNKED_SPEECH_MIN_CHARS:
+                self._say(sanitized_text)
+            else:
+                with self._interruptible_speech():
+                    for chunk in self._speech_chunks(sanitized_text):
+                        if not self._say(chunk):
+                            break
         except Exception as e:
             logging.error(f"Speech error. Original text (start): '{text_to_speak_orig[:50]}'. Sanitized text (start): '{sanitized_text[:50]}'. Error: {e}", exc_info=False)
         finally:
             self._notify_ui("speaking_end")
 
-    def listen_for_wake_word(self) -> bool:
+    def _speech_chunks(self, text: str) -> List[str]:
+        """Sentences of `text`; every line (list item, flight, email paragraph) starts a new one."""
+        return [sentence for line in text.split("\n") for sentence in split_sentences(line, min_chars=20)]
+
+    def _say(self, text: str) -> bool:
+        """Speaks one chunk; False when a barge-in cancelled it (or cancelled the answer before it started)."""
+        if self._speech_cancel.is_set():
+            return False
+        self._speaking_text = text
+        try:
+            with span("tts.speak", chars=len(text)) as attrs, tts_playing():
+                result = self.speaker.say(text, self._speech_cancel)
+                attrs.update(cached=result["cached"], completed=result["completed"])
+        finally:
+            self._speaking_text = ""
+        return result["completed"]
+
+    @contextmanager
+    def _interruptible_speech(self) -> Iterator[threading.Event]:
+        """
+        While the block runs, a barge-in monitor listens to the always-on mic stream; the wake word or a
+        "stop" phrase sets the cancel event, which stops the current chunk and skips the rest.
+        """
+        self._interruptible_depth += 1
+        if self._interruptible_depth == 1:
+            self._speech_cancel.clear()
+            self.last_barge_in = None
+            if BARGE_IN_ENABLED and self._stream_running():
+                monitor = BargeInMonitor(self.audio_stream, self._on_barge_in,
+                                         wake_word_detector=self._get_wake_word_detector(), stt=self.stt,
+                                         current_text=lambda: self._speaking_text,
+                                         wake_words=tuple({w.split()[-1] for w in self.all_wake_words}))
+                if monitor.enabled:
+                    self._barge_in_monitor = monitor.start()
+        try:
+            yield self._speech_cancel
+        finally:
+            self._interruptible_depth -= 1
+            if self._interruptible_depth == 0:
+                if self._barge_in_monitor is not None:
+                    self._barge_in_monitor.stop()
+                    self._barge_in_monitor = None
+                self._speech_cancel.clear()
+
+    def _on_barge_in(self, detection: Dict[str, Any]):
+        self.last_barge_in = detection
+        self._speech_cancel.set()
+        # Only speech after the interruption counts as the next command.
+        self._command_since = detection["at"]
+        self._notify_ui("speech_interrupted", text="Interrupted.")
+
+    def speak_stream(self, tokens: Iterable[str]) -> str:
+        accumulator = SentenceAccumulator()
+        spoken: List[str] = []
+        first_sentence_at = None
+        start_time = time.perf_counter()
+        with self._interruptible_speech() as cancel:
+            for token in tokens:
+                for sentence in accumulator.feed(token):
+                    if first_sentence_at is None:
+                        first_sentence_at = time.perf_counter() - start_time
+                        logging.info(f"First sentence ready for speech after {first_sentence_at:.2f}s.")
+                        if NARRATION_WAIT_FOR_FINAL:
+                            wait_for_narration()
+                    self.speak(sentence)
+                    spoken.append(sentence)
+                if cancel.is_set():
+                    logging.info("Answer interrupted; dropping the rest of the stream.")
+                    return " ".join(spoken)
+            remainder = accumulator.flush()
+            if remainder:
+                if NARRATION_WAIT_FOR_FINAL and first_sentence_at is None:
+                    wait_for_narration()
+                self.speak(remainder)
+                spoken.append(remainder)
+        return " ".join(spoken)
+
+    def _get_wake_word_detector(self):
+        """Local spotter from the enrolled templates; None means wake words are transcribed instead."""
+        if self._wake_word_detector is None and WAKE_WORD_ENGINE == "local":
+            try:
+                from .wake_word import load_wake_word_detector
+                self._wake_word_detector = load_wake_word_detector() or False
+            except ImportError as e:
+                logging.warning(f"Local wake-word spotter unavailable ({e}); using Google speech recognition.")
+                self._wake_word_detector = False
+        return self._wake_word_detector or None
+
+    def start_audio_stream(self) -> bool:
+        """Opens the always-on microphone stream; on failure the per-call microphone path is used."""
+        if not ALWAYS_ON_MIC:
+            return False
+        if self.audio_stream is None:
+            self.audio_stream = MicrophoneStream(self.microphone, energy_threshold=self.recognizer.energy_threshold,
+                                                 pause_threshold=self.recognizer.pause_threshold)
+        try:
+            self.audio_stream.start()
+            return True
+        except Exception as e:
+            logging.error(f"Always-on microphone unavailable ({e}); opening the microphone per request instead.")
+            self.audio_stream = None
+            return False
+
+    def start_presence_service(self) -> bool:
+        """Starts background master detection; its activations wake Jarvis like the wake word does."""
+        try:
+            from Authentication.presence_service import PRESENCE_ENABLED, PresenceService
+        except Exception as e:
+            logging.warning(f"Visual presence detection unavailable: {e}")
+            return False
+        if not PRESENCE_ENABLED:
+            return False
+        if self.presence is None:
+            self.presence = PresenceService()
+        self.presence.start()
+        return True
+
+    def _presence_activated(self) -> bool:
+        """True once per activation of the presence service."""
+        detection = self.presence.consume() if self.presence is not None else None
+        if detection is None:
+            return False
+        print("Jarvis is Online. Master Face detected visually.")
+        self._notify_ui("visual_wake_detected", text="Master detected visually.")
+        self.speak("Hello Master, Jarvis is online.")
+        return True
+
+    def _stream_running(self) -> bool:
+        return self.audio_stream is not None and self.audio_stream.running
+
+    @contextmanager
+    def _mic_chunks(self) -> Iterator[Tuple[Iterator[bytes], int]]:
+        """Raw int16 mic chunks (b"" when none arrived for a while) and their sample rate."""
+        if self._stream_running():
+            stream = self.audio_stream
+            subscription = stream.subscribe()
+
+            def _from_stream() -> Iterator[bytes]:
+                while True:
+                    try:
+                        yield subscription.get(timeout=0.5)
+                    except queue.Empty:
+                        yield b""
+            try:
+                yield _from_stream(), stream.sample_rate
+            finally:
+                stream.unsubscribe(subscription)
+        else:
+            with self.microphone as source:
+                yield iter(lambda: source.stream.read(source.CHUNK), None), source.SAMPLE_RATE
+
+    def _next_utterance(self, timeout: float, phrase_time_limit: float, since: Optional[float] = None,
+                        interrupt: Optional[threading.Event] = None) -> sr.AudioData:
+        """
+        Next spoken phrase; raises sr.WaitTimeoutError like `Recognizer.listen` when none starts in time
+        (or, with the always-on stream, as soon as `interrupt` is set).
+        """
+        if self._stream_running():
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or (interrupt is not None and interrupt.is_set()):
+                    raise sr.WaitTimeoutError("No utterance within the timeout.")
+                utterance = self.audio_stream.next_utterance(timeout=min(0.25, remaining), since=since)
+                if utterance is not None:
+                    return utterance["audio"]
         with self.microphone as source:
+            return self.recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
+
+    def _strip_wake_word(self, text: str) -> str:
+        """'hey jarvis, open notepad' -> 'open notepad'; the wake phrase may share an utterance with the command."""
+        for word in sorted(self.all_wake_words, key=len, reverse=True):
+            if text.startswith(word):
+                return text[len(word):].strip(" ,.!?")
+        return text
+
+    def listen_for_wake_word(self) -> bool:
+        detector = self._get_wake_word_detector()
+        # The camera is only watched while Jarvis waits to be woken; commands may need it for tools.
+        if self.presence is not None:
+            self.presence.resume()
+        try:
+            if detector is not None:
+                return self._listen_for_wake_word_local(detector)
+            return self._listen_for_wake_word_google()
+        finally:
+            if self.presence is not None:
+                self.presence.pause()
+                # Woken by voice: a visual activation that raced it would otherwise wake Jarvis again later.
+                self.presence.consume()
+
+    def _listen_for_wake_word_local(self, detector) -> bool:
+        """Spots the wake word on-device over the raw mic stream; no audio leaves the machine until it fires."""
+        print("\n👂 Listening for wake word (on-device)...")
+        self._notify_ui("listening_wake_word", text="Listening for wake word...")
+        with self._mic_chunks() as (chunks, sample_rate):
+            detector.reset(sample_rate=sample_rate)
             while True:
-                print("\n👂 Listening for wake word...")
-                self._notify_ui("listening_wake_word", text="Listening for wake word...")
                 try:
-                    audio = self.recognizer.listen(source, phrase_time_limit=3, timeout=5)
-                    query = self.recognizer.recognize_google(audio, language='en-US').lower()
-                    logging.info(f"Heard (wake attempt): '{query}'")
-                    if any(word in query for word in self.all_wake_words):
-                        self._notify_ui("wake_word_detected", text=f"Heard: '{query}'")
-                        self.speak("Yes Sir?")
-                        return True
-                    logging.info(f"Audio recognized ('{query}') but not a wake word. Proceeding to visual check.")
-                except sr.WaitTimeoutError:
-                    logging.debug("Audio listen timed out (no speech detected or too short). Proceeding to visual check.")
-                except sr.UnknownValueError:
-                    logging.debug("Could not understand audio. Proceeding to visual check.")
-                except sr.RequestError as e_req:
-                    logging.warning(f"Speech service connection issue for wake word: {e_req}. Proceeding to visual check.")
-                    self.speak("Speech service seems to be having an issue.")
-                    time.sleep(2)
+                    chunk = next(chunks)
                 except Exception as e_audio:
-                    logging.error(f"Unexpected error during audio listening for wake word: {e_audio}", exc_info=True)
+                    logging.error(f"Unexpected error reading the microphone for wake word: {e_audio}", exc_info=True)
                     time.sleep(1)
+                    continue
+                detection = detector.process(chunk) if chunk else None
+                if detection:
+                    logging.info(f"Wake word spotted on-device: {detection}")
+                    # The command may follow the wake word in the same breath; keep utterances from here on.
+                    self._command_since = time.monotonic() - 0.5
+                    self._notify_ui("wake_word_detected", text="Heard: 'Jarvis'")
+                    self.speak("Yes Sir?")
+                    return True
+                if self._presence_activated():
+                    return True
 
-                self._notify_ui("visual_check_start", text="Attempting visual master detection...")
-                logging.info("Attempting visual master detection...")
-                try:
-                    if run_jarvis_vision_deepface():
-                        print("Jarvis is Online. Master Face detected visually.")
-                        self._notify_ui("visual_wake_detected", text="Master detected visually.")
-                        return True
-                    else:
-                        logging.info("Visual master detection did not result in activation. Looping back to listen for wake word.")
-                except Exception as e_visual:
-                    logging.error(f"Error during visual master detection call: {e_visual}", exc_info=True)
-                    self.speak("There was an issue with the visual detection system.")
-
-    def process_command(self) -> Optional[bool]:
-        with self.microphone as source:
-            self._notify_ui("listening_command", text="Awaiting your command...")
-            self.speak("I'm listening.")
-            print("🎤 Listening for command...")
+    def _listen_for_wake_word_google(self) -> bool:
+        while True:
+            print("\n👂 Listening for wake word...")
+            self._notify_ui("listening_wake_word", text="Listening for wake word...")
             try:
-                audio = self.recognizer.listen(source, timeout=10, phrase_time_limit=15)
-                command = self.recognizer.recognize_google(audio, language='en-US').lower()
-                logging.info(f"Command received: '{command}'")
-                self._notify_ui("command_recognised", text=f"You said: {command}")
-                if any(trigger in command for trigger in EXIT_COMMANDS):
-                    self.speak("Understood. Standing by.")
-                    self._notify_ui("idle", text="Jarvis Idle.")
+                audio = self._next_utterance(timeout=5, phrase_time_limit=3,
+                                             interrupt=self.presence.activated if self.presence is not None else None)
+                query = self.stt.transcribe(audio).lower()
+                logging.info(f"Heard (wake attempt): '{query}'")
+                if any(word in query for word in self.all_wake_words):
+                    self._notify_ui("wake_word_detected", text=f"Heard: '{query}'")
+                    self.speak("Yes Sir?")
                     return True
-                if self.agent:
-                    self._notify_ui("processing_command", text=f"Processing: {command}")
-                    agent_response = self.agent.handle_command(command)
-                    if agent_response:
-                        self.speak(agent_response)
-                    else:
-                        logging.info("Agent processed command without a specific verbal response to speak.")
-                    self._notify_ui("command_processed", text="Processing complete.")
-                else:
-                    self.speak(f"I understood your command as: {command}. However, no agent is currently assigned to handle it.")
-                return None
+                logging.info(f"Audio recognized ('{query}') but not a wake word. Listening again.")
             except sr.WaitTimeoutError:
-                self.speak("I didn't hear a command in time.")
-                return None
+                logging.debug("Audio listen timed out (no speech detected or too short). Listening again.")
             except sr.UnknownValueError:
-                self.speak("My apologies, I didn't quite catch that command.")
-                return None
+                logging.debug("Could not understand audio. Listening again.")
             except sr.RequestError as e_req:
-                logging.warning(f"Speech service issue for commands: {e_req}")
-                self.speak("I'm having trouble reaching the speech service for command processing.")
-                return None
-            except Exception as e:
-                logging.error(f"Error processing command: {e}", exc_info=True)
-                self.speak("An internal error occurred while I was processing your command.")
-                return None
+                logging.warning(f"Speech service connection issue for wake word: {e_req}. Listening again.")
+                self.speak("Speech service seems to be having an issue.")
+                time.sleep(2)
+            except Exception as e_audio:
+                logging.error(f"Unexpected error during audio listening for wake word: {e_audio}", exc_info=True)
+                time.sleep(1)
+
+            if self._presence_activated():
+                return True
+
+    def _listen_for_command(self, timeout: float = 10, phrase_time_limit: float = 15) -> str:
+        """Recognized command text; utterances that only contain the wake word are skipped."""
+        since = self._command_since if self._command_since is not None else time.monotonic()
+        self._command_since = None
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.stt.streaming:
+                heard = self._recognize_streaming(max(0.1, deadline - time.monotonic()), phrase_time_limit, since)
+            else:
+                with span("stt.listen"):
+                    audio = self._next_utterance(timeout=max(0.1, deadline - time.monotonic()),
+                                                 phrase_time_limit=phrase_time_limit, since=since)
+                with span("stt.recognize", engine=self.stt.name):
+                    heard = self.stt.transcribe(audio).lower()
+            command = self._strip_wake_word(heard)
+            if command:
+                return command
+            logging.info(f"Heard only the wake word ('{heard}'); waiting for the command.")
+            since = time.monotonic()
+            if time.monotonic() >= deadline:
+                raise sr.WaitTimeoutError("Only the wake word was heard.")
+
+    def _recognize_streaming(self, timeout: float, phrase_time_limit: float, since: float) -> str:
+        """
+        Decodes the live mic chunks while the user speaks. Audio the stream captured since `since`
+        (a command said in the same breath as the wake word) is decoded first; an exit command is
+        acted on from a stable partial without waiting for the end of the phrase.
+        """
+        preroll = b""
+        if self._stream_running():
+            preroll = self.audio_stream.recent_audio(max(0.0, time.monotonic() - since)).get_raw_data()
+        with span("stt.recognize", engine=self.stt.name, streaming=True) as attrs, \
+                self._mic_chunks() as (chunks, sample_rate):
+            result = listen_streaming(
+                self.stt, chunks, sample_rate, timeout=timeout, phrase_time_limit=phrase_time_limit, preroll=preroll,
+                is_complete=lambda partial: self._strip_wake_word(partial.lower()) in EXIT_COMMANDS,
+                on_partial=lambda partial: self._notify_ui("partial_transcript", text=partial))
+            attrs.update(early=result["early"], partials=result["partials"])
+        return result["text"].lower()
+
+    @traced("jarvis.process_command")
+    def process_command(self) -> Optional[bool]:
+        self._notify_ui("listening_command", text="Awaiting your command...")
+        self.speak("I'm listening.")
+        print("🎤 Listening for command...")
+        try:
+            command = self._listen_for_command(timeout=10, phrase_time_limit=15)
+            logging.info(f"Command received: '{command}'")
+            self._notify_ui("command_recognised", text=f"You said: {command}")
+            if any(trigger in command for trigger in EXIT_COMMANDS):
+                self.speak("Understood. Standing by.")
+                self._notify_ui("idle", text="Jarvis Idle.")
+                return True
+            if self.agent:
+                self._notify_ui("processing_command", text=f"Processing: {command}")
+                if self.stream_responses and hasattr(self.agent, "stream_command"):
+                    agent_response = self.speak_stream(self.agent.stream_command(command))
+                else:
+                    agent_response = self.agent.handle_command(command)
+                    if agent_response:
+                        if NARRATION_WAIT_FOR_FINAL:
+                            wait_for_narration()
+                        self.speak(agent_response)
+                if not agent_response:
+                    logging.info("Agent processed command without a specific verbal response to speak.")
+                self._notify_ui("command_processed", text="Processing complete.")
+            else:
+                self.speak(f"I understood your command as: {command}. However, no agent is currently assigned to handle it.")
+            return None
+        except sr.WaitTimeoutError:
+            self.speak("I didn't hear a command in time.")
+            return None
+        except sr.UnknownValueError:
+            self.speak("My apologies, I didn't quite catch that command.")
+            return None
+        except sr.RequestError as e_req:
+            logging.warning(f"Speech service issue for commands: {e_req}")
+            self.speak("I'm having trouble reaching the speech service for command processing.")
+            return None
+        except Exception as e:
+            logging.error(f"Error processing command: {e}", exc_info=True)
+            self.speak("An internal error occurred while I was processing your command.")
+            return None
 
     def run(self, agent_instance = None):
         self.agent = agent_instance
         if self.agent:
             logging.info("Jarvis run method received an agent instance.")
+            if AGENT_WARMUP_ENABLED and hasattr(self.agent, "start_warm_up"):
+                # Runs while we wait for the wake word, so the first command does not pay for it.
+                self.agent.start_warm_up()
         else:
             logging.warning("Jarvis run method did NOT receive an agent instance. Command processing will be limited.")
+        self.start_audio_stream()
+        self.start_presence_service()
+        if TTS_WARMUP:
+            self.warm_up_speech()
         try:
             self._notify_ui("jarvis_status", text="Jarvis Systems Online")
             self.speak("Jarvis systems online.")
@@ -210,5 +509,11 @@ class Jarvis:
                 except Exception: pass
             self._notify_ui("jarvis_status", text=f"Jarvis Critical Error: {str(e)[:50]}")
         finally:
+            if self.audio_stream is not None:
+                self.audio_stream.stop()
+            if self.presence is not None:
+                self.presence.stop()
             logging.info("Jarvis application finished.")
             self._notify_ui("jarvis_status", text="Jarvis Offline")
+            if self.ui is not None:
+                self.ui.close()
@@ -0,0 +1,167 @@
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger("JarvisNarrator")
+
+NARRATION_STALE_AFTER_S = float(os.getenv("JARVIS_NARRATION_STALE_AFTER", "6"))
+NARRATION_MAX_PENDING = int(os.getenv("JARVIS_NARRATION_MAX_PENDING", "4"))
+# Wait for queued tool narration to finish before the final answer is spoken, so the two never overlap.
+NARRATION_WAIT_FOR_FINAL = os.getenv("JARVIS_NARRATION_WAIT_FOR_FINAL", "true").lower() in ("1", "true", "yes")
+NARRATION_DRAIN_TIMEOUT_S = float(os.getenv("JARVIS_NARRATION_DRAIN_TIMEOUT", "15"))
+
+
+class _ConsoleSpeaker:
+    def speak(self, data: Any):
+        print(f"Jarvis (TTS unavailable): {str(data)[:150]}")
+
+
+class Narrator:
+    """
+    Asynchronous narration channel for tools. `say` enqueues a line and returns immediately;
+    a dedicated thread speaks the queue in order while the tool keeps working.
+
+    Progress lines are coalesced: when a new one arrives, queued progress lines that have not
+    started playing are dropped, and lines that waited longer than `stale_after_s` are skipped.
+    Important lines (results, errors, instructions) are always spoken.
+
+    The speaker is built by `speaker_factory` on the narration thread itself, because SAPI
+    (win32com) objects may only be used from the thread that created them.
+    """
+
+    def __init__(self, speaker_factory: Callable[[], Any],
+                 stale_after_s: float = NARRATION_STALE_AFTER_S,
+                 max_pending: int = NARRATION_MAX_PENDING):
+        self.speaker_factory = speaker_factory
+        self.stale_after_s = stale_after_s
+        self.max_pending = max_pending
+        self._queue: Deque[Dict[str, Any]] = deque()
+        self._cond = threading.Condition()
+        self._speaking = False
+        self._spoken_seq = 0
+        self._next_seq = 0
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.stats = {"spoken": 0, "coalesced": 0, "stale": 0}
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="JarvisNarrator", daemon=True)
+            self._thread.start()
+
+    def say(self, text: Any, important: bool = False, wait: bool = False):
+        """Queues `text` for speech. `wait=True` blocks until this line has been spoken (or dropped)."""
+        text = str(text).strip()
+        if not text:
+            return
+        with self._cond:
+            if self._closed:
+                return
+            if not important:
+                dropped = [item for item in self._queue if not item["important"]]
+                for item in dropped:
+                    self._queue.remove(item)
+                self.stats["coalesced"] += len(dropped)
+            while len(self._queue) >= self.max_pending:
+                victim = next((item for item in self._queue if not item["important"]), self._queue[0])
+                self._queue.remove(victim)
+                self.stats["coalesced"] += 1
+            self._next_seq += 1
+            seq = self._next_seq
+            self._queue.append({"seq": seq, "text": text, "important": important, "queued_at": time.monotonic()})
+            self._ensure_thread()
+            self._cond.notify_all()
+            if wait:
+                self._cond.wait_for(lambda: self._spoken_seq >= seq or self._closed)
+
+    def speak(self, text: Any):
+        """Drop-in for `speaker.speak`; queues an important line without blocking."""
+        self.say(text, important=True)
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._queue) + (1 if self._speaking else 0)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until everything queued so far has been spoken. Returns False on timeout."""
+        with self._cond:
+            target = self._next_seq
+            return self._cond.wait_for(lambda: self._spoken_seq >= target or self._closed, timeout=timeout)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._queue.clear()
+            self._cond.notify_all()
+
+    def _build_speaker(self) -> Any:
+        try:
+            import pythoncom
+            pythoncom.CoInitialize()
+        except ImportError:
+            pass
+        try:
+            return self.speaker_factory()
+        except Exception as e:
+            logger.error(f"Could not build the narration speaker: {e}. Narration goes to the console.")
+            return _ConsoleSpeaker()
+
+    def _run(self):
+        speaker = self._build_speaker()
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closed)
+                if self._closed:
+                    return
+                item = self._queue.popleft()
+                waited = time.monotonic() - item["queued_at"]
+                stale = not item["important"] and waited > self.stale_after_s
+                self._speaking = not stale
+            if stale:
+                self.stats["stale"] += 1
+                logger.debug(f"Skipping stale narration ({waited:.1f}s old): {item['text'][:60]}")
+            else:
+                try:
+                    speaker.speak(item["text"])
+                    self.stats["spoken"] += 1
+                except Exception as e:
+                    logger.error(f"Narration failed: {e}")
+            with self._cond:
+                self._speaking = False
+                self._spoken_seq = item["seq"]
+                # Lines dropped while this one played have sequence numbers below the next queued one.
+                if not self._queue:
+                    self._spoken_seq = self._next_seq
+                self._cond.notify_all()
+
+
+def _jarvis_speaker():
+    from .jarves_voice import Jarvis
+    return Jarvis()
+
+
+_default_narrator: Optional[Narrator] = None
+_default_lock = threading.Lock()
+
+
+def get_narrator(speaker_factory: Callable[[], Any] = _jarvis_speaker) -> Narrator:
+    """Process-wide narrator used by MainAgent tools; created on first use."""
+    global _default_narrator
+    with _default_lock:
+        if _default_narrator is None:
+            _default_narrator = Narrator(speaker_factory)
+        return _default_narrator
+
+
+def wait_for_narration(timeout: Optional[float] = NARRATION_DRAIN_TIMEOUT_S) -> bool:
+    """Drains the process-wide narrator if one exists; used before speaking a final answer."""
+    narrator = _default_narrator
+    if narrator is None:
+        return True
+    drained = narrator.drain(timeout=timeout)
+    if not drained:
+        logger.warning(f"Narration still pending after {timeout}s; speaking the answer anyway.")
+    return drained
@@ -0,0 +1,76 @@
+import re
+from typing import List, Optional
+
+SENTENCE_BOUNDARY_RE = re.compile(r'(?:(?<=[.!?])|(?<=[.!?]["\')\]]))\s+|\n\s*\n|\n(?=\s*(?:[-*+]|\d+[.)])\s)')
+# Words whose trailing period does not end a sentence ("Dr. Patel", "e.g. this"), besides initials.
+ABBREVIATIONS = frozenset({"mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "approx", "e.g", "i.e", "fig", "dept"})
+ABBREVIATION_RE = re.compile(r"(?:^|\s)\(?([A-Za-z.]+)\.$")
+
+
+def _ends_with_abbreviation(text: str) -> bool:
+    m = ABBREVIATION_RE.search(text)
+    if not m:
+        return False
+    word = m.group(1)
+    return word.lower() in ABBREVIATIONS or re.fullmatch(r"[A-HJ-Z]|(?:[A-Za-z]\.)+[A-Za-z]", word) is not None
+
+
+def _boundaries(text: str, pos: int = 0):
+    """Sentence boundaries in `text` from `pos`, skipping the period of an abbreviation or initial."""
+    for match in SENTENCE_BOUNDARY_RE.finditer(text, pos):
+        if not _ends_with_abbreviation(text[:match.start()]):
+            yield match
+
+
+def split_sentences(text: str, min_chars: int = 0) -> List[str]:
+    """Splits text into speakable sentences. Fragments shorter than `min_chars` are merged into the next one."""
+    sentences: List[str] = []
+    pending = ""
+    parts, start = [], 0
+    for match in _boundaries(text):
+        parts.append(text[start:match.start()])
+        start = match.end()
+    parts.append(text[start:])
+    for part in parts:
+        part = part.strip()
+        if not part:
+            continue
+        pending = f"{pending} {part}" if pending else part
+        if len(pending) >= min_chars:
+            sentences.append(pending)
+            pending = ""
+    if pending:
+        sentences.append(pending)
+    return sentences
+
+
+class SentenceAccumulator:
+    """Collects streamed tokens and hands back each sentence as soon as it is complete."""
+
+    def __init__(self, min_chars: int = 12):
+        self.min_chars = min_chars
+        self._buffer = ""
+
+    def feed(self, token: str) -> List[str]:
+        if not token:
+            return []
+        self._buffer += token
+        completed: List[str] = []
+        search_from = 0
+        while True:
+            match = next(_boundaries(self._buffer, search_from), None)
+            if not match:
+                break
+            sentence = self._buffer[:match.start()].strip()
+            if len(sentence) < self.min_chars:
+                search_from = match.end()
+                continue
+            completed.append(sentence)
+            self._buffer = self._buffer[match.end():]
+            search_from = 0
+        return completed
+
+    def flush(self) -> Optional[str]:
+        remainder = self._buffer.strip()
+        self._buffer = ""
+        return remainder or None
@@ -0,0 +1,176 @@
+import argparse
+import glob
+import json
+import os
+import re
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import speech_recognition as sr
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.speech_to_text import (PARTIAL_STABLE_S, GoogleSpeechBackend, SpeechToTextBackend, VoskSpeechBackend,
+                                  vosk_available)
+
+FIXTURE_RATE = 16000
+
+
+def normalize_words(text: str) -> List[str]:
+    return re.sub(r"[^a-z0-9' ]+", " ", text.lower()).split()
+
+
+def word_errors(reference: str, hypothesis: str) -> int:
+    """Word-level edit distance (substitutions + deletions + insertions)."""
+    ref, hyp = normalize_words(reference), normalize_words(hypothesis)
+    row = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        previous, row[0] = row[0], i
+        for j, h in enumerate(hyp, 1):
+            previous, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, previous + (r != h))
+    return row[-1]
+
+
+def load_fixtures(directory: str) -> List[Dict[str, Any]]:
+    """`name.wav` recordings with their reference transcript in `name.txt`."""
+    fixtures = []
+    recognizer = sr.Recognizer()
+    for path in sorted(glob.glob(os.path.join(directory, "*.wav"))):
+        transcript_path = os.path.splitext(path)[0] + ".txt"
+        if not os.path.exists(transcript_path):
+            print(f"Skipping {os.path.basename(path)}: no {os.path.basename(transcript_path)}.")
+            continue
+        with sr.AudioFile(path) as source:
+            audio = recognizer.record(source)
+        audio = sr.AudioData(audio.get_raw_data(convert_rate=FIXTURE_RATE, convert_width=2), FIXTURE_RATE, 2)
+        with open(transcript_path, encoding="utf-8") as f:
+            reference = f.read().strip()
+        fixtures.append({"file": os.path.basename(path), "audio": audio, "reference": reference,
+                         "audio_s": len(audio.frame_data) / (FIXTURE_RATE * 2)})
+    return fixtures
+
+
+def run_batch(backend: SpeechToTextBackend, fixture: Dict[str, Any]) -> Dict[str, Any]:
+    """Whole-utterance recognition: latency is the wait after the utterance has ended."""
+    t0 = time.perf_counter()
+    try:
+        hypothesis, error = backend.transcribe(fixture["audio"]), None
+    except sr.UnknownValueError:
+        hypothesis, error = "", None
+    except sr.RequestError as e:
+        hypothesis, error = "", str(e)
+    return {"hypothesis": hypothesis, "error": error,
+            "final_latency_ms": (time.perf_counter() - t0) * 1000, "first_partial_at_s": None, "early_at_s": None}
+
+
+def run_streaming(backend: SpeechToTextBackend, fixture: Dict[str, Any], chunk_ms: float, realtime: bool,
+                  early_phrases: List[str]) -> Dict[str, Any]:
+    """
+    Feeds the recording in mic-sized chunks. Partial and early-command times are audio offsets;
+    the final latency is the time spent after the last chunk (plus any backlog when not paced).
+    """
+    raw = fixture["audio"].frame_data
+    chunk_bytes = max(2, int(FIXTURE_RATE * chunk_ms / 1000) * 2)
+    stream = backend.start_stream(FIXTURE_RATE)
+    finals: List[str] = []
+    first_partial_at = early_at = None
+    partial, partial_at = "", 0.0
+    wall_start = time.perf_counter()
+    for start in range(0, len(raw), chunk_bytes):
+        audio_at = (start + chunk_bytes) / (FIXTURE_RATE * 2)
+        if realtime:
+            time.sleep(max(0.0, wall_start + audio_at - time.perf_counter()))
+        event = stream.accept(raw[start:start + chunk_bytes])
+        if event and event["type"] == "final" and event["text"]:
+            finals.append(event["text"])
+        elif event and event["type"] == "partial":
+            partial, partial_at = event["text"], audio_at
+            if partial and first_partial_at is None:
+                first_partial_at = audio_at
+        if early_at is None and partial and audio_at - partial_at >= PARTIAL_STABLE_S \
+                and partial.strip().lower() in early_phrases:
+            early_at = audio_at
+    audio_end = wall_start + fixture["audio_s"] if realtime else time.perf_counter()
+    finals.append(stream.finish())
+    return {"hypothesis": " ".join(t for t in finals if t), "error": None,
+            "final_latency_ms": (time.perf_counter() - audio_end) * 1000,
+            "first_partial_at_s": first_partial_at, "early_at_s": early_at}
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    return sorted(values)[int(q * (len(values) - 1))]
+
+
+def summarize(engine: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    scored = [r for r in rows if r["error"] is None]
+    ref_words = sum(len(normalize_words(r["reference"])) for r in scored)
+    latencies = [r["final_latency_ms"] for r in scored]
+    partials = [r["first_partial_at_s"] for r in scored if r["first_partial_at_s"] is not None]
+    audio_s = sum(r["audio_s"] for r in scored)
+    return {
+        "engine": engine, "files": len(rows), "errors": len(rows) - len(scored),
+        "wer": round(sum(r["word_errors"] for r in scored) / ref_words, 3) if ref_words else None,
+        "final_latency_ms_p50": round(statistics.median(latencies), 1) if latencies else None,
+        "final_latency_ms_p95": round(percentile(latencies, 0.95), 1) if latencies else None,
+        "first_partial_at_s_median": round(statistics.median(partials), 2) if partials else None,
+        "early_commands": sum(1 for r in scored if r["early_at_s"] is not None),
+        "cpu_real_time_factor": round(sum(r["cpu_s"] for r in scored) / audio_s, 3) if audio_s else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Word error rate and latency of the speech-to-text backends on WAV fixtures.")
+    parser.add_argument("fixtures", help="Directory of name.wav recordings with reference transcripts in name.txt.")
+    parser.add_argument("--engines", nargs="+", default=["vosk", "google"], choices=["vosk", "google"])
+    parser.add_argument("--chunk-ms", type=float, default=64.0, help="Chunk size fed to streaming engines.")
+    parser.add_argument("--realtime", action="store_true", help="Pace streaming chunks like a live microphone.")
+    parser.add_argument("--early-phrases", nargs="*", default=["stop", "exit", "quit", "goodbye"],
+                        help="Commands a stable partial may trigger early.")
+    parser.add_argument("--max-wer", type=float, help="Exit 1 if any engine's word error rate exceeds this.")
+    parser.add_argument("--output", help="Write per-file rows and the summaries to this JSON file.")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        sys.exit(f"No transcribed WAV fixtures in {args.fixtures}.")
+
+    summaries, all_rows = [], {}
+    for engine in args.engines:
+        if engine == "vosk" and not vosk_available():
+            print("Skipping vosk: the package or its model is not installed.")
+            continue
+        backend = VoskSpeechBackend() if engine == "vosk" else GoogleSpeechBackend()
+        rows = []
+        for fixture in fixtures:
+            cpu_start = time.process_time()
+            if backend.streaming:
+                row = run_streaming(backend, fixture, args.chunk_ms, args.realtime, args.early_phrases)
+            else:
+                row = run_batch(backend, fixture)
+            row.update(file=fixture["file"], reference=fixture["reference"], audio_s=round(fixture["audio_s"], 2),
+                       cpu_s=time.process_time() - cpu_start, word_errors=word_errors(fixture["reference"], row["hypothesis"]))
+            rows.append(row)
+            print(f"[{engine}] {row['file']:<28} errors={row['word_errors']} latency={row['final_latency_ms']:.0f}ms "
+                  f"hyp='{row['hypothesis']}'" + (f" ERROR {row['error']}" if row["error"] else ""))
+        all_rows[engine] = rows
+        summaries.append(summarize(engine, rows))
+
+    print(f"\n{'engine':<8} {'WER':>6} {'p50 ms':>8} {'p95 ms':>8} {'1st partial s':>14} {'early':>6} {'CPU RTF':>8} {'errors':>7}")
+    for s in summaries:
+        print(f"{s['engine']:<8} {str(s['wer']):>6} {str(s['final_latency_ms_p50']):>8} {str(s['final_latency_ms_p95']):>8} "
+              f"{str(s['first_partial_at_s_median']):>14} {s['early_commands']:>6} {str(s['cpu_real_time_factor']):>8} {s['errors']:>7}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"summaries": summaries, "files": all_rows}, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    failed = args.max_wer is not None and any(s["wer"] is not None and s["wer"] > args.max_wer for s in summaries)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
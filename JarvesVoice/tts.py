@@ -0,0 +1,430 @@
+import ast
+import hashlib
+import logging
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+import uuid
+import wave
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger("JarvisTTS")
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# "auto": SAPI on Windows, then pyttsx3; "sapi", "pyttsx3" or "file" (renders WAVs, plays nothing) force one.
+TTS_BACKEND = os.getenv("JARVIS_TTS_BACKEND", "auto").lower()
+TTS_CACHE_DIR = os.getenv("JARVIS_TTS_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "tts_cache"))
+TTS_CACHE_MAX_MB = float(os.getenv("JARVIS_TTS_CACHE_MAX_MB", "64"))
+# Longer lines are one-off answers; rendering them to disk would only cost time and space.
+TTS_CACHE_MAX_CHARS = int(os.getenv("JARVIS_TTS_CACHE_MAX_CHARS", "160"))
+TTS_WARMUP = os.getenv("JARVIS_TTS_WARMUP", "true").lower() in ("1", "true", "yes")
+TOOLS_MODULE_PATH = os.path.join(PROJECT_ROOT, "MainAgent", "tools.py")
+
+
+def wav_duration(path: str) -> float:
+    with wave.open(path, "rb") as wav:
+        return wav.getnframes() / float(wav.getframerate())
+
+
+def play_wav(path: str, cancel: Optional[threading.Event] = None) -> bool:
+    """Plays a WAV file until it ends or `cancel` is set; returns False when it was cut short."""
+    if sys.platform == "win32":
+        import winsound
+        if cancel is None:
+            winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_NODEFAULT)
+            return True
+        winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_NODEFAULT | winsound.SND_ASYNC)
+        if cancel.wait(wav_duration(path)):
+            winsound.PlaySound(None, 0)
+            return False
+        return True
+    try:
+        import simpleaudio
+        play = simpleaudio.WaveObject.from_wave_file(path).play()
+        is_playing, stop = play.is_playing, play.stop
+    except ImportError:
+        player = subprocess.Popen(["afplay", path] if sys.platform == "darwin" else ["aplay", "-q", path])
+        is_playing, stop = (lambda: player.poll() is None), player.terminate
+    while is_playing():
+        if cancel is not None and cancel.wait(0.05):
+            stop()
+            return False
+        if cancel is None:
+            time.sleep(0.05)
+    return True
+
+
+class TTSBackend(ABC):
+    """
+    Speech synthesis engine: speak directly, render to a WAV file, or play a rendered file.
+    `speak` and `play` stop early when `cancel` is set and then return False.
+    """
+    name = "base"
+
+    def voice_key(self) -> str:
+        """Identifies the voice settings; part of the cache key so a new voice never plays stale audio."""
+        return self.name
+
+    @abstractmethod
+    def speak(self, text: str, cancel: Optional[threading.Event] = None) -> bool:
+        ...
+
+    @abstractmethod
+    def render(self, text: str, path: str):
+        ...
+
+    def play(self, path: str, cancel: Optional[threading.Event] = None) -> bool:
+        return play_wav(path, cancel)
+
+
+class SapiBackend(TTSBackend):
+    name = "sapi"
+    SVSF_ASYNC = 1
+    SVSF_PURGE_BEFORE_SPEAK = 2
+    SSFM_CREATE_FOR_WRITE = 3
+    SAFT_22KHZ_16BIT_MONO = 22
+
+    def __init__(self, volume: int = 100, rate: int = 0):
+        import win32com.client
+        self._client = win32com.client
+        self.voice = win32com.client.Dispatch("SAPI.SpVoice")
+        self.voice.Volume = volume
+        self.voice.Rate = rate
+        self._render_voice = None
+
+    def voice_key(self) -> str:
+        try:
+            voice_id = self.voice.Voice.Id
+        except Exception:
+            voice_id = "default"
+        return f"sapi:{voice_id}:{self.voice.Rate}:{self.voice.Volume}"
+
+    def speak(self, text: str, cancel: Optional[threading.Event] = None) -> bool:
+        if cancel is None:
+            self.voice.Speak(text)
+            return True
+        self.voice.Speak(text, self.SVSF_ASYNC)
+        while not self.voice.WaitUntilDone(50):
+            if cancel.is_set():
+                self.voice.Speak("", self.SVSF_ASYNC | self.SVSF_PURGE_BEFORE_SPEAK)
+                return False
+        return True
+
+    def render(self, text: str, path: str):
+        if self._render_voice is None:
+            self._render_voice = self._client.Dispatch("SAPI.SpVoice")
+            self._render_voice.Voice = self.voice.Voice
+            self._render_voice.Rate = self.voice.Rate
+            self._render_voice.Volume = self.voice.Volume
+        stream = self._client.Dispatch("SAPI.SpFileStream")
+        stream.Format.Type = self.SAFT_22KHZ_16BIT_MONO
+        stream.Open(path, self.SSFM_CREATE_FOR_WRITE)
+        try:
+            self._render_voice.AudioOutputStream = stream
+            self._render_voice.Speak(text)
+        finally:
+            stream.Close()
+
+
+class Pyttsx3Backend(TTSBackend):
+    name = "pyttsx3"
+
+    def __init__(self, rate: Optional[int] = None):
+        import pyttsx3
+        self.engine = pyttsx3.init()
+        if rate is not None:
+            self.engine.setProperty("rate", rate)
+
+    def voice_key(self) -> str:
+        return f"pyttsx3:{self.engine.getProperty('voice')}:{self.engine.getProperty('rate')}"
+
+    def speak(self, text: str, cancel: Optional[threading.Event] = None) -> bool:
+        # pyttsx3 can only be stopped from inside its own loop, so cancellation is checked at word boundaries.
+        token = None
+        if cancel is not None:
+            token = self.engine.connect("started-word", lambda *args, **kwargs: cancel.is_set() and self.engine.stop())
+        try:
+            self.engine.say(text)
+            self.engine.runAndWait()
+        finally:
+            if token is not None:
+                self.engine.disconnect(token)
+        return cancel is None or not cancel.is_set()
+
+    def render(self, text: str, path: str):
+        self.engine.save_to_file(text, path)
+        self.engine.runAndWait()
+
+
+class FileBackend(TTSBackend):
+    """
+    Stand-in for machines without a speech engine (Linux tests, benchmarks): renders silent 16 kHz
+    WAVs sized like speech, records what was spoken and played, and plays nothing.
+    """
+    name = "file"
+    SAMPLE_RATE = 16000
+
+    def __init__(self, seconds_per_char: float = 0.06, realtime: bool = False):
+        self.seconds_per_char = seconds_per_char
+        self.realtime = realtime
+        self.spoken: List[str] = []
+        self.played: List[str] = []
+
+    def _duration(self, text: str) -> float:
+        return max(0.2, len(text) * self.seconds_per_char)
+
+    def _wait(self, seconds: float, cancel: Optional[threading.Event]) -> bool:
+        if not self.realtime:
+            return not (cancel is not None and cancel.is_set())
+        if cancel is None:
+            time.sleep(seconds)
+            return True
+        return not cancel.wait(seconds)
+
+    def speak(self, text: str, cancel: Optional[threading.Event] = None) -> bool:
+        self.spoken.append(text)
+        return self._wait(self._duration(text), cancel)
+
+    def render(self, text: str, path: str):
+        with wave.open(path, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.SAMPLE_RATE)
+            wav.writeframes(b"\x00\x00" * int(self.SAMPLE_RATE * self._duration(text)))
+
+    def play(self, path: str, cancel: Optional[threading.Event] = None) -> bool:
+        self.played.append(path)
+        return self._wait(wav_duration(path), cancel)
+
+
+def build_tts_backend(engine: str = TTS_BACKEND) -> Optional[TTSBackend]:
+    """First backend of `engine` that initializes; None when no speech engine is available."""
+    candidates = {"auto": ("sapi", "pyttsx3"), "sapi": ("sapi",), "pyttsx3": ("pyttsx3",), "file": ("file",)}
+    factories = {"sapi": SapiBackend, "pyttsx3": Pyttsx3Backend, "file": FileBackend}
+    for name in candidates.get(engine, ("sapi", "pyttsx3")):
+        if name == "sapi" and engine == "auto" and sys.platform != "win32":
+            continue
+        try:
+            backend = factories[name]()
+            logger.info(f"Text-to-speech backend: {name}.")
+            return backend
+        except Exception as e:
+            logger.warning(f"TTS backend '{name}' unavailable: {e}")
+    return None
+
+
+class TTSCache:
+    """
+    Rendered phrases on disk, named by a hash of the voice settings and the text. File mtimes
+    track recency; the least recently played files are removed beyond `max_bytes`.
+    """
+
+    def __init__(self, directory: str = TTS_CACHE_DIR, max_bytes: int = int(TTS_CACHE_MAX_MB * 1024 * 1024)):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "renders": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(voice_key: str, text: str) -> str:
+        return hashlib.sha256(f"{voice_key}\n{text}".encode("utf-8")).hexdigest()[:32]
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.wav")
+
+    def lookup(self, key: str) -> Optional[str]:
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return path
+
+    def contains(self, key: str) -> bool:
+        return os.path.exists(self.path(key))
+
+    def store(self, key: str, render: Callable[[str], None]) -> Optional[str]:
+        """Renders into a temporary file and moves it into place, so readers never see a partial WAV."""
+        tmp = os.path.join(self.directory, f".{key}.{uuid.uuid4().hex[:8]}.tmp.wav")
+        try:
+            render(tmp)
+            if not os.path.exists(tmp) or os.path.getsize(tmp) == 0:
+                return None
+            os.replace(tmp, self.path(key))
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        self.stats["renders"] += 1
+        self.evict()
+        return self.path(key)
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._files())
+
+    def _files(self) -> List[tuple]:
+        files = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".wav") or name.startswith("."):
+                continue
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, name))
+        return files
+
+    def evict(self) -> int:
+        with self._lock:
+            files = sorted(self._files())
+            total = sum(size for _, size, _ in files)
+            removed = 0
+            for _, size, name in files:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            self.stats["evictions"] += removed
+            return removed
+
+
+class TextToSpeech:
+    """
+    Speaks through a backend and plays short phrases from the on-disk cache when they were rendered
+    before. A missed phrase is spoken directly and rendered on a background thread for next time.
+
+    Backends are built by `backend_factory` on the thread that uses them, because SAPI (win32com)
+    objects may only be used from the thread that created them.
+    """
+
+    def __init__(self, backend_factory: Callable[[], Optional[TTSBackend]] = build_tts_backend,
+                 cache: Optional[TTSCache] = None, max_cached_chars: int = TTS_CACHE_MAX_CHARS):
+        self.backend_factory = backend_factory
+        self.backend = backend_factory()
+        if self.backend is None:
+            raise RuntimeError("No text-to-speech backend is available.")
+        self.cache = cache
+        self.max_cached_chars = max_cached_chars
+        self._voice_key = self.backend.voice_key()
+        self._renders: "queue.Queue[str]" = queue.Queue()
+        self._render_thread: Optional[threading.Thread] = None
+        self._pending: set = set()
+        self._pending_lock = threading.Lock()
+
+    def cacheable(self, text: str) -> bool:
+        return self.cache is not None and 0 < len(text) <= self.max_cached_chars
+
+    def cached_path(self, text: str) -> Optional[str]:
+        if not self.cacheable(text):
+            return None
+        return self.cache.lookup(TTSCache.key(self._voice_key, text))
+
+    def say(self, text: str, cancel: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """
+        Speaks `text` and blocks until it ends or `cancel` is set.
+        Returns {"cached": bool, "completed": bool, "ms": wall time}.
+        """
+        start = time.perf_counter()
+        path = self.cached_path(text)
+        if path is not None:
+            try:
+                completed = self.backend.play(path, cancel)
+                return {"cached": True, "completed": completed, "ms": (time.perf_counter() - start) * 1000}
+            except Exception as e:
+                logger.warning(f"Playing cached speech failed ({e}); synthesizing instead.")
+        completed = self.backend.speak(text, cancel)
+        if self.cacheable(text):
+            self.render_later([text])
+        return {"cached": False, "completed": completed, "ms": (time.perf_counter() - start) * 1000}
+
+    def render_later(self, phrases: Iterable[str]) -> int:
+        """Queues phrases that are not cached yet for background rendering; returns how many were queued."""
+        queued = 0
+        for text in phrases:
+            if not self.cacheable(text):
+                continue
+            key = TTSCache.key(self._voice_key, text)
+            with self._pending_lock:
+                if key in self._pending or self.cache.contains(key):
+                    continue
+                self._pending.add(key)
+            self._renders.put(text)
+            queued += 1
+        if queued and (self._render_thread is None or not self._render_thread.is_alive()):
+            self._render_thread = threading.Thread(target=self._render_loop, name="JarvisTTSRender", daemon=True)
+            self._render_thread.start()
+        return queued
+
+    def warm_up(self, phrases: Iterable[str]) -> int:
+        """Pre-renders known phrases in the background so their first use already plays from cache."""
+        queued = self.render_later(phrases)
+        if queued:
+            logger.info(f"Pre-rendering {queued} phrase(s) into the speech cache at {self.cache.directory}.")
+        return queued
+
+    def wait_for_renders(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._pending_lock:
+                if not self._pending:
+                    return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+
+    def _render_loop(self):
+        try:
+            import pythoncom
+            pythoncom.CoInitialize()
+        except ImportError:
+            pass
+        try:
+            renderer = self.backend_factory()
+        except Exception as e:
+            renderer = None
+            logger.error(f"Could not build the speech renderer: {e}")
+        while True:
+            try:
+                text = self._renders.get(timeout=5)
+            except queue.Empty:
+                with self._pending_lock:
+                    if not self._pending:
+                        return
+                continue
+            key = TTSCache.key(self._voice_key, text)
+            try:
+                if renderer is not None:
+                    self.cache.store(key, lambda path: renderer.render(text, path))
+            except Exception as e:
+                logger.warning(f"Rendering '{text[:40]}' into the speech cache failed: {e}")
+            finally:
+                with self._pending_lock:
+                    self._pending.discard(key)
+
+
+def tool_phrases(path: str = TOOLS_MODULE_PATH) -> List[str]:
+    """Fixed lines the MainAgent tools pass to `narrator.say` / `narrator.speak` (f-strings excluded)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+    except (OSError, SyntaxError) as e:
+        logger.debug(f"Could not read tool phrases from {path}: {e}")
+        return []
+    phrases = []
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and node.func.attr in ("say", "speak") and isinstance(node.func.value, ast.Name)
+                and node.func.value.id == "narrator" and node.args
+                and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str)):
+            phrases.append(node.args[0].value)
+    return list(dict.fromkeys(phrases))
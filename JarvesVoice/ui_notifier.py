@@ -0,0 +1,148 @@
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import requests
+
+logger = logging.getLogger("JarvisUINotifier")
+
+UI_QUEUE_MAX = int(os.getenv("JARVIS_UI_QUEUE_MAX", "256"))
+UI_BATCH_MAX = int(os.getenv("JARVIS_UI_BATCH_MAX", "32"))
+# How long the sender lingers after the first event of a burst so the rest ride in the same request.
+UI_BATCH_WINDOW_S = float(os.getenv("JARVIS_UI_BATCH_WINDOW", "0.02"))
+UI_POST_TIMEOUT_S = float(os.getenv("JARVIS_UI_POST_TIMEOUT", "0.5"))
+UI_RETRY_MAX_S = float(os.getenv("JARVIS_UI_RETRY_MAX", "5"))
+# Only the newest of consecutive queued events of these types is worth sending.
+COALESCED_EVENTS = ("partial_transcript",)
+
+
+class UINotifier:
+    """
+    Delivers UI events to the Flask app from one background thread over a keep-alive session.
+    Events are sent in order; a burst goes out as one `{"events": [...]}` request. The queue is
+    bounded: while the UI is unreachable the sender backs off and the oldest events are dropped.
+    """
+
+    def __init__(self, base_url: str, max_queue: int = UI_QUEUE_MAX, batch_max: int = UI_BATCH_MAX,
+                 batch_window_s: float = UI_BATCH_WINDOW_S, timeout_s: float = UI_POST_TIMEOUT_S):
+        self.endpoint = f"{base_url.rstrip('/')}/ui_event"
+        self.batch_max = batch_max
+        self.batch_window_s = batch_window_s
+        self.timeout_s = timeout_s
+        self.stats = {"queued": 0, "sent": 0, "requests": 0, "coalesced": 0, "dropped": 0, "failures": 0}
+        self._events: Deque[Dict[str, Any]] = deque()
+        self._max_queue = max_queue
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._closed = False
+        self._stop = threading.Event()
+        self._session = requests.Session()
+        self._thread = threading.Thread(target=self._run, name="JarvisUINotifier", daemon=True)
+        self._thread.start()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def notify(self, event_type: str, text: Optional[str] = None):
+        """Queues an event; never blocks on the network."""
+        payload = {"event": event_type}
+        if text:
+            payload["text"] = text
+        with self._cond:
+            if self._closed:
+                return
+            last = self._events[-1] if self._events else None
+            if last is not None and last["event"] == event_type and (event_type in COALESCED_EVENTS or last == payload):
+                self._events[-1] = payload
+                self.stats["coalesced"] += 1
+                return
+            if len(self._events) >= self._max_queue:
+                self._events.popleft()
+                self.stats["dropped"] += 1
+            self._events.append(payload)
+            self.stats["queued"] += 1
+            self._cond.notify()
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Waits until every queued event has been sent or dropped."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._events or self._in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 2.0):
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._stop.set()
+        self._thread.join(timeout=timeout)
+        self._session.close()
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        with self._cond:
+            while not self._events and not self._closed:
+                self._cond.wait()
+            if not self._events:
+                return []
+        if self.batch_window_s > 0:
+            time.sleep(self.batch_window_s)
+        with self._cond:
+            batch = [self._events.popleft() for _ in range(min(self.batch_max, len(self._events)))]
+            self._in_flight = len(batch)
+            return batch
+
+    def _requeue(self, batch: List[Dict[str, Any]]):
+        """Puts an undelivered batch back in front; what no longer fits is the oldest and is dropped."""
+        with self._cond:
+            for payload in reversed(batch):
+                if len(self._events) >= self._max_queue:
+                    self.stats["dropped"] += 1
+                    continue
+                self._events.appendleft(payload)
+
+    def _run(self):
+        backoff = 0.0
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return
+            try:
+                body = batch[0] if len(batch) == 1 else {"events": batch}
+                self._session.post(self.endpoint, json=body, timeout=self.timeout_s).raise_for_status()
+                self.stats["sent"] += len(batch)
+                self.stats["requests"] += 1
+                backoff = 0.0
+            except requests.exceptions.RequestException as e:
+                self.stats["failures"] += 1
+                logger.debug(f"UI notification of {len(batch)} event(s) failed: {e}")
+                self._requeue(batch)
+                backoff = min(UI_RETRY_MAX_S, max(0.25, backoff * 2))
+            finally:
+                with self._cond:
+                    self._in_flight = 0
+                    self._cond.notify_all()
+            if backoff and self._stop.wait(backoff):
+                return
+
+
+_notifiers: Dict[str, UINotifier] = {}
+_notifiers_lock = threading.Lock()
+
+
+def get_ui_notifier(base_url: str) -> UINotifier:
+    """The process-wide notifier for `base_url`, so every Jarvis instance (including the narrator's) shares one sender and one order."""
+    key = base_url.rstrip("/")
+    with _notifiers_lock:
+        notifier = _notifiers.get(key)
+        if notifier is None or notifier.closed:
+            notifier = _notifiers[key] = UINotifier(key)
+        return notifier
@@ -0,0 +1,327 @@
+import argparse
+import glob
+import logging
+import os
+import time
+import wave
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger("WakeWordSpotter")
+
+WAKE_WORD_TEMPLATES_DIR = os.getenv("JARVIS_WAKE_WORD_TEMPLATES", os.path.join(os.path.dirname(os.path.abspath(__file__)), "wake_word_templates"))
+# DTW distance below which a window counts as the wake word; "auto" derives it from the enrolled templates.
+WAKE_WORD_THRESHOLD = os.getenv("JARVIS_WAKE_WORD_THRESHOLD", "auto")
+WAKE_WORD_THRESHOLD_MARGIN = float(os.getenv("JARVIS_WAKE_WORD_THRESHOLD_MARGIN", "1.5"))
+# Windows whose loudest frame stays below this RMS (int16 units) are not scored at all.
+WAKE_WORD_MIN_RMS = float(os.getenv("JARVIS_WAKE_WORD_MIN_RMS", "300"))
+WAKE_WORD_REFRACTORY_S = float(os.getenv("JARVIS_WAKE_WORD_REFRACTORY", "1.0"))
+
+FEATURE_RATE = 16000
+FRAME_LEN = 400      # 25 ms
+FRAME_HOP = 160      # 10 ms
+N_FFT = 512
+N_MELS = 26
+N_CEPS = 13
+SCORE_EVERY_FRAMES = 10
+
+
+def _mel_filterbank(sample_rate: int = FEATURE_RATE, n_fft: int = N_FFT, n_mels: int = N_MELS,
+                    f_min: float = 60.0, f_max: float = 7600.0) -> np.ndarray:
+    def hz_to_mel(f): return 2595.0 * np.log10(1.0 + f / 700.0)
+    def mel_to_hz(m): return 700.0 * (10 ** (m / 2595.0) - 1.0)
+    mels = np.linspace(hz_to_mel(f_min), hz_to_mel(f_max), n_mels + 2)
+    bins = np.floor((n_fft + 1) * mel_to_hz(mels) / sample_rate).astype(int)
+    bank = np.zeros((n_mels, n_fft // 2 + 1), dtype=np.float32)
+    for m in range(1, n_mels + 1):
+        left, centre, right = bins[m - 1], bins[m], bins[m + 1]
+        if centre > left:
+            bank[m - 1, left:centre] = (np.arange(left, centre) - left) / (centre - left)
+        if right > centre:
+            bank[m - 1, centre:right] = (right - np.arange(centre, right)) / (right - centre)
+    return bank
+
+
+def _dct_matrix(n_in: int = N_MELS, n_out: int = N_CEPS) -> np.ndarray:
+    k = np.arange(n_out)[:, None]
+    n = np.arange(n_in)[None, :]
+    return (np.cos(np.pi * k * (2 * n + 1) / (2 * n_in)) * np.sqrt(2.0 / n_in)).astype(np.float32)
+
+
+_MEL_BANK = _mel_filterbank()
+_DCT = _dct_matrix()
+_WINDOW = np.hamming(FRAME_LEN).astype(np.float32)
+
+
+def mfcc_frames(samples: np.ndarray) -> np.ndarray:
+    """
+    MFCCs (c1..c12) and the RMS of every complete 25 ms frame of 16 kHz float samples (int16 scale).
+    Returns an array of shape (n_frames, N_CEPS) whose last column is the frame RMS.
+    """
+    n_frames = 1 + (len(samples) - FRAME_LEN) // FRAME_HOP if len(samples) >= FRAME_LEN else 0
+    if n_frames <= 0:
+        return np.zeros((0, N_CEPS), dtype=np.float32)
+    idx = np.arange(FRAME_LEN)[None, :] + FRAME_HOP * np.arange(n_frames)[:, None]
+    frames = samples[idx].astype(np.float32)
+    rms = np.sqrt(np.mean(frames ** 2, axis=1))
+    frames = np.concatenate([frames[:, :1], frames[:, 1:] - 0.97 * frames[:, :-1]], axis=1) * _WINDOW
+    power = np.abs(np.fft.rfft(frames, n=N_FFT)) ** 2 / N_FFT
+    ceps = np.log(power @ _MEL_BANK.T + 1e-6) @ _DCT.T
+    return np.concatenate([ceps[:, 1:], rms[:, None]], axis=1).astype(np.float32)
+
+
+class StreamResampler:
+    """Linear-interpolation resampler that keeps its phase across chunks."""
+
+    def __init__(self, source_rate: int, target_rate: int = FEATURE_RATE):
+        self.step = source_rate / target_rate
+        self._pos = 0.0
+        self._prev: Optional[np.ndarray] = None
+
+    def __call__(self, chunk: np.ndarray) -> np.ndarray:
+        if self.step == 1.0 or len(chunk) == 0:
+            return chunk
+        buf = chunk if self._prev is None else np.concatenate([self._prev, chunk])
+        positions = np.arange(self._pos, len(buf) - 1, self.step)
+        out = np.interp(positions, np.arange(len(buf)), buf).astype(np.float32)
+        next_pos = positions[-1] + self.step if len(positions) else self._pos
+        self._pos = next_pos - (len(buf) - 1)
+        self._prev = buf[-1:]
+        return out
+
+
+def read_wav(path: str) -> np.ndarray:
+    """Mono 16 kHz float samples (int16 scale) of a PCM WAV file."""
+    with wave.open(path, "rb") as wav:
+        rate, width, channels = wav.getframerate(), wav.getsampwidth(), wav.getnchannels()
+        raw = wav.readframes(wav.getnframes())
+    dtype = {1: np.uint8, 2: np.int16, 4: np.int32}[width]
+    samples = np.frombuffer(raw, dtype=dtype).astype(np.float32)
+    if width == 1:
+        samples = (samples - 128.0) * 256.0
+    elif width == 4:
+        samples /= 65536.0
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return StreamResampler(rate)(samples) if rate != FEATURE_RATE else samples
+
+
+def _normalized(features: np.ndarray) -> np.ndarray:
+    ceps = features[:, :-1]
+    return ceps - ceps.mean(axis=0, keepdims=True)
+
+
+def dtw_subsequence(window: np.ndarray, template: np.ndarray, last_rows: int = 1) -> float:
+    """
+    Length-normalized DTW distance of `template` matched against a stretch of `window` that ends within
+    the last `last_rows` frames and may start anywhere. Steps advance the template by 0, 1 or 2 frames
+    per window frame, so each row depends only on the previous one and is computed with numpy.
+    """
+    n, m = len(window), len(template)
+    cost = np.sqrt(((window[:, None, :] - template[None, :, :]) ** 2).sum(axis=2))
+    inf = np.float32(np.inf)
+    prev_d = np.full(m + 1, inf, dtype=np.float32)
+    prev_l = np.zeros(m + 1, dtype=np.float32)
+    best = float("inf")
+    for i in range(n):
+        prev_d[0], prev_l[0] = 0.0, 0.0
+        stay = prev_d[1:]
+        one = prev_d[:-1]
+        two = np.concatenate([[inf], prev_d[:-2]])
+        choice = np.argmin(np.stack([one, stay, two]), axis=0)
+        base = np.choose(choice, [one, stay, two])
+        length = np.choose(choice, [prev_l[:-1], prev_l[1:], np.concatenate([[0.0], prev_l[:-2]])])
+        row_d = np.empty(m + 1, dtype=np.float32)
+        row_l = np.empty(m + 1, dtype=np.float32)
+        row_d[0], row_l[0] = 0.0, 0.0
+        row_d[1:] = base + cost[i]
+        row_l[1:] = length + 1
+        if i >= n - last_rows and np.isfinite(row_d[m]):
+            best = min(best, float(row_d[m] / row_l[m]))
+        prev_d, prev_l = row_d, row_l
+    return best
+
+
+class WakeWordTemplates:
+    """MFCC templates of enrolled wake-word recordings (`*.wav` in a directory)."""
+
+    def __init__(self, features: Dict[str, np.ndarray]):
+        self.features = features
+        self.normalized = {name: _normalized(f) for name, f in features.items()}
+
+    @classmethod
+    def from_directory(cls, directory: str = WAKE_WORD_TEMPLATES_DIR) -> "WakeWordTemplates":
+        features = {}
+        for path in sorted(glob.glob(os.path.join(directory, "*.wav"))):
+            feats = _trim_silence(mfcc_frames(read_wav(path)))
+            if len(feats) >= 20:
+                features[os.path.basename(path)] = feats
+            else:
+                logger.warning(f"Wake-word template {path} is too short or silent; skipped.")
+        return cls(features)
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    @property
+    def max_frames(self) -> int:
+        return max((len(f) for f in self.features.values()), default=0)
+
+    def calibrated_threshold(self, margin: float = WAKE_WORD_THRESHOLD_MARGIN) -> float:
+        """Mean leave-one-out distance between the templates, times `margin`."""
+        names = list(self.normalized)
+        if len(names) < 2:
+            return 6.0
+        distances = [dtw_subsequence(self.normalized[a], self.normalized[b])
+                     for a in names for b in names if a != b]
+        return float(np.mean(distances)) * margin
+
+
+def _trim_silence(features: np.ndarray, min_rms: float = WAKE_WORD_MIN_RMS) -> np.ndarray:
+    voiced = np.nonzero(features[:, -1] >= min_rms)[0]
+    if len(voiced) == 0:
+        return features[:0]
+    return features[max(0, voiced[0] - 3): voiced[-1] + 4]
+
+
+class WakeWordDetector:
+    """
+    Streaming template-based keyword spotter. `process(chunk)` takes raw microphone samples
+    (int16, any sample rate), extracts MFCC frames incrementally, and every SCORE_EVERY_FRAMES
+    frames matches the recent audio against every template with subsequence DTW. Quiet stretches
+    are skipped without scoring. Returns a detection dict when a template matches.
+    """
+
+    def __init__(self, templates: WakeWordTemplates, threshold: Optional[float] = None,
+                 sample_rate: int = FEATURE_RATE, min_rms: float = WAKE_WORD_MIN_RMS,
+                 refractory_s: float = WAKE_WORD_REFRACTORY_S):
+        if not len(templates):
+            raise ValueError("No wake-word templates; record some with `python JarvesVoice/wake_word.py enroll`.")
+        self.templates = templates
+        self.threshold = threshold if threshold is not None else templates.calibrated_threshold()
+        self.min_rms = min_rms
+        self.refractory_frames = int(refractory_s * 1000 / 10)
+        self.window_frames = int(templates.max_frames * 1.5)
+        self.sample_rate = sample_rate
+        self.stats = {"frames": 0, "windows_scored": 0, "windows_gated": 0, "triggers": 0}
+        self.reset()
+
+    def reset(self, sample_rate: Optional[int] = None):
+        if sample_rate:
+            self.sample_rate = sample_rate
+        self._resampler = StreamResampler(self.sample_rate)
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._features: Deque[np.ndarray] = deque(maxlen=self.window_frames)
+        self._frame_index = 0
+        self._since_score = 0
+        self._quiet_until = 0
+        self.best_score = float("inf")
+
+    def process(self, chunk: Any) -> Optional[Dict[str, Any]]:
+        if isinstance(chunk, (bytes, bytearray)):
+            chunk = np.frombuffer(chunk, dtype=np.int16)
+        samples = self._resampler(np.asarray(chunk, dtype=np.float32))
+        self._pending = np.concatenate([self._pending, samples])
+        feats = mfcc_frames(self._pending)
+        if len(feats) == 0:
+            return None
+        self._pending = self._pending[len(feats) * FRAME_HOP:]
+        self._features.extend(feats)
+        self._frame_index += len(feats)
+        self.stats["frames"] += len(feats)
+        self._since_score += len(feats)
+        if self._since_score < SCORE_EVERY_FRAMES or len(self._features) < self.window_frames // 2:
+            return None
+        rows = self._since_score
+        self._since_score = 0
+        if self._frame_index < self._quiet_until:
+            return None
+        return self._score(rows)
+
+    def _score(self, new_rows: int) -> Optional[Dict[str, Any]]:
+        window = np.asarray(self._features)
+        if window[:, -1].max() < self.min_rms or window[-new_rows - 10:, -1].max() < self.min_rms:
+            self.stats["windows_gated"] += 1
+            return None
+        self.stats["windows_scored"] += 1
+        normalized = _normalized(window)
+        best_name, best = None, float("inf")
+        for name, template in self.templates.normalized.items():
+            score = dtw_subsequence(normalized, template, last_rows=new_rows)
+            if score < best:
+                best_name, best = name, score
+        self.best_score = min(self.best_score, best)
+        if best > self.threshold:
+            return None
+        self.stats["triggers"] += 1
+        self._quiet_until = self._frame_index + self.refractory_frames
+        self._features.clear()
+        return {"score": round(best, 3), "threshold": round(self.threshold, 3), "template": best_name,
+                "at_s": round(self._frame_index * FRAME_HOP / FEATURE_RATE, 2)}
+
+
+def load_wake_word_detector(directory: str = WAKE_WORD_TEMPLATES_DIR, threshold: str = WAKE_WORD_THRESHOLD,
+                            sample_rate: int = FEATURE_RATE) -> Optional[WakeWordDetector]:
+    """Detector built from the enrolled templates, or None when none are enrolled."""
+    templates = WakeWordTemplates.from_directory(directory)
+    if not len(templates):
+        logger.warning(f"No wake-word templates in {directory}; enroll with `python JarvesVoice/wake_word.py enroll`.")
+        return None
+    start = time.perf_counter()
+    detector = WakeWordDetector(templates, None if threshold == "auto" else float(threshold), sample_rate=sample_rate)
+    logger.info(f"Wake-word spotter ready: {len(templates)} template(s), threshold {detector.threshold:.2f} "
+                f"({(time.perf_counter() - start) * 1000:.0f} ms).")
+    return detector
+
+
+def _enroll(directory: str, count: int, phrase_seconds: float):
+    import speech_recognition as sr
+    os.makedirs(directory, exist_ok=True)
+    recognizer = sr.Recognizer()
+    existing = len(glob.glob(os.path.join(directory, "*.wav")))
+    with sr.Microphone(sample_rate=FEATURE_RATE) as source:
+        recognizer.adjust_for_ambient_noise(source, duration=1)
+        for i in range(count):
+            input(f"[{i + 1}/{count}] Press Enter, then say the wake word once...")
+            audio = recognizer.listen(source, timeout=5, phrase_time_limit=phrase_seconds)
+            path = os.path.join(directory, f"wake_{existing + i + 1:02d}.wav")
+            with open(path, "wb") as f:
+                f.write(audio.get_wav_data(convert_rate=FEATURE_RATE, convert_width=2))
+            print(f"Saved {path}")
+    templates = WakeWordTemplates.from_directory(directory)
+    print(f"{len(templates)} usable template(s); calibrated threshold {templates.calibrated_threshold():.2f}.")
+
+
+def _score_files(directory: str, paths: List[str]):
+    detector = load_wake_word_detector(directory)
+    if detector is None:
+        return
+    for path in paths:
+        detector.reset()
+        samples = read_wav(path)
+        triggers = [d for start in range(0, len(samples), 1024) if (d := detector.process(samples[start:start + 1024]))]
+        print(f"{path}: best score {detector.best_score:.2f} (threshold {detector.threshold:.2f}), triggers {triggers}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Enroll and test the local wake-word spotter.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    enroll = sub.add_parser("enroll", help="Record wake-word templates from the microphone.")
+    enroll.add_argument("--count", type=int, default=5)
+    enroll.add_argument("--seconds", type=float, default=2.0, help="Maximum length of one recording.")
+    enroll.add_argument("--dir", default=WAKE_WORD_TEMPLATES_DIR)
+    score = sub.add_parser("score", help="Print the best match score of WAV files.")
+    score.add_argument("wavs", nargs="+")
+    score.add_argument("--dir", default=WAKE_WORD_TEMPLATES_DIR)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(name)s - %(message)s')
+    if args.command == "enroll":
+        _enroll(args.dir, args.count, args.seconds)
+    else:
+        _score_files(args.dir, args.wavs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import argparse
+import glob
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from wake_word import (FEATURE_RATE, WAKE_WORD_TEMPLATES_DIR, WakeWordDetector, WakeWordTemplates, read_wav)
+
+
+def run_file(detector: WakeWordDetector, path: str, chunk_samples: int) -> Dict[str, Any]:
+    """Streams one WAV through the detector in microphone-sized int16 chunks."""
+    samples = read_wav(path)
+    detector.reset()
+    triggers: List[Dict[str, Any]] = []
+    chunk_ms: List[float] = []
+    cpu_start = time.process_time()
+    for start in range(0, len(samples), chunk_samples):
+        chunk = np.clip(samples[start:start + chunk_samples], -32768, 32767).astype(np.int16).tobytes()
+        t0 = time.perf_counter()
+        detection = detector.process(chunk)
+        chunk_ms.append((time.perf_counter() - t0) * 1000)
+        if detection:
+            triggers.append(detection)
+    audio_s = len(samples) / FEATURE_RATE
+    return {
+        "file": os.path.basename(path), "audio_s": round(audio_s, 2), "triggers": len(triggers),
+        "first_trigger_s": triggers[0]["at_s"] if triggers else None,
+        "best_score": round(detector.best_score, 3) if np.isfinite(detector.best_score) else None,
+        "cpu_s": time.process_time() - cpu_start,
+        "chunk_ms_p95": sorted(chunk_ms)[int(0.95 * (len(chunk_ms) - 1))] if chunk_ms else 0.0,
+    }
+
+
+def rates_at(threshold: float, positives: List[Dict[str, Any]], negatives: List[Dict[str, Any]]) -> Dict[str, float]:
+    """False-reject / false-accept rates if the detector fired whenever a file's best score <= threshold."""
+    def fired(row): return row["best_score"] is not None and row["best_score"] <= threshold
+    frr = sum(1 for r in positives if not fired(r)) / len(positives) if positives else 0.0
+    far = sum(1 for r in negatives if fired(r)) / len(negatives) if negatives else 0.0
+    return {"threshold": round(threshold, 3), "frr": round(frr, 3), "far": round(far, 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="False-accept / false-reject rates and CPU cost of the wake-word spotter on WAV fixtures.")
+    parser.add_argument("fixtures", help="Directory with positive/*.wav (contain the wake word) and negative/*.wav (do not).")
+    parser.add_argument("--templates", default=WAKE_WORD_TEMPLATES_DIR)
+    parser.add_argument("--threshold", default="auto", help="DTW threshold, or 'auto' to calibrate from the templates.")
+    parser.add_argument("--chunk-ms", type=float, default=64.0, help="Chunk size fed per call (64 ms = 1024 samples at 16 kHz).")
+    parser.add_argument("--sweep", nargs="*", type=float, help="Also report FRR/FAR at these thresholds (default: around the threshold).")
+    parser.add_argument("--max-frr", type=float, help="Exit 1 if the false-reject rate exceeds this.")
+    parser.add_argument("--max-far", type=float, help="Exit 1 if the false-accept rate exceeds this.")
+    parser.add_argument("--output", help="Write per-file rows and the summary to this JSON file.")
+    args = parser.parse_args()
+
+    templates = WakeWordTemplates.from_directory(args.templates)
+    if not len(templates):
+        sys.exit(f"No wake-word templates in {args.templates}.")
+    detector = WakeWordDetector(templates, None if args.threshold == "auto" else float(args.threshold))
+    chunk_samples = max(1, int(FEATURE_RATE * args.chunk_ms / 1000))
+
+    rows = {label: [run_file(detector, path, chunk_samples)
+                    for path in sorted(glob.glob(os.path.join(args.fixtures, label, "*.wav")))]
+            for label in ("positive", "negative")}
+    positives, negatives = rows["positive"], rows["negative"]
+    if not positives and not negatives:
+        sys.exit(f"No fixtures under {args.fixtures}/positive or {args.fixtures}/negative.")
+
+    for label, label_rows in rows.items():
+        for r in label_rows:
+            print(f"[{label}] {r['file']:<32} best={r['best_score']} triggers={r['triggers']} first_at={r['first_trigger_s']}")
+
+    audio_s = sum(r["audio_s"] for r in positives + negatives)
+    cpu_s = sum(r["cpu_s"] for r in positives + negatives)
+    negative_hours = sum(r["audio_s"] for r in negatives) / 3600
+    latencies = [r["audio_s"] - r["first_trigger_s"] for r in positives if r["first_trigger_s"] is not None]
+    summary = {
+        "templates": len(templates), "threshold": round(detector.threshold, 3),
+        "frr": round(sum(1 for r in positives if not r["triggers"]) / len(positives), 3) if positives else None,
+        "far": round(sum(1 for r in negatives if r["triggers"]) / len(negatives), 3) if negatives else None,
+        "false_accepts_per_hour": round(sum(r["triggers"] for r in negatives) / negative_hours, 2) if negative_hours else None,
+        "trigger_before_end_s_median": round(statistics.median(latencies), 2) if latencies else None,
+        "cpu_percent_of_one_core": round(100 * cpu_s / audio_s, 2) if audio_s else None,
+        "chunk_ms_p95": round(max((r["chunk_ms_p95"] for r in positives + negatives), default=0.0), 2),
+        "windows": dict(detector.stats),
+    }
+    sweep = args.sweep or [round(detector.threshold * f, 3) for f in (0.7, 0.8, 0.9, 1.0, 1.1, 1.25, 1.5)]
+    summary["sweep"] = [rates_at(t, positives, negatives) for t in sweep]
+
+    print(f"\nThreshold {summary['threshold']} over {len(positives)} positive / {len(negatives)} negative files")
+    print(f"  FRR {summary['frr']}  FAR {summary['far']}  false accepts/hour {summary['false_accepts_per_hour']}")
+    print(f"  CPU {summary['cpu_percent_of_one_core']}% of one core, p95 chunk {summary['chunk_ms_p95']} ms")
+    print(f"\n{'threshold':>10} {'FRR':>7} {'FAR':>7}")
+    for point in summary["sweep"]:
+        print(f"{point['threshold']:>10.3f} {point['frr']:>7.3f} {point['far']:>7.3f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"summary": summary, "files": rows}, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    failed = (args.max_frr is not None and (summary["frr"] or 0) > args.max_frr) or \
+             (args.max_far is not None and (summary["far"] or 0) > args.max_far)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
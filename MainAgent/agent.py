@@ -1,13 +1,14 @@
 import logging
 import uuid
 import sys
+import threading
 import time
 import os
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from langchain_core.runnables import RunnableConfig
-from langchain_core.tools import ToolException, BaseTool
-from langchain.agents import create_react_agent, AgentExecutor
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.tools import ToolException, BaseTool, render_text_description
+from langchain.agents import create_react_agent, create_tool_calling_agent
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_google_genai import ChatGoogleGenerativeAI
 from dotenv import load_dotenv
 
@@ -26,6 +27,12 @@ if not GOOGLE_API_KEY:
     raise ValueError("Missing Google API Key. Set MAINAGENT_API_KEY in .env file.")
 
 LLM_MODEL = os.getenv("GOOGLE_LLM_MODEL", "gemini-1.5-flash-latest")
+AGENT_ENGINES = ("react", "tool_calling")
+DEFAULT_AGENT_ENGINE = os.getenv("AGENT_ENGINE", "react").lower()
+FAST_PATH_ROUTER_ENABLED = os.getenv("JARVIS_FAST_PATH_ROUTER", "true").lower() in ("1", "true", "yes")
+WARMUP_PRIME = os.getenv("JARVIS_WARMUP_PRIME", "false").lower() in ("1", "true", "yes")
+# "all", "none", or a comma-separated list of tool names whose subsystems are imported during warm-up.
+WARMUP_TOOLS = os.getenv("JARVIS_WARMUP_TOOLS", "all").strip().lower()
 
 try:
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
@@ -33,64 +40,194 @@ try:
         sys.path.append(project_root)
 
     from MainAgent.tools import (
-        open_app_tool, open_website_tool, amazon_web_scrapper,
+        TOOL_SUBSYSTEMS, open_app_tool, open_website_tool, amazon_web_scrapper,
         google_hotel_scrapper, google_flight_scrapper, jarves_ocr_scanner,
-        code_agent, web_and_image_searcher, visual_object_finder,email_manager,resume_analyzer
+        code_agent, web_and_image_searcher, visual_object_finder,email_manager,resume_analyzer,
+        query_previous_results, get_stored_result
     )
-    from MainAgent.jarves_prompt import REACT_PROMPT_TEMPLATE
+    from MainAgent.jarves_prompt import REACT_PROMPT_TEMPLATE, TOOL_CALLING_SYSTEM_PROMPT
+    from MainAgent.streaming import stream_final_answer, FINAL_ANSWER_MARKER
+    from MainAgent.parallel_tools import ParallelAgentExecutor, make_parallel_batch_tool
+    from MainAgent.intent_router import IntentRouter
+    from MainAgent.scratchpad import ScratchpadManager
+    from MainAgent.llm_tracing import LLMSpanCallback
+    from utils.tracing import span
+    from utils.lazy_loader import preload
 except ImportError as e_inner:
     agent_logger.critical(f"Failed to import tools or prompt: {e_inner}. Check paths and ensure MainAgent is a package or in PYTHONPATH.")
     raise
 
+def default_tools() -> List[BaseTool]:
+    return [
+        open_app_tool,
+        open_website_tool,
+        amazon_web_scrapper,
+        google_hotel_scrapper,
+        google_flight_scrapper,
+        jarves_ocr_scanner,
+        code_agent,
+        web_and_image_searcher,
+        visual_object_finder,
+        email_manager,
+        resume_analyzer,
+        query_previous_results,
+        get_stored_result
+    ]
+
 class Agent:
-    def __init__(self):
-        agent_logger.info(f"Initializing ReAct Agent using LLM: {LLM_MODEL}...")
+    def __init__(self, engine: Optional[str] = None, tools: Optional[List[BaseTool]] = None,
+                 use_fast_path: bool = FAST_PATH_ROUTER_ENABLED):
+        self.engine = (engine or DEFAULT_AGENT_ENGINE).lower()
+        if self.engine not in AGENT_ENGINES:
+            raise ValueError(f"Unknown agent engine '{self.engine}'. Choose one of {AGENT_ENGINES}.")
+        agent_logger.info(f"Initializing {self.engine} Agent using LLM: {LLM_MODEL}...")
         
         self.llm = ChatGoogleGenerativeAI(
             model=LLM_MODEL,
             google_api_key=GOOGLE_API_KEY,
             temperature=0.1,
-            convert_system_message_to_human=True
+            convert_system_message_to_human=True,
+            callbacks=[LLMSpanCallback("llm.gemini")]
         )
         
-        self.tools: List[BaseTool] = [
-            open_app_tool,
-            open_website_tool,
-            amazon_web_scrapper,
-            google_hotel_scrapper,
-            google_flight_scrapper,
-            jarves_ocr_scanner,
-            code_agent,
-            web_and_image_searcher,
-            visual_object_finder,
-            email_manager,
-            resume_analyzer
-        ]
+        self.tools: List[BaseTool] = list(tools) if tools is not None else default_tools()
+        if self.engine == "react":
+            # ReAct emits one Action per step, so independent calls are batched through a dedicated tool.
+            # The tool-calling engine gets several calls per step and ParallelAgentExecutor runs them concurrently.
+            self.tools.append(make_parallel_batch_tool(list(self.tools)))
         agent_logger.info(f"Loaded tools: {[tool.name for tool in self.tools]}")
 
+        if self.engine == "tool_calling":
+            agent_runnable = self._build_tool_calling_agent()
+        else:
+            agent_runnable = self._build_react_agent()
+
+        self.scratchpad = ScratchpadManager()
+        self.agent_executor = ParallelAgentExecutor(
+            agent=agent_runnable,
+            tools=self.tools,
+            verbose=True,
+            handle_parsing_errors=True,
+            max_iterations=10,
+            trim_intermediate_steps=self.scratchpad,
+        )
+        agent_logger.info("AgentExecutor initialized successfully.")
+
+        self._last_fast_path = False
+        self._warm_up_thread: Optional[threading.Thread] = None
+        self.warm_up_timings: Dict[str, float] = {}
+        self.router: Optional[IntentRouter] = IntentRouter(open_app_tool, open_website_tool) if use_fast_path else None
+
+    def _build_react_agent(self):
         try:
             prompt = ChatPromptTemplate.from_template(REACT_PROMPT_TEMPLATE)
         except Exception as e_prompt:
             agent_logger.critical(f"Error creating ChatPromptTemplate: {e_prompt}. Ensure REACT_PROMPT_TEMPLATE is valid.")
             raise
+        self.prompt = prompt
 
-        react_agent_runnable = create_react_agent(
+        return create_react_agent(
             llm=self.llm,
             tools=self.tools,
             prompt=prompt
         )
 
-        self.agent_executor = AgentExecutor(
-            agent=react_agent_runnable,
+    def _build_tool_calling_agent(self):
+        # Gemini receives the pydantic *Input schemas as function declarations and returns typed arguments,
+        # so there is no free-text Action/Action Input to parse.
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", TOOL_CALLING_SYSTEM_PROMPT),
+            ("human", "{input}"),
+            MessagesPlaceholder(variable_name="agent_scratchpad"),
+        ])
+        self.prompt = prompt
+        return create_tool_calling_agent(
+            llm=self.llm,
             tools=self.tools,
-            verbose=True,
-            handle_parsing_errors=True,
-            max_iterations=10,
+            prompt=prompt
         )
-        agent_logger.info("AgentExecutor initialized successfully.")
+
+    def _render_prompt(self):
+        if self.engine == "react":
+            return self.prompt.format_messages(
+                input="warm up", agent_scratchpad="",
+                tools=render_text_description(self.tools),
+                tool_names=", ".join(t.name for t in self.tools),
+            )
+        return self.prompt.format_messages(input="warm up", agent_scratchpad=[])
+
+    def _warm_up_tool_modules(self) -> List[str]:
+        if WARMUP_TOOLS == "none":
+            return []
+        wanted = None if WARMUP_TOOLS == "all" else {name.strip() for name in WARMUP_TOOLS.split(",")}
+        modules: List[str] = []
+        for tool_instance in self.tools:
+            if wanted is not None and tool_instance.name not in wanted:
+                continue
+            for module_name in TOOL_SUBSYSTEMS.get(tool_instance.name, []):
+                if module_name not in modules:
+                    modules.append(module_name)
+        return modules
+
+    def warm_up(self, prime: bool = WARMUP_PRIME) -> Dict[str, float]:
+        """
+        Pays the first-command costs up front: renders the prompt, imports the tool subsystems,
+        opens the connection to the Gemini API and, with `prime`, sends one tiny request.
+        Returns the seconds spent per phase. Every phase is best effort.
+        """
+        timings: Dict[str, float] = {}
+
+        def _phase(name: str, func):
+            start = time.perf_counter()
+            try:
+                with span(f"agent.warm_up.{name}"):
+                    func()
+            except Exception as e:
+                agent_logger.warning(f"Warm-up phase '{name}' failed: {e}")
+            timings[name] = round(time.perf_counter() - start, 3)
+
+        with span("agent.warm_up", prime=prime):
+            _phase("prompt", self._render_prompt)
+            _phase("tool_modules", lambda: preload(self._warm_up_tool_modules()))
+            _phase("connection", lambda: self.llm.get_num_tokens("warm up"))
+            if prime:
+                _phase("prime", lambda: self.llm.invoke("Reply with the single word: ready."))
+        self.warm_up_timings = timings
+        agent_logger.info(f"Agent warm-up finished in {sum(timings.values()):.2f}s: {timings}")
+        return timings
+
+    def start_warm_up(self, prime: bool = WARMUP_PRIME) -> threading.Thread:
+        """Runs `warm_up` on a daemon thread (once per Agent) and returns the thread."""
+        if self._warm_up_thread is None:
+            self._warm_up_thread = threading.Thread(target=self.warm_up, kwargs={"prime": prime},
+                                                    name="AgentWarmUp", daemon=True)
+            self._warm_up_thread.start()
+        return self._warm_up_thread
+
+    def _try_fast_path(self, command: str) -> Optional[str]:
+        self._last_fast_path = False
+        if not self.router:
+            return None
+        try:
+            with span("agent.fast_path"):
+                routed = self.router.dispatch(command)
+            self._last_fast_path = routed is not None
+            return routed
+        except Exception as e:
+            agent_logger.warning(f"Fast path failed for '{command}', falling back to the agent: {e}")
+            return None
 
     def handle_command(self, command: str, config: Optional[RunnableConfig] = None) -> str:
+        with span("agent.handle_command", engine=self.engine) as attrs:
+            response = self._handle_command(command, config)
+            attrs["fast_path"] = self._last_fast_path
+            return response
+
+    def _handle_command(self, command: str, config: Optional[RunnableConfig] = None) -> str:
         agent_logger.info(f"Processing command: {command}")
+        routed = self._try_fast_path(command)
+        if routed is not None:
+            return routed
         run_config = config or RunnableConfig(
             run_name="JarvisReActAgent",
             run_id=str(uuid.uuid4()),
@@ -117,6 +254,47 @@ class Agent:
         except Exception as e:
             agent_logger.error(f"Unexpected error while running the agent: {repr(e)}", exc_info=True)
             return "An internal error occurred while processing your command. Please check logs."
+
+    def stream_command(self, command: str, config: Optional[RunnableConfig] = None) -> Iterator[str]:
+        with span("agent.stream_command", engine=self.engine) as attrs:
+            yield from self._stream_command(command, config)
+            attrs["fast_path"] = self._last_fast_path
+
+    def _stream_command(self, command: str, config: Optional[RunnableConfig] = None) -> Iterator[str]:
+        agent_logger.info(f"Processing command (streaming): {command}")
+        routed = self._try_fast_path(command)
+        if routed is not None:
+            yield routed
+            return
+        run_config = config or RunnableConfig(
+            run_name="JarvisReActAgent",
+            run_id=str(uuid.uuid4()),
+        )
+        start_time = time.perf_counter()
+        streamed_any = False
+        try:
+            marker = FINAL_ANSWER_MARKER if self.engine == "react" else None
+            for event in stream_final_answer(self.agent_executor, {"input": command}, config=run_config,
+                                             final_answer_marker=marker):
+                if event["type"] == "tool":
+                    agent_logger.info(f"Streaming run invoked tool: {event['name']}")
+                    continue
+                if event["type"] == "final":
+                    agent_logger.info(f"Agent response: {event['text']}")
+                    if streamed_any:
+                        continue
+                text = event["text"]
+                if not streamed_any:
+                    agent_logger.info(f"First answer token after {time.perf_counter() - start_time:.2f}s.")
+                    streamed_any = True
+                yield text
+        except ToolException as e_tool:
+            agent_logger.warning(f"Tool exception occurred: {e_tool}")
+            yield f"A tool encountered an issue: {e_tool}"
+        except Exception as e:
+            agent_logger.error(f"Unexpected error while streaming the agent: {repr(e)}", exc_info=True)
+            if not streamed_any:
+                yield "An internal error occurred while processing your command. Please check logs."
         
 def main_agent_test():
     print("--- Testing Agent Initialization and Handling (AgentExecutor) ---")
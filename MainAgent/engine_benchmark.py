@@ -0,0 +1,126 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool, StructuredTool
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from MainAgent.agent import Agent, AGENT_ENGINES, default_tools
+
+DEFAULT_COMMANDS = [
+    "Hello Jarvis",
+    "Can you open applications?",
+    "open calculator",
+    "Search Amazon for 'ergonomic keyboard'",
+    "what is the capital of France?",
+    "find me flights from Kolkata to London on 2025-11-10 returning 2025-11-17",
+]
+
+
+class UsageCounter(BaseCallbackHandler):
+    """Counts LLM calls and token usage reported by the chat model."""
+
+    def __init__(self):
+        self.llm_calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def on_llm_end(self, response, **kwargs: Any) -> None:
+        self.llm_calls += 1
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+                self.input_tokens += usage.get("input_tokens", 0)
+                self.output_tokens += usage.get("output_tokens", 0)
+
+
+def stub_tools(tools: List[BaseTool]) -> List[BaseTool]:
+    """Same names and schemas, but every call returns instantly so only the engine is measured."""
+    def make_stub(name: str):
+        def _stub(**kwargs) -> str:
+            return json.dumps({"status": "success", "tool": name, "received_args": kwargs, "data": []})
+        return _stub
+    return [
+        StructuredTool.from_function(func=make_stub(t.name), name=t.name, description=t.description, args_schema=t.args_schema)
+        for t in tools
+    ]
+
+
+def run_engine(engine: str, commands: List[str], use_stub_tools: bool) -> List[Dict[str, Any]]:
+    agent = Agent(engine=engine, tools=stub_tools(default_tools()) if use_stub_tools else None)
+    agent.agent_executor.return_intermediate_steps = True
+    agent.agent_executor.verbose = False
+
+    rows = []
+    for command in commands:
+        counter = UsageCounter()
+        config = RunnableConfig(run_name=f"EngineBenchmark-{engine}", run_id=str(uuid.uuid4()), callbacks=[counter])
+        start = time.perf_counter()
+        error: Optional[str] = None
+        steps: List[Any] = []
+        try:
+            result = agent.agent_executor.invoke({"input": command}, config=config)
+            steps = result.get("intermediate_steps", [])
+        except Exception as e:
+            error = repr(e)
+        wall_s = time.perf_counter() - start
+        parse_failures = sum(1 for action, _ in steps if getattr(action, "tool", "") == "_Exception")
+        rows.append({
+            "engine": engine, "command": command, "iterations": counter.llm_calls, "tool_steps": len(steps),
+            "parse_failures": parse_failures, "input_tokens": counter.input_tokens,
+            "output_tokens": counter.output_tokens, "wall_s": round(wall_s, 3), "error": error,
+        })
+        print(f"[{engine}] {command[:48]:<48} iters={counter.llm_calls} parse_fail={parse_failures} "
+              f"tokens={counter.input_tokens}+{counter.output_tokens} wall={wall_s:.2f}s" + (f" ERROR {error}" if error else ""))
+    return rows
+
+
+def summarize(rows: List[Dict[str, Any]]):
+    print(f"\n{'engine':<14} {'iters/cmd':>10} {'parse fails':>12} {'tokens/cmd':>11} {'p50 wall s':>11} {'mean wall s':>12}")
+    print("-" * 74)
+    for engine in sorted({r["engine"] for r in rows}):
+        er = [r for r in rows if r["engine"] == engine and not r["error"]]
+        if not er:
+            print(f"{engine:<14} {'(all commands failed)':>58}")
+            continue
+        walls = [r["wall_s"] for r in er]
+        print(f"{engine:<14} {statistics.mean(r['iterations'] for r in er):>10.2f} "
+              f"{sum(r['parse_failures'] for r in er):>12} "
+              f"{statistics.mean(r['input_tokens'] + r['output_tokens'] for r in er):>11.0f} "
+              f"{statistics.median(walls):>11.2f} {statistics.mean(walls):>12.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the ReAct and tool-calling agent engines per command.")
+    parser.add_argument("--engines", nargs="+", default=list(AGENT_ENGINES), choices=AGENT_ENGINES)
+    parser.add_argument("--commands-file", help="Text file with one command per line (defaults to a built-in set).")
+    parser.add_argument("--repeat", type=int, default=1, help="Run every command this many times per engine.")
+    parser.add_argument("--real-tools", action="store_true", help="Run the real tools instead of instant stubs.")
+    parser.add_argument("--output", help="Write all per-command rows to this JSON file.")
+    args = parser.parse_args()
+
+    commands = DEFAULT_COMMANDS
+    if args.commands_file:
+        with open(args.commands_file, "r", encoding="utf-8") as f:
+            commands = [line.strip() for line in f if line.strip()]
+    commands = commands * max(1, args.repeat)
+
+    rows: List[Dict[str, Any]] = []
+    for engine in args.engines:
+        rows.extend(run_engine(engine, commands, use_stub_tools=not args.real_tools))
+    summarize(rows)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+        print(f"\nPer-command results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import logging
+import os
+import re
+import threading
+import time
+from difflib import SequenceMatcher, get_close_matches
+from typing import Any, Dict, Iterable, Optional
+
+from langchain_core.tools import BaseTool
+
+from utils.app_opener import APP_COMMANDS
+from utils.website_opener import sites_map
+
+router_logger = logging.getLogger("react_agent.intent_router")
+
+MIN_ROUTER_CONFIDENCE = float(os.getenv("JARVIS_ROUTER_MIN_CONFIDENCE", "0.85"))
+
+OPEN_COMMAND_RE = re.compile(
+    r"^(?:(?:hey\s+)?jarv[ie]s[,\s]+)?"
+    r"(?:(?:please|can you|could you|would you|will you)\s+)*"
+    r"(?:open|launch|start|run|go to|bring up|fire up)\s+(?:up\s+)?"
+    r"(?:the\s+|my\s+|a\s+)?"
+    r"(?P<target>.+?)"
+    r"(?:\s+(?P<kind>app|application|program|software|website|web site|site|page|dot com|\.com))?"
+    r"(?:\s+(?:please|for me|now|quickly))*"
+    r"[\s.!?]*$",
+    re.IGNORECASE,
+)
+WEBSITE_KINDS = ("website", "web site", "site", "page", "dot com", ".com")
+APP_KINDS = ("app", "application", "program", "software")
+# Anything that chains or qualifies the request needs the LLM.
+COMPOUND_MARKERS_RE = re.compile(r"\b(and|then|also|after|before|search|find|play|with|about|if)\b|,", re.IGNORECASE)
+LEADING_SYMBOLS_RE = re.compile(r"^[^\w]+")
+
+
+def _looks_like_typo(target: str, key: str) -> bool:
+    """A misspelling keeps the first letter and roughly the length; "mail" -> "gmail" is a different word."""
+    return target[:1] == key[:1] and abs(len(target) - len(key)) <= 2
+
+
+def _best_match(target: str, keys: Iterable[str]):
+    keys = list(keys)
+    if target in keys:
+        return target, 1.0
+    candidates = get_close_matches(target, keys, n=1, cutoff=0.6)
+    if not candidates:
+        return None, 0.0
+    ratio = SequenceMatcher(None, target, candidates[0]).ratio()
+    # Other near matches are reported at half confidence so they always fall back to the agent.
+    return candidates[0], ratio if _looks_like_typo(target, candidates[0]) else ratio / 2
+
+
+class IntentRouter:
+    """
+    Dispatches trivial "open <app/website>" commands straight to open_app_tool / open_website_tool,
+    bypassing the LLM round trips. Returns None (fall back to the agent) whenever confidence is low.
+    """
+
+    def __init__(self, app_tool: BaseTool, website_tool: BaseTool,
+                 min_confidence: float = MIN_ROUTER_CONFIDENCE,
+                 app_commands: Optional[Dict[str, str]] = None,
+                 websites: Optional[Dict[str, str]] = None):
+        self.app_tool = app_tool
+        self.website_tool = website_tool
+        self.min_confidence = min_confidence
+        self.app_commands = APP_COMMANDS if app_commands is None else app_commands
+        self.websites = sites_map if websites is None else websites
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._hit_latency_s = 0.0
+        self._miss_latency_s = 0.0
+
+    def match(self, command: str) -> Optional[Dict[str, Any]]:
+        text = command.strip().lower()
+        m = OPEN_COMMAND_RE.match(text)
+        if not m:
+            return None
+        target = m.group("target").strip(" .!?\"'")
+        kind = (m.group("kind") or "").lower()
+        if not target or COMPOUND_MARKERS_RE.search(target):
+            return None
+        if target.endswith(".com"):
+            target, kind = target[:-4], kind or ".com"
+
+        app_key, app_conf = _best_match(target, self.app_commands.keys())
+        site_key, site_conf = _best_match(target, self.websites.keys())
+        if kind in WEBSITE_KINDS:
+            app_conf = 0.0
+        elif kind in APP_KINDS:
+            site_conf = 0.0
+
+        if app_conf == 0.0 and site_conf == 0.0:
+            return None
+        if app_conf >= site_conf:
+            return {"tool": self.app_tool, "args": {"app_name": app_key}, "target": app_key, "confidence": app_conf}
+        return {"tool": self.website_tool, "args": {"web_site_name": site_key}, "target": site_key, "confidence": site_conf}
+
+    def dispatch(self, command: str) -> Optional[str]:
+        start = time.perf_counter()
+        route = self.match(command)
+        if route is None or route["confidence"] < self.min_confidence:
+            self._record(hit=False, elapsed=time.perf_counter() - start)
+            if route is not None:
+                router_logger.info(f"Fast path declined '{command}' -> {route['tool'].name}({route['target']}) "
+                                   f"confidence {route['confidence']:.2f} < {self.min_confidence:.2f}.")
+            return None
+        router_logger.info(f"Fast path: '{command}' -> {route['tool'].name}({route['args']}) confidence {route['confidence']:.2f}")
+        result = route["tool"].invoke(route["args"])
+        elapsed = time.perf_counter() - start
+        self._record(hit=True, elapsed=elapsed)
+        stats = self.stats()
+        router_logger.info(f"Fast path handled command in {elapsed * 1000:.0f} ms "
+                           f"(hit rate {stats['hit_rate']:.0%} over {stats['total']} commands).")
+        return LEADING_SYMBOLS_RE.sub("", str(result))
+
+    def _record(self, hit: bool, elapsed: float):
+        with self._lock:
+            if hit:
+                self._hits += 1
+                self._hit_latency_s += elapsed
+            else:
+                self._misses += 1
+                self._miss_latency_s += elapsed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "total": total,
+                "hit_rate": (self._hits / total) if total else 0.0,
+                "avg_hit_latency_ms": (self._hit_latency_s / self._hits * 1000) if self._hits else 0.0,
+                "avg_miss_overhead_ms": (self._miss_latency_s / self._misses * 1000) if self._misses else 0.0,
+                # A ReAct round trip costs at least two LLM calls (Action, then Final Answer).
+                "llm_calls_avoided": self._hits * 2,
+            }
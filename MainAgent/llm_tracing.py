@@ -0,0 +1,48 @@
+import threading
+from typing import Any, Dict
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from utils.tracing import start_span, end_span
+
+
+class LLMSpanCallback(BaseCallbackHandler):
+    """Records one trace span per chat-model call, with the token usage the model reports."""
+
+    def __init__(self, span_name: str = "llm.gemini"):
+        self.span_name = span_name
+        self._open: Dict[UUID, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _start(self, run_id: UUID, serialized: Dict[str, Any], **kwargs: Any):
+        model = (kwargs.get("invocation_params") or {}).get("model") or (serialized or {}).get("name")
+        record = start_span(self.span_name, model=model)
+        with self._lock:
+            self._open[run_id] = record
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start(run_id, serialized, **kwargs)
+
+    def on_llm_start(self, serialized, prompts, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start(run_id, serialized, **kwargs)
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            record = self._open.pop(run_id, None)
+        if record is None:
+            return
+        input_tokens = output_tokens = 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+                input_tokens += usage.get("input_tokens", 0)
+                output_tokens += usage.get("output_tokens", 0)
+        record["attrs"].update(input_tokens=input_tokens, output_tokens=output_tokens)
+        end_span(record)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            record = self._open.pop(run_id, None)
+        if record is not None:
+            end_span(record, error=error)
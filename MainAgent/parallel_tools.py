@@ -0,0 +1,121 @@
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+
+from langchain.agents import AgentExecutor
+from langchain_core.agents import AgentAction, AgentStep
+from langchain_core.tools import BaseTool, StructuredTool
+from pydantic import BaseModel, Field, ValidationError
+
+from utils.tracing import submit_in_context
+
+logger = logging.getLogger("react_agent.parallel_tools")
+
+MAX_PARALLEL_TOOLS = int(os.getenv("JARVIS_MAX_PARALLEL_TOOLS", "4"))
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_guard = threading.Lock()
+_step_state = threading.local()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _pool_guard:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_TOOLS, thread_name_prefix="JarvisTool")
+    return _pool
+
+
+class _PendingObservation:
+    def __init__(self, future):
+        self.future = future
+
+
+class ParallelAgentExecutor(AgentExecutor):
+    """
+    AgentExecutor that runs the tool calls of one agent step concurrently on a bounded pool.
+    Observations are merged back in the order the agent requested them, so the scratchpad is unchanged.
+    The async path (astream_events) already gathers tool calls concurrently in langchain.
+    """
+
+    def _iter_next_step(self, name_to_tool_map, color_mapping, inputs, intermediate_steps, run_manager=None):
+        _step_state.batch_size = 0
+        pending: List[AgentStep] = []
+        for item in super()._iter_next_step(name_to_tool_map, color_mapping, inputs, intermediate_steps, run_manager):
+            if isinstance(item, AgentStep) and isinstance(item.observation, _PendingObservation):
+                pending.append(item)
+                continue
+            if isinstance(item, AgentAction):
+                _step_state.batch_size += 1
+            yield item
+        if len(pending) > 1:
+            logger.info(f"Ran {len(pending)} tool calls in parallel: {[step.action.tool for step in pending]}")
+        for step in pending:
+            yield step.observation.future.result()
+
+    def _perform_agent_action(self, name_to_tool_map, color_mapping, agent_action, run_manager=None) -> AgentStep:
+        if getattr(_step_state, "batch_size", 0) < 2:
+            return super()._perform_agent_action(name_to_tool_map, color_mapping, agent_action, run_manager)
+        perform = super()._perform_agent_action
+        future = submit_in_context(_get_pool(), perform, name_to_tool_map, color_mapping, agent_action, run_manager)
+        return AgentStep(action=agent_action, observation=_PendingObservation(future))
+
+
+class ToolCallSpec(BaseModel):
+    tool: str = Field(description="Exact name of the tool to run.")
+    args: Dict[str, Any] = Field(default_factory=dict, description="Arguments for that tool, in its documented input format.")
+
+class ParallelToolBatchInput(BaseModel):
+    calls: Union[str, List[ToolCallSpec]] = Field(description=f"Independent tool calls to run at the same time (at most {MAX_PARALLEL_TOOLS} run concurrently).")
+
+
+def make_parallel_batch_tool(tools: List[BaseTool]) -> BaseTool:
+    """Planned-batch tool for the ReAct engine, which can only emit one Action per step."""
+    tool_map = {t.name: t for t in tools}
+
+    def run_tools_in_parallel(calls: Union[str, List[Any]]) -> str:
+        if isinstance(calls, str):
+            try:
+                parsed = json.loads(calls)
+            except json.JSONDecodeError as e:
+                return json.dumps({"status": "error", "message": f"Invalid JSON for calls: {e}"})
+            calls = parsed.get("calls", []) if isinstance(parsed, dict) else parsed
+        if not isinstance(calls, list):
+            return json.dumps({"status": "error", "message": "calls must be a list of {\"tool\": ..., \"args\": {...}} objects."})
+        try:
+            specs = [c if isinstance(c, ToolCallSpec) else ToolCallSpec(**c) for c in calls]
+        except (TypeError, ValidationError) as e:
+            return json.dumps({"status": "error", "message": f"Each call must be an object with 'tool' and optional 'args': {e}"})
+        unknown = [s.tool for s in specs if s.tool not in tool_map]
+        if unknown:
+            return json.dumps({"status": "error", "message": f"Unknown tool(s): {unknown}. Available: {sorted(tool_map)}"})
+
+        futures = [submit_in_context(_get_pool(), tool_map[s.tool].invoke, s.args) for s in specs]
+        results = []
+        for spec, future in zip(specs, futures):
+            try:
+                observation = future.result()
+                try:
+                    observation = json.loads(observation)
+                except (TypeError, json.JSONDecodeError):
+                    pass
+            except Exception as e:
+                logger.error(f"Parallel call to '{spec.tool}' failed: {e}", exc_info=True)
+                observation = {"status": "error", "message": str(e)}
+            results.append({"tool": spec.tool, "observation": observation})
+        return json.dumps({"status": "success", "results": results})
+
+    return StructuredTool.from_function(
+        func=run_tools_in_parallel,
+        name="run_tools_in_parallel",
+        description=(
+            "⚡ Runs several independent tool calls at the same time and returns all their observations in order. "
+            "Use it when a request needs more than one tool whose inputs do not depend on each other "
+            "(e.g. flights and hotels for the same trip). Tools that use the camera or the console still run one at a time."
+        ),
+        args_schema=ParallelToolBatchInput,
+    )
@@ -0,0 +1,44 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class PayloadStore:
+    """Keeps full tool payloads out of the LLM context, addressable by a short content-hashed handle."""
+
+    def __init__(self, max_items: int = 64, prefix: str = "obs"):
+        self.max_items = max_items
+        self.prefix = prefix
+        self._items: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, payload: str, source: str = "") -> str:
+        handle = f"{self.prefix}-{hashlib.sha1(payload.encode('utf-8', 'replace')).hexdigest()[:10]}"
+        with self._lock:
+            if handle in self._items:
+                self._items.move_to_end(handle)
+                return handle
+            self._items[handle] = {"payload": payload, "source": source, "created_at": time.time()}
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+        return handle
+
+    def get(self, handle: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            item = self._items.get(handle)
+            if item is not None:
+                self._items.move_to_end(handle)
+            return item
+
+    def __contains__(self, handle: str) -> bool:
+        with self._lock:
+            return handle in self._items
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+
+payload_store = PayloadStore()
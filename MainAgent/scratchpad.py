@@ -0,0 +1,130 @@
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.agents import AgentAction
+
+from MainAgent.payload_store import PayloadStore, payload_store
+
+scratchpad_logger = logging.getLogger("react_agent.scratchpad")
+
+OBSERVATION_TOKEN_BUDGET = int(os.getenv("JARVIS_OBSERVATION_TOKEN_BUDGET", "600"))
+KEEP_RECENT_STEPS = int(os.getenv("JARVIS_SCRATCHPAD_KEEP_RECENT", "2"))
+SUMMARY_CHARS = 200
+# Fields that only bloat the context; the complete payload stays reachable through its handle.
+DROPPED_FIELDS = ("raw_data",)
+
+
+def estimate_tokens(text: str) -> int:
+    # Gemini averages roughly four characters per token for English/JSON; good enough for budgeting.
+    return len(text) // 4 + 1
+
+
+def _as_text(observation: Any) -> str:
+    return observation if isinstance(observation, str) else json.dumps(observation, default=str)
+
+
+def _compact_json(data: Any, token_budget: int) -> Optional[str]:
+    """Compact re-encoding of a JSON observation, shortening the longest lists until it fits the budget."""
+    if isinstance(data, dict):
+        data = {k: v for k, v in data.items() if k not in DROPPED_FIELDS}
+    text = json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+    if estimate_tokens(text) <= token_budget or not isinstance(data, dict):
+        return text if estimate_tokens(text) <= token_budget else None
+    list_keys = [k for k, v in data.items() if isinstance(v, list) and v]
+    for key in sorted(list_keys, key=lambda k: len(json.dumps(data[k], default=str)), reverse=True):
+        items = data[key]
+        keep = len(items)
+        while keep > 1:
+            keep = max(1, keep // 2)
+            data[key] = items[:keep]
+            data[f"{key}_omitted"] = len(items) - keep
+            text = json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+            if estimate_tokens(text) <= token_budget:
+                return text
+    return None
+
+
+def summarize_observation(observation: str, handle: Optional[str] = None) -> str:
+    summary = observation[:SUMMARY_CHARS]
+    try:
+        data = json.loads(observation)
+    except (TypeError, json.JSONDecodeError):
+        data = None
+    if isinstance(data, dict):
+        parts = []
+        for key in ("status", "result_id", "message", "answer"):
+            if key in data and isinstance(data[key], (str, int, float, bool)):
+                parts.append(f"{key}={str(data[key])[:120]}")
+        for key, value in data.items():
+            if isinstance(value, list):
+                parts.append(f"{key}: {len(value)} items")
+        if parts:
+            summary = "; ".join(parts)
+    suffix = f" (full payload: {handle})" if handle else ""
+    return f"[summary of earlier observation] {summary}{suffix}"
+
+
+class ScratchpadManager:
+    """
+    `trim_intermediate_steps` callable for AgentExecutor. Caps each observation at a token budget,
+    stores full payloads in a PayloadStore under a handle, and reduces steps older than the most recent
+    `keep_recent` to one-line summaries. Actions are kept so the model still sees what it already did.
+    """
+
+    def __init__(self, token_budget: int = OBSERVATION_TOKEN_BUDGET, keep_recent: int = KEEP_RECENT_STEPS,
+                 store: Optional[PayloadStore] = None):
+        self.token_budget = token_budget
+        self.keep_recent = keep_recent
+        self.store = store if store is not None else payload_store
+        self._lock = threading.Lock()
+        self._iterations: List[Dict[str, int]] = []
+
+    def _store(self, observation: str, action: AgentAction) -> str:
+        return self.store.put(observation, source=f"{action.tool}:{_as_text(action.tool_input)[:200]}")
+
+    def cap_observation(self, observation: str, action: AgentAction) -> str:
+        if estimate_tokens(observation) <= self.token_budget:
+            return observation
+        handle = self._store(observation, action)
+        try:
+            compact = _compact_json(json.loads(observation), self.token_budget)
+        except (TypeError, json.JSONDecodeError):
+            compact = None
+        if compact is not None:
+            return f"{compact}\n[compacted from {estimate_tokens(observation)} tokens; full payload: {handle}]"
+        head = observation[: self.token_budget * 4]
+        return f"{head}\n... [truncated {estimate_tokens(observation) - self.token_budget} tokens; full payload: {handle}]"
+
+    def __call__(self, steps: List[Tuple[AgentAction, Any]]) -> List[Tuple[AgentAction, Any]]:
+        managed: List[Tuple[AgentAction, Any]] = []
+        cutoff = len(steps) - self.keep_recent
+        before = after = 0
+        for index, (action, observation) in enumerate(steps):
+            text = _as_text(observation)
+            log_tokens = estimate_tokens(getattr(action, "log", "") or "")
+            before += log_tokens + estimate_tokens(text)
+            if index < cutoff:
+                handle = self._store(text, action) if estimate_tokens(text) > self.token_budget // 4 else None
+                new_text = summarize_observation(text, handle)
+            else:
+                new_text = self.cap_observation(text, action)
+            after += log_tokens + estimate_tokens(new_text)
+            managed.append((action, new_text if new_text != text or not isinstance(observation, str) else observation))
+
+        with self._lock:
+            if not steps:
+                self._iterations = []
+            self._iterations.append({"iteration": len(steps) + 1, "scratchpad_tokens_before": before,
+                                     "scratchpad_tokens_after": after})
+        if steps:
+            scratchpad_logger.info(f"Iteration {len(steps) + 1}: scratchpad ~{before} tokens -> ~{after} tokens "
+                                   f"({len(steps)} steps, budget {self.token_budget}/observation).")
+        return managed
+
+    def report(self) -> List[Dict[str, int]]:
+        """Scratchpad token estimate per iteration of the most recent command, before and after management."""
+        with self._lock:
+            return list(self._iterations)
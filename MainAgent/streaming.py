@@ -0,0 +1,132 @@
+import asyncio
+import contextvars
+import logging
+import queue
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+from langchain_core.runnables import RunnableConfig
+
+stream_logger = logging.getLogger("react_agent.streaming")
+
+FINAL_ANSWER_MARKER = "Final Answer:"
+_STREAM_DONE = object()
+
+
+def chunk_text(chunk: Any) -> str:
+    """Text of an AIMessageChunk; Gemini may deliver content as a list of parts."""
+    content = getattr(chunk, "content", chunk)
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        parts = []
+        for part in content:
+            if isinstance(part, str):
+                parts.append(part)
+            elif isinstance(part, dict) and part.get("type") == "text":
+                parts.append(part.get("text", ""))
+        return "".join(parts)
+    return ""
+
+
+class FinalAnswerExtractor:
+    """Passes through only the tokens that follow `Final Answer:` in a ReAct generation (everything when `marker` is None)."""
+
+    def __init__(self, marker: Optional[str] = FINAL_ANSWER_MARKER):
+        self.marker = marker
+        self._buffer = ""
+        self._in_answer = False
+
+    def reset(self):
+        self._buffer = ""
+        self._in_answer = False
+
+    def feed(self, text: str) -> str:
+        if self._in_answer or self.marker is None:
+            return text
+        self._buffer += text
+        idx = self._buffer.find(self.marker)
+        if idx == -1:
+            # Keep just enough of the tail to recognise a marker split across chunks.
+            self._buffer = self._buffer[-(len(self.marker) - 1):]
+            return ""
+        self._in_answer = True
+        answer_start = self._buffer[idx + len(self.marker):].lstrip()
+        self._buffer = ""
+        return answer_start
+
+
+def stream_final_answer(agent_executor, input_dict: Dict[str, Any], config: Optional[RunnableConfig] = None,
+                        answer_from_tokens: bool = True,
+                        final_answer_marker: Optional[str] = FINAL_ANSWER_MARKER) -> Iterator[Dict[str, Any]]:
+    """
+    Runs `agent_executor.astream_events` on a background thread and yields events as they arrive:
+    {"type": "token", "text": ...} for Final Answer tokens (when `answer_from_tokens`),
+    {"type": "tool", "name": ...} when a tool starts, and one closing {"type": "final", "text": ...}.
+    Generation keeps running while the consumer is busy (e.g. speaking a sentence).
+
+    Only the agent's own model runs are read; chat models called inside tools are ignored. Without
+    a marker (tool-calling engine) each generation is held until it ends and dropped if it ends in
+    tool calls, so text the model writes before calling a tool is never spoken.
+    """
+    events: "queue.Queue[Any]" = queue.Queue()
+
+    async def _pump():
+        extractor = FinalAnswerExtractor(final_answer_marker)
+        tool_runs = set()
+        held: Dict[str, List[str]] = {}
+        async for event in agent_executor.astream_events(input_dict, config=config, version="v2"):
+            kind = event.get("event")
+            run_id = event.get("run_id")
+            if kind == "on_tool_start":
+                tool_runs.add(run_id)
+                events.put({"type": "tool", "name": event.get("name")})
+                continue
+            if kind in ("on_tool_end", "on_tool_error"):
+                tool_runs.discard(run_id)
+                continue
+            if kind == "on_chain_end" and not event.get("parent_ids"):
+                output = event["data"].get("output")
+                if isinstance(output, dict) and "output" in output:
+                    events.put({"type": "final", "text": str(output["output"])})
+                continue
+            if not answer_from_tokens or any(parent in tool_runs for parent in event.get("parent_ids") or ()):
+                continue
+            if kind == "on_chat_model_start":
+                extractor.reset()
+                if final_answer_marker is None:
+                    held[run_id] = []
+            elif kind == "on_chat_model_stream":
+                chunk = event["data"].get("chunk")
+                text = extractor.feed(chunk_text(chunk))
+                if final_answer_marker is not None:
+                    if text:
+                        events.put({"type": "token", "text": text})
+                elif run_id in held:
+                    if getattr(chunk, "tool_call_chunks", None):
+                        del held[run_id]
+                    elif text:
+                        held[run_id].append(text)
+            elif kind == "on_chat_model_end":
+                parts = held.pop(run_id, None)
+                if parts and not getattr(event["data"].get("output"), "tool_calls", None):
+                    events.put({"type": "token", "text": "".join(parts)})
+
+    def _run():
+        try:
+            asyncio.run(_pump())
+        except Exception as e:
+            events.put(e)
+        finally:
+            events.put(_STREAM_DONE)
+
+    # Run the pump in a copy of the caller's context so trace spans opened there stay the parent.
+    ctx = contextvars.copy_context()
+    threading.Thread(target=ctx.run, args=(_run,), name="AgentStreamPump", daemon=True).start()
+    while True:
+        item = events.get()
+        if item is _STREAM_DONE:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
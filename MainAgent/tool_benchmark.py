@@ -0,0 +1,654 @@
+import argparse
+import html
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+import urllib.parse
+import urllib.request
+from collections import Counter
+from contextlib import contextmanager
+from html.parser import HTMLParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(PROJECT_ROOT)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_DELTA_MS = 2.0
+DEFAULT_MIN_DELTA_KIB = 64.0
+
+COCO_SUBSET = {0: "person", 24: "backpack", 39: "bottle", 41: "cup", 63: "laptop", 64: "mouse",
+               65: "remote", 66: "keyboard", 67: "cell phone", 73: "book"}
+
+
+# ---------------------------------------------------------------------------------------------
+# Stub services. Every stub call is counted in `StubEnvironment.calls` under a "<service>.<call>" key.
+# ---------------------------------------------------------------------------------------------
+
+class _ListingParser(HTMLParser):
+    """Text of every `<li class="listing">` block of a fixture page, one string per listing."""
+
+    def __init__(self):
+        super().__init__()
+        self.listings: List[str] = []
+        self._depth = 0
+        self._parts: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "li" and ("class", "listing") in attrs:
+            self._depth, self._parts = 1, []
+        elif self._depth:
+            self._depth += 1
+
+    def handle_endtag(self, tag):
+        if not self._depth:
+            return
+        self._depth -= 1
+        if self._depth == 0:
+            self.listings.append(" | ".join(p for p in self._parts if p))
+
+    def handle_data(self, data):
+        if self._depth and data.strip():
+            self._parts.append(data.strip())
+
+
+def _fixture_listings(kind: str, query: Dict[str, List[str]], count: int) -> List[List[str]]:
+    term = (query.get("q") or ["item"])[0]
+    if kind == "amazon":
+        return [[f"{term.title()} model {i}", f"₹{1499 + 350 * i:,}", f"{3.5 + (i % 15) / 10:.1f} out of 5 stars",
+                 f"{120 + 37 * i:,} ratings", "Prime" if i % 3 else "Not Prime", f"https://amazon.in/dp/B0{i:08d}"]
+                for i in range(count)]
+    if kind == "hotels":
+        return [[f"{term.title()} Residency {i}", f"${80 + 15 * i}", f"{3.2 + (i % 18) / 10:.1f}",
+                 ", ".join(["Free WiFi", "Pool", "Breakfast", "Gym"][: 1 + i % 4]), f"{0.4 + i / 10:.1f} km from centre"]
+                for i in range(count)]
+    return [[f"Airline {chr(65 + i % 26)}", f"{6 + i % 12:02d}:{(i * 7) % 60:02d}", f"{9 + i % 10}h {(i * 13) % 60}m",
+             f"{i % 3} stops" if i % 3 else "Nonstop", f"₹{18500 + 900 * i:,}"]
+            for i in range(count)]
+
+
+class LocalFixtureServer:
+    """
+    Serves generated Amazon / Google Hotels / Google Flights result pages on 127.0.0.1 so the
+    scraper path (URL -> page -> listing text) runs against a real HTTP round trip instead of the web.
+    """
+
+    def __init__(self, listings: int = 20):
+        self.listings = listings
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urllib.parse.urlparse(self.path)
+                kind = parsed.path.strip("/") or "amazon"
+                rows = _fixture_listings(kind, urllib.parse.parse_qs(parsed.query), server.listings)
+                items = "\n".join(
+                    '<li class="listing">' + "".join(f"<span>{html.escape(v)}</span>" for v in row) + "</li>" for row in rows
+                )
+                body = f"<html><head><title>{kind} results</title></head><body><ul>{items}</ul></body></html>".encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}"
+
+    def url(self, kind: str, **params: Any) -> str:
+        return f"{self.base_url}/{kind}?{urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})}"
+
+    def start(self) -> "LocalFixtureServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="BenchmarkFixtureServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class PageFetcher:
+    """Loads a fixture page with urllib, or with headless Chromium when `browser` is "playwright"."""
+
+    def __init__(self, browser: str = "http"):
+        self.browser = browser
+        self._playwright = None
+        self._page = None
+
+    def fetch(self, url: str) -> str:
+        if self.browser == "playwright":
+            if self._page is None:
+                from playwright.sync_api import sync_playwright
+                self._playwright = sync_playwright().start()
+                self._page = self._playwright.chromium.launch(headless=True).new_page()
+            self._page.goto(url)
+            return self._page.content()
+        with urllib.request.urlopen(url, timeout=10) as response:
+            return response.read().decode("utf-8")
+
+    def close(self):
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = self._page = None
+
+
+class StubCamera:
+    """
+    `cv2.VideoCapture` stand-in that replays a video file (looping at the end) or, without one,
+    generates frames with a moving rectangle. `read()` is paced to `fps` like a real webcam.
+    """
+
+    def __init__(self, video_path: Optional[str] = None, fps: float = 30.0, size=(640, 480)):
+        import numpy as np
+        self._np = np
+        self.fps = fps
+        self.size = size
+        self.frames_read = 0
+        self._cap = None
+        if video_path:
+            import cv2
+            self._cap = cv2.VideoCapture(video_path)
+            if not self._cap.isOpened():
+                raise IOError(f"Could not open benchmark video '{video_path}'.")
+        self._opened = True
+        self._next_at = time.perf_counter()
+
+    def isOpened(self) -> bool:
+        return self._opened
+
+    def set(self, prop_id: int, value: Any) -> bool:
+        return True
+
+    def read(self):
+        delay = self._next_at - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        self._next_at = max(self._next_at, time.perf_counter()) + 1.0 / self.fps
+        if self._cap is not None:
+            ok, frame = self._cap.read()
+            if not ok:
+                import cv2
+                self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                ok, frame = self._cap.read()
+        else:
+            w, h = self.size
+            frame = self._np.full((h, w, 3), 40, dtype=self._np.uint8)
+            x = (self.frames_read * 8) % (w - 120)
+            frame[h // 3: h // 3 + 90, x: x + 120] = (30, 160, 220)
+            ok = True
+        self.frames_read += 1
+        return ok, frame
+
+    def release(self):
+        self._opened = False
+        if self._cap is not None:
+            self._cap.release()
+
+
+class HeadlessCV2:
+    """The real cv2 module, but cameras come from `camera_factory` and window calls do nothing."""
+
+    def __init__(self, cv2_module: Any, camera_factory: Callable[[], StubCamera]):
+        self._cv2 = cv2_module
+        self._camera_factory = camera_factory
+
+    def VideoCapture(self, *args, **kwargs):
+        return self._camera_factory()
+
+    def imshow(self, *args, **kwargs):
+        pass
+
+    def waitKey(self, *args, **kwargs) -> int:
+        return -1
+
+    def destroyAllWindows(self, *args, **kwargs):
+        pass
+
+    def namedWindow(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._cv2, attr)
+
+
+class _Tensor1:
+    """Just enough of a torch tensor for `box.cls[0]`, `box.conf[0]`, `box.xyxy[0]`."""
+
+    def __init__(self, value: Any):
+        self._value = value
+
+    def __getitem__(self, index: int) -> Any:
+        return self._value
+
+
+class _Box:
+    def __init__(self, cls_id: int, conf: float, xyxy: List[float]):
+        self.cls, self.conf, self.xyxy = _Tensor1(cls_id), _Tensor1(conf), _Tensor1(xyxy)
+
+
+class _Result:
+    def __init__(self, boxes: List[_Box]):
+        self.boxes = boxes
+
+
+class StubDetector:
+    """ultralytics-shaped detector that reports a few fixed objects after `visible_after` frames."""
+
+    def __init__(self, names: Dict[int, str] = COCO_SUBSET, visible_after: int = 2, infer_ms: float = 0.0):
+        self.names = dict(names)
+        self.visible_after = visible_after
+        self.infer_ms = infer_ms
+        self.calls = 0
+
+    def predict(self, frame: Any, conf: float = 0.25, classes: Optional[List[int]] = None, **kwargs) -> List[_Result]:
+        self.calls += 1
+        if self.infer_ms:
+            time.sleep(self.infer_ms / 1000)
+        if self.calls <= self.visible_after:
+            return [_Result([])]
+        h, w = frame.shape[:2]
+        boxes = [_Box(cls_id, 0.55 + 0.05 * (i % 8), [w * 0.1 + 40 * i, h * 0.2, w * 0.1 + 40 * i + 120, h * 0.2 + 90])
+                 for i, cls_id in enumerate(self.names)]
+        return [_Result([b for b in boxes if b.conf[0] >= conf and (not classes or b.cls[0] in classes)])]
+
+
+class StubNarrator:
+    def __init__(self, calls: Counter):
+        self._calls = calls
+
+    def say(self, text: Any, important: bool = False, wait: bool = False):
+        self._calls["narrator.speak" if important else "narrator.say"] += 1
+
+    def speak(self, text: Any):
+        self.say(text, important=True)
+
+
+def _structure_listings(raw_text: Any, fields: List[str]) -> List[Dict[str, Any]]:
+    """What the Cohere structuring call would return for the fixture page text."""
+    parser = _ListingParser()
+    parser.feed(raw_text if isinstance(raw_text, str) else json.dumps(raw_text))
+    lines = parser.listings or [line for line in str(raw_text).splitlines() if " | " in line]
+    return [dict(zip(fields, (part.strip() for part in line.split(" | ")))) for line in lines]
+
+
+class StubEnvironment:
+    """
+    Replaces the module-level service bindings of `tools` (narrator, camera, YOLO, browser scrapers,
+    Cohere/Gemini/Ollama, Tavily, E2B, Gmail, console portals, app launchers) with offline stubs.
+    `latency_ms` is added to every network/LLM stub call to mimic a remote service.
+    """
+
+    def __init__(self, tools_module: Any, server: LocalFixtureServer, fetcher: PageFetcher,
+                 video_path: Optional[str] = None, camera_fps: float = 30.0, latency_ms: float = 0.0):
+        self.tools = tools_module
+        self.server = server
+        self.fetcher = fetcher
+        self.video_path = video_path
+        self.camera_fps = camera_fps
+        self.latency_ms = latency_ms
+        self.calls: Counter = Counter()
+        self.detector = StubDetector()
+        self._originals: Dict[str, Any] = {}
+
+    def _counted(self, name: str, fn: Callable, remote: bool = True) -> Callable:
+        def _stub(*args, **kwargs):
+            self.calls[name] += 1
+            if remote and self.latency_ms:
+                time.sleep(self.latency_ms / 1000)
+            return fn(*args, **kwargs)
+        _stub.__name__ = name
+        return _stub
+
+    def _camera(self) -> StubCamera:
+        self.calls["camera.open"] += 1
+        return StubCamera(self.video_path, fps=self.camera_fps)
+
+    def _capture_still(self, *args, **kwargs):
+        camera = self._camera()
+        try:
+            return camera.read()[1]
+        finally:
+            camera.release()
+
+    def _fetch_text(self, search_url: str, user_preferences: Any = None) -> str:
+        self.calls["browser.page_load"] += 1
+        parser = _ListingParser()
+        parser.feed(self.fetcher.fetch(search_url))
+        return "\n".join(parser.listings)
+
+    def bindings(self) -> Dict[str, Any]:
+        t = self.tools
+        c = self._counted
+        stubs: Dict[str, Any] = {
+            "narrator": StubNarrator(self.calls),
+            "open_app": c("system.open_app", lambda app_name: True, remote=False),
+            "open_website": c("system.open_website", lambda site_name: True, remote=False),
+            "COHERE_API_KEY": "benchmark-stub",
+            "get_amazon_search_url": c("browser.search_url", lambda query, **kw: self.server.url("amazon", q=query), remote=False),
+            "generate_travel_search_url": c("browser.search_url", lambda location, check_in_date, check_out_date, **kw:
+                                            self.server.url("hotels", q=location, check_in=check_in_date, check_out=check_out_date), remote=False),
+            "generate_search_url": c("browser.search_url", lambda from_airport, to_airport, depart_on, return_on:
+                                     self.server.url("flights", q=to_airport, frm=from_airport, out=depart_on, ret=return_on), remote=False),
+            "extract_amazon_info": c("browser.extract", self._fetch_text, remote=False),
+            "extract_hotel_info": c("browser.extract", self._fetch_text, remote=False),
+            "extract_flight_info": c("browser.extract", self._fetch_text, remote=False),
+            "structure_products_with_cohere": c("llm.cohere", lambda raw_product_data_text, **kw: _structure_listings(
+                raw_product_data_text, ["title", "price", "rating", "reviews_count", "prime", "url"])),
+            "structure_hotels_with_cohere": c("llm.cohere", lambda raw_hotel_data_input, **kw: _structure_listings(
+                raw_hotel_data_input, ["name", "price", "rating", "amenities", "distance"])),
+            "structure_flight_list_with_cohere": c("llm.cohere", lambda raw_flight_list_input, **kw: _structure_listings(
+                raw_flight_list_input, ["airline", "departure_time", "duration", "stops", "total_price"])),
+            "capture_image_from_camera": c("camera.capture_image", self._capture_still, remote=False),
+            "process_captured_image_with_gemini": c("llm.gemini", lambda image_frame, document_type, custom_instructions: {
+                "document_type": document_type, "store": "Benchmark Mart", "total": "₹1,240.00", "date": "2025-06-01",
+                "items": [{"name": f"Item {i}", "price": f"{50 + 10 * i}"} for i in range(8)]}),
+            "apply_brightness_contrast": lambda frame, brightness=0, contrast=0: frame,
+            "put_text_with_bg": self._put_text_with_bg,
+            "tavily_available": lambda: True,
+            "perform_web_search": c("tavily.search", lambda query: {"results": [
+                {"title": f"Result {i} for {query}", "url": f"https://example.org/{i}", "content": "Lorem ipsum " * 40}
+                for i in range(5)]}),
+            "synthesize_answer_with_gemini": c("llm.gemini", lambda original_query, search_results_data=None, image_analysis_text=None: {
+                "answer": f"Synthesized answer to '{original_query}' from {len((search_results_data or {}).get('results', []))} sources."}),
+            "analyze_image_with_langchain_ollama": c("llm.ollama", lambda image_bytes, query: {
+                "analysis": f"A {len(image_bytes)}-byte image showing a blue rectangle on a grey background."}),
+            "open_code_input_portal": c("console.input", lambda prompt_message=None, end_keyword="END": (
+                "def add(a, b):\n    return a - b\n\nprint(add(2, 3))\n" if prompt_message is None else
+                "Senior Python engineer. 5+ years, LangChain, computer vision, REST APIs, Docker, AWS."), remote=False),
+            "custom_code_agent": c("e2b.code_agent", lambda task_input, config=None: (
+                "The function subtracts instead of adding. Replaced '-' with '+'; the sandbox run now prints 5.",
+                "def add(a, b):\n    return a + b\n\nprint(add(2, 3))\n")),
+            "extract_text_from_pdf": c("file.read_pdf", lambda path: "Python developer with 6 years of experience. " * 60, remote=False),
+            "analyze_resume_with_llm": c("llm.gemini", lambda resume_text, job_description_text: {
+                "match_assessment": "Strong match", "strengths": ["Python", "LangChain"], "improvements": ["Add AWS projects"]}),
+            "email_tool_available": lambda: True,
+            "get_gmail_service": c("gmail.get_service", lambda: object()),
+            "get_unread_emails": c("gmail.list_unread", lambda max_results=3: [
+                {"id": f"msg-{i}", "sender_email": f"sender{i}@example.com", "subject": f"Quarterly update {i}",
+                 "body": "Hi, please find the update attached. " * 20} for i in range(max_results)]),
+            "get_conversation_history": c("memory.history", lambda sender, keywords: [], remote=False),
+            "draft_reply_with_llm": c("llm.gemini", lambda body, sender, subject, history:
+                                      "Thanks for the update, I will review it this week." if "1" not in subject else "No reply needed."),
+            "mark_email_as_read": c("gmail.mark_read", lambda service, message_id: True),
+            "send_email": c("gmail.send", lambda service, to, subject, body, thread_id=None: (True, "Email sent.")),
+            "add_to_memory": c("memory.add", lambda *args: None, remote=False),
+        }
+        try:
+            import cv2
+            stubs["cv2"] = HeadlessCV2(cv2, self._camera)
+            stubs["get_yolo_model"] = c("yolo.get_model", lambda weights="yolov8n.pt": self.detector, remote=False)
+        except ImportError:
+            pass
+        return {name: value for name, value in stubs.items() if hasattr(t, name)}
+
+    def _put_text_with_bg(self, img, text, org, font_face, font_scale, text_color, bg_color, thickness=1, padding=5, **kwargs):
+        cv2 = self.tools.cv2
+        (w, h), baseline = cv2.getTextSize(text, font_face, font_scale, thickness)
+        x, y = org
+        cv2.rectangle(img, (x - padding, y - h - padding), (x + w + padding, y + baseline + padding), bg_color, -1)
+        cv2.putText(img, text, org, font_face, font_scale, text_color, thickness)
+
+    @contextmanager
+    def installed(self) -> Iterator["StubEnvironment"]:
+        stubs = self.bindings()
+        self._originals = {name: getattr(self.tools, name) for name in stubs}
+        for name, value in stubs.items():
+            setattr(self.tools, name, value)
+        try:
+            yield self
+        finally:
+            for name, value in self._originals.items():
+                setattr(self.tools, name, value)
+
+    def reset(self):
+        self.calls.clear()
+        self.detector.calls = 0
+        self.tools.session_results.clear()
+
+
+# ---------------------------------------------------------------------------------------------
+# Benchmark cases: tool name -> list of {case, input (dict or callable(tools) -> dict), optional setup
+# run before each call, camera: needs cv2/numpy}.
+# ---------------------------------------------------------------------------------------------
+
+def _seed_search(tool_name: str, tool_input: Dict[str, Any]) -> Callable[[Any], None]:
+    def _setup(tools_module: Any):
+        getattr(tools_module, tool_name).invoke(tool_input)
+    return _setup
+
+
+AMAZON_INPUT = {"product_name": "wireless earbuds", "user_preferences": {"rating_min": 4.0}}
+HOTEL_INPUT = {"location": "Paris, France", "check_in_date": "2025-11-10", "check_out_date": "2025-11-14"}
+FLIGHT_INPUT = {"from_place": "Kolkata", "to_place": "London", "departure_date": "2025-11-10", "returned_date": "2025-11-17"}
+
+BENCHMARK_CASES: Dict[str, List[Dict[str, Any]]] = {
+    "open_app_tool": [{"case": "notepad", "input": {"app_name": "notepad"}}],
+    "open_website_tool": [{"case": "wikipedia", "input": {"web_site_name": "wikipedia"}}],
+    "amazon_web_scrapper": [
+        {"case": "search", "input": AMAZON_INPUT},
+        {"case": "session_hit", "input": AMAZON_INPUT, "setup": _seed_search("amazon_web_scrapper", AMAZON_INPUT)},
+    ],
+    "google_hotel_scrapper": [{"case": "search", "input": HOTEL_INPUT}],
+    "google_flight_scrapper": [{"case": "search", "input": FLIGHT_INPUT}],
+    "jarves_ocr_scanner": [{"case": "receipt", "input": {"document_type": "receipt"}, "camera": True}],
+    "code_agent": [{"case": "debug", "input": {"end_keyword": "ENDCODE"}}],
+    "web_and_image_searcher": [
+        {"case": "text", "input": {"query": "what is the tallest building in Europe?"}},
+        {"case": "with_image", "input": {"query": "what is this object?", "include_image": True}, "camera": True},
+    ],
+    "visual_object_finder": [{"case": "bottle", "input": {"object_name": "my bottle", "search_duration_seconds": 10}, "camera": True}],
+    "email_manager": [
+        {"case": "check_new", "input": {"action": "check_new", "max_emails_to_check": 3}},
+        {"case": "send_draft", "input": {"action": "send_draft", "recipient_email": "a@example.com", "subject": "Re: update",
+                                         "body": "Thanks, received.", "original_message_id": "msg-0"}},
+    ],
+    "resume_analyzer": [{"case": "analyze", "input": {"job_description_end_keyword": "END_JD"}}],
+    "query_previous_results": [{"case": "filter_sort", "input": {"tool_name": "amazon_web_scrapper", "filters": {"rating": ">= 4"},
+                                                               "sort_by": "price", "limit": 5},
+                                "setup": _seed_search("amazon_web_scrapper", AMAZON_INPUT)}],
+    "get_stored_result": [{"case": "page_2", "input": lambda t: {"result_id": t.session_results.latest("amazon_web_scrapper")["result_id"],
+                                                                  "offset": 5, "limit": 5},
+                           "setup": _seed_search("amazon_web_scrapper", AMAZON_INPUT)}],
+}
+
+
+def _tool_status(output: Any) -> str:
+    try:
+        parsed = json.loads(output) if isinstance(output, str) else output
+    except json.JSONDecodeError:
+        return "text"
+    return str(parsed.get("status", "ok")) if isinstance(parsed, dict) else "ok"
+
+
+def _prepare(env: StubEnvironment, case: Dict[str, Any]) -> Dict[str, Any]:
+    """Fresh stubs and session store, the case's setup (not counted), and the resolved tool input."""
+    env.reset()
+    if case.get("setup"):
+        case["setup"](env.tools)
+        env.calls.clear()
+        env.detector.calls = 0
+    tool_input = case["input"]
+    return tool_input(env.tools) if callable(tool_input) else tool_input
+
+
+def benchmark_case(env: StubEnvironment, tool_obj: Any, case: Dict[str, Any], repeat: int, warmup: int) -> Dict[str, Any]:
+    """Wall time over `repeat` untraced runs, then one run under tracemalloc for allocations."""
+    row: Dict[str, Any] = {"tool": tool_obj.name, "case": case["case"], "runs": repeat, "error": None}
+    try:
+        for _ in range(warmup):
+            tool_obj.invoke(_prepare(env, case))
+
+        walls_ms: List[float] = []
+        output = None
+        for _ in range(repeat):
+            tool_input = _prepare(env, case)
+            start = time.perf_counter()
+            output = tool_obj.invoke(tool_input)
+            walls_ms.append((time.perf_counter() - start) * 1000)
+        calls = dict(sorted(env.calls.items()))
+
+        tool_input = _prepare(env, case)
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            base_current = tracemalloc.get_traced_memory()[0]
+            tool_obj.invoke(tool_input)
+            _, peak = tracemalloc.get_traced_memory()
+            diff = tracemalloc.take_snapshot().compare_to(before, "filename")
+        finally:
+            tracemalloc.stop()
+
+        row.update({
+            "status": _tool_status(output),
+            "wall_ms_p50": round(statistics.median(walls_ms), 3),
+            "wall_ms_mean": round(statistics.mean(walls_ms), 3),
+            "wall_ms_max": round(max(walls_ms), 3),
+            "peak_kib": round((peak - base_current) / 1024, 1),
+            "net_alloc_kib": round(sum(s.size_diff for s in diff) / 1024, 1),
+            "alloc_blocks": sum(s.count_diff for s in diff if s.count_diff > 0),
+            "calls": calls,
+        })
+    except Exception as e:
+        row["error"] = repr(e)
+    return row
+
+
+def compare_to_baseline(rows: List[Dict[str, Any]], baseline: List[Dict[str, Any]], threshold: float,
+                        min_delta_ms: float, min_delta_kib: float) -> List[str]:
+    """Regressions of `rows` against `baseline`: slower or larger beyond threshold, or more stub calls."""
+    base = {(r["tool"], r["case"]): r for r in baseline if not r.get("error")}
+    regressions = []
+    for row in rows:
+        key = (row["tool"], row["case"])
+        label = f"{row['tool']}:{row['case']}"
+        if row.get("error"):
+            regressions.append(f"{label} failed: {row['error']}")
+            continue
+        ref = base.get(key)
+        if ref is None:
+            continue
+        delta_ms = row["wall_ms_p50"] - ref["wall_ms_p50"]
+        if delta_ms > min_delta_ms and row["wall_ms_p50"] > ref["wall_ms_p50"] * (1 + threshold):
+            regressions.append(f"{label} wall p50 {ref['wall_ms_p50']:.2f} -> {row['wall_ms_p50']:.2f} ms")
+        delta_kib = row["peak_kib"] - ref["peak_kib"]
+        if delta_kib > min_delta_kib and row["peak_kib"] > ref["peak_kib"] * (1 + threshold):
+            regressions.append(f"{label} peak memory {ref['peak_kib']:.0f} -> {row['peak_kib']:.0f} KiB")
+        for name, count in row["calls"].items():
+            if count > ref.get("calls", {}).get(name, 0):
+                regressions.append(f"{label} {name} calls {ref.get('calls', {}).get(name, 0)} -> {count}")
+    return regressions
+
+
+def print_table(rows: List[Dict[str, Any]]):
+    print(f"\n{'tool:case':<42} {'status':<12} {'p50 ms':>9} {'max ms':>9} {'peak KiB':>9} {'blocks':>8}  calls")
+    print("-" * 120)
+    for r in rows:
+        label = f"{r['tool']}:{r['case']}"
+        if r.get("error"):
+            print(f"{label:<42} ERROR {r['error']}")
+            continue
+        calls = " ".join(f"{k}={v}" for k, v in r["calls"].items())
+        print(f"{label:<42} {r['status']:<12} {r['wall_ms_p50']:>9.2f} {r['wall_ms_max']:>9.2f} "
+              f"{r['peak_kib']:>9.1f} {r['alloc_blocks']:>8}  {calls}")
+
+
+def _load_tools_module(trace: bool):
+    if not trace:
+        os.environ.setdefault("JARVIS_TRACING", "false")
+    import tools
+    return tools
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline wall-time / allocation / call-count benchmark of every MainAgent tool.")
+    parser.add_argument("--tools", nargs="+", help="Only benchmark these tools.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case.")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per case before measuring.")
+    parser.add_argument("--listings", type=int, default=20, help="Listings per fixture results page.")
+    parser.add_argument("--video", help="Video file the stub camera replays (default: synthetic frames).")
+    parser.add_argument("--camera-fps", type=float, default=30.0)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every network/LLM stub call.")
+    parser.add_argument("--browser", choices=["http", "playwright"], default="http",
+                        help="Load fixture pages with urllib or with headless Chromium.")
+    parser.add_argument("--trace", action="store_true", help="Keep JARVIS tracing spans enabled during the run.")
+    parser.add_argument("--output", help="Write all rows to this JSON file.")
+    parser.add_argument("--save-baseline", help="Write the rows as the new baseline to this JSON file.")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against; exits 1 on regression.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed relative slowdown / growth (0.25 = 25%%).")
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS, help="Ignore wall-time increases below this.")
+    parser.add_argument("--min-delta-kib", type=float, default=DEFAULT_MIN_DELTA_KIB, help="Ignore peak-memory increases below this.")
+    args = parser.parse_args()
+
+    tools = _load_tools_module(args.trace)
+    from langchain_core.tools import BaseTool
+    all_tools = {obj.name: obj for obj in vars(tools).values() if isinstance(obj, BaseTool)}
+    selected = args.tools or sorted(all_tools)
+    uncovered = [name for name in selected if name not in BENCHMARK_CASES]
+
+    try:
+        import cv2, numpy  # noqa: F401
+        camera_available = True
+    except ImportError:
+        camera_available = False
+
+    server = LocalFixtureServer(listings=args.listings).start()
+    fetcher = PageFetcher(args.browser)
+    env = StubEnvironment(tools, server, fetcher, video_path=args.video, camera_fps=args.camera_fps, latency_ms=args.latency_ms)
+    rows: List[Dict[str, Any]] = []
+    try:
+        with env.installed():
+            for name in selected:
+                if name not in all_tools:
+                    print(f"Unknown tool '{name}'; skipping.")
+                    continue
+                for case in BENCHMARK_CASES.get(name, []):
+                    if case.get("camera") and not camera_available:
+                        print(f"[{name}:{case['case']}] skipped: cv2/numpy not installed.")
+                        continue
+                    row = benchmark_case(env, all_tools[name], case, repeat=max(1, args.repeat), warmup=max(0, args.warmup))
+                    rows.append(row)
+                    print(f"[{name}:{case['case']}] " + (f"ERROR {row['error']}" if row["error"] else
+                          f"{row['status']} p50={row['wall_ms_p50']:.2f}ms peak={row['peak_kib']:.0f}KiB"))
+    finally:
+        fetcher.close()
+        server.stop()
+
+    print_table(rows)
+    if uncovered:
+        print(f"\nTools without a benchmark case: {', '.join(uncovered)}")
+    for path in filter(None, [args.output, args.save_baseline]):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2, ensure_ascii=False)
+        print(f"\nResults written to {path}")
+
+    failed = bool(uncovered) or any(r.get("error") for r in rows)
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare_to_baseline(rows, json.load(f), args.threshold, args.min_delta_ms, args.min_delta_kib)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  - {line}")
+            failed = True
+        else:
+            print(f"\n✅ No regressions against {args.baseline} (threshold {args.threshold:.0%}).")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,85 +8,136 @@ from langchain_core.tools import tool, BaseTool
 from langchain.schema import Document
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import ToolException
+from difflib import get_close_matches
+import re
 import time
 import requests
-import numpy as np
-import cv2
-from ultralytics import YOLO
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 load_dotenv()
 
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path: sys.path.append(project_root)
+from utils import open_app, open_website
+from utils.lazy_loader import lazy_import, lazy_attr, LazyObject
+from utils.resource_locks import exclusive
+from utils.tracing import traced, span
+from utils.session_store import session_cached, session_results, query_records
+from utils.result_envelope import enveloped_result, compact_record, dumps_compact, result_page
+from utils.model_registry import YOLO_DEFAULT_IMGSZ, get_yolo_model
+from MainAgent.payload_store import payload_store
+from utils.vision_pipeline import (
+    VISION_PIPELINE_ENABLED, VISION_IMGSZ, VISION_STRIDE, VISION_STABLE_FRAMES,
+    LatestFrameGrabber, InferenceWorker, RateMeter, pipeline_stats
+)
+
 tavily_api_key = os.getenv("TAVILY_API_KEY")
 COHERE_API_KEY = os.getenv("COHERE_API_KEY")
-tavily_client = None
-if tavily_api_key:
+
+# External calls (browser, Cohere, Gemini, Tavily, Ollama, E2B, Gmail) are wrapped in trace spans, see utils/tracing.py.
+# Heavy subsystems (torch, deepface, playwright, E2B, Gmail, ...) are only imported when a tool first needs them.
+np = lazy_import("numpy")
+cv2 = lazy_import("cv2")
+
+get_amazon_search_url = lazy_attr("WebScrappingAgent", "get_amazon_search_url")
+extract_amazon_info = traced("browser.extract_amazon_info")(lazy_attr("WebScrappingAgent", "extract_amazon_info"))
+generate_travel_search_url = lazy_attr("WebScrappingAgent", "generate_travel_search_url")
+extract_hotel_info = traced("browser.extract_hotel_info")(lazy_attr("WebScrappingAgent", "extract_hotel_info"))
+generate_search_url = lazy_attr("WebScrappingAgent", "generate_search_url")
+extract_flight_info = traced("browser.extract_flight_info")(lazy_attr("WebScrappingAgent", "extract_flight_info"))
+
+structure_products_with_cohere = traced("cohere.structure_products")(lazy_attr("StructuredOutput", "structure_products_with_cohere"))
+structure_hotels_with_cohere = traced("cohere.structure_hotels")(lazy_attr("StructuredOutput", "structure_hotels_with_cohere"))
+structure_flight_list_with_cohere = traced("cohere.structure_flights")(lazy_attr("StructuredOutput", "structure_flight_list_with_cohere"))
+
+capture_image_from_camera = traced("camera.capture_image")(lazy_attr("Scanner", "capture_image_from_camera"))
+process_captured_image_with_gemini = traced("gemini.scanner_structure_text")(lazy_attr("Scanner", "process_captured_image_with_gemini"))
+apply_brightness_contrast = lazy_attr("Scanner", "apply_brightness_contrast")
+put_text_with_bg = lazy_attr("Scanner", "put_text_with_bg")
+
+synthesize_answer_with_gemini = traced("gemini.synthesize_answer")(lazy_attr("Image_and_Web_search", "synthesize_answer_with_gemini"))
+perform_web_search = traced("tavily.search")(lazy_attr("Image_and_Web_search", "perform_web_search"))
+analyze_image_with_langchain_ollama = traced("ollama.vision")(lazy_attr("Image_and_Web_search", "analyze_image_with_langchain_ollama"))
+
+custom_code_agent = traced("e2b.code_agent")(lazy_attr("CodeDebugger", "custom_code_agent"))
+open_code_input_portal = lazy_attr("CodeDebugger", "open_code_input_portal")
+
+get_unread_emails = traced("gmail.get_unread_emails")(lazy_attr("EmailAccessAgent", "get_unread_emails"))
+draft_reply_with_llm = traced("gemini.draft_email_reply")(lazy_attr("EmailAccessAgent", "draft_reply_with_llm"))
+send_email = traced("gmail.send_email")(lazy_attr("EmailAccessAgent", "send_email"))
+get_conversation_history = lazy_attr("EmailAccessAgent", "get_conversation_history")
+add_to_memory = lazy_attr("EmailAccessAgent", "add_to_memory")
+mark_email_as_read = traced("gmail.mark_email_as_read")(lazy_attr("EmailAccessAgent", "mark_email_as_read"))
+get_gmail_service = traced("gmail.get_service")(lazy_attr("EmailAccessAgent", "get_gmail_service"))
+
+extract_text_from_pdf = lazy_attr("ResumeAnalyser", "extract_text_from_pdf")
+analyze_resume_with_llm = traced("gemini.analyze_resume")(lazy_attr("ResumeAnalyser", "analyze_resume_with_llm"))
+
+def _build_tavily_client():
+    if not tavily_api_key:
+        return None
     try:
         from tavily import TavilyClient
-        tavily_client = TavilyClient(api_key=tavily_api_key)
+        return TavilyClient(api_key=tavily_api_key)
     except ImportError:
         print("Warning: TavilyClient not found. Please install tavily-python.")
     except Exception as e:
         print(f"Error initializing TavilyClient: {e}")
-        tavily_client = None
-
-try:
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-    if project_root not in sys.path: sys.path.append(project_root)
-    from utils import (
-        open_app, 
-        open_website
-    )
-    from WebScrappingAgent import (
-        get_amazon_search_url, 
-        extract_amazon_info, 
-        generate_travel_search_url, 
-        extract_hotel_info, 
-        generate_search_url, 
-        extract_flight_info
-    )
-    from StructuredOutput import (
-        structure_products_with_cohere, 
-        structure_hotels_with_cohere, 
-        structure_flight_list_with_cohere
-    )
-    from Scanner import (
-        capture_image_from_camera, 
-        process_captured_image_with_gemini,
-        apply_brightness_contrast,
-        put_text_with_bg
-    )
-    from Image_and_Web_search import (
-        synthesize_answer_with_gemini,
-        perform_web_search,
-        analyze_image_with_langchain_ollama
-    )
-    from JarvesVoice import Jarvis
-   
-    from CodeDebugger import (
-        custom_code_agent,
-        open_code_input_portal
-    )
+    return None
+
+_tavily_client = LazyObject("TavilyClient", _build_tavily_client)
+
+def tavily_available() -> bool:
+    return _tavily_client.get() is not None
+
+_email_tool_available: Optional[bool] = None
+
+def email_tool_available() -> bool:
+    global _email_tool_available
+    if _email_tool_available is None:
+        try:
+            lazy_import("EmailAccessAgent").load()
+            _email_tool_available = True
+        except ImportError as e:
+            print(f"Could not import email_tool_logic: {e}. Email tool will be disabled.")
+            _email_tool_available = False
+    return _email_tool_available
+
+class _ConsoleNarrator:
+    def say(self, text: Any, important: bool = False, wait: bool = False):
+        print(f"Jarvis (TTS unavailable): {str(text)[:150]}")
+
+    def speak(self, text: Any):
+        self.say(text, important=True)
+
+def _build_narrator():
     try:
-        from EmailAccessAgent import (
-            get_unread_emails, draft_reply_with_llm, send_email,
-            get_conversation_history, add_to_memory, mark_email_as_read, get_gmail_service
-        )
-        EMAIL_TOOL_AVAILABLE = True
-    except ImportError as e:
-        print(f"Could not import email_tool_logic: {e}. Email tool will be disabled.")
-        EMAIL_TOOL_AVAILABLE = False 
-
-    from ResumeAnalyser import extract_text_from_pdf,analyze_resume_with_llm
-except ImportError as e:
-    print(f"FATAL: Could not import required project modules: {e}. Check paths and file locations.")
-    raise ImportError(f"Failed to import project modules: {e}") from e
-
-try:
-    speaker = Jarvis()
-except Exception as speaker_err:
-    print(f"ERROR initializing Jarvis speaker: {speaker_err}. Speech output will be limited.")
-    
+        from JarvesVoice.narrator import get_narrator
+        return get_narrator()
+    except Exception as narrator_err:
+        print(f"ERROR initializing Jarvis narrator: {narrator_err}. Speech output will be limited.")
+        return _ConsoleNarrator()
+
+# Tool narration is queued and spoken on a dedicated thread while the tool keeps working:
+# `narrator.say` for progress lines (coalesced, dropped when stale), `narrator.speak` for results,
+# errors and instructions (always spoken). The speaker itself is only built on the first line.
+narrator = LazyObject("Jarvis narrator", _build_narrator)
+
+TOOL_SUBSYSTEMS: Dict[str, List[str]] = {
+    "open_app_tool": [],
+    "open_website_tool": [],
+    "amazon_web_scrapper": ["WebScrappingAgent", "StructuredOutput"],
+    "google_hotel_scrapper": ["WebScrappingAgent", "StructuredOutput"],
+    "google_flight_scrapper": ["WebScrappingAgent", "StructuredOutput"],
+    "jarves_ocr_scanner": ["Scanner"],
+    "code_agent": ["CodeDebugger"],
+    "web_and_image_searcher": ["Scanner", "Image_and_Web_search", "cv2"],
+    "visual_object_finder": ["Scanner", "ultralytics", "cv2"],
+    "email_manager": ["EmailAccessAgent"],
+    "resume_analyzer": ["CodeDebugger", "ResumeAnalyser"],
+    "query_previous_results": [],
+    "get_stored_result": [],
+}
 
 logging_config = {
     'version': 1,
@@ -158,8 +209,23 @@ class ResumeAnalyzerInput(BaseModel):
     job_description_end_keyword: str = Field(default="END_JD", description="Keyword to end job description input.")
     resume_pdf_path: Optional[str] = Field(default=None, description="Optional path to resume PDF. Uses env var if None.")
 
+class PreviousResultsQueryInput(BaseModel):
+    result_id: Optional[str] = Field(default=None, description="Optional: 'result_id' of an earlier tool result (e.g. 'res-3'). Defaults to the most recent result of `tool_name`.")
+    tool_name: Optional[str] = Field(default=None, description="Optional: tool whose latest result to query (e.g. 'amazon_web_scrapper'). Defaults to the most recent result of any tool.")
+    filters: Optional[Dict[str, Any]] = Field(default=None, description="Optional field conditions, e.g. {'rating': '>= 4', 'price': 'under 5000', 'amenities': 'contains pool'}. Dotted names reach nested fields ('outbound_flight.num_stops').")
+    sort_by: Optional[str] = Field(default=None, description="Optional field to sort by numerically (e.g. 'price', 'rating', 'total_price').")
+    descending: bool = Field(default=False, description="Sort from highest to lowest instead of lowest to highest.")
+    limit: int = Field(default=5, description="Maximum number of records to return.")
+
+class StoredResultPageInput(BaseModel):
+    result_id: str = Field(description="'result_id' from an earlier tool observation (e.g. 'res-3').")
+    offset: int = Field(default=0, description="Index of the first record (or character, for text fields) to return; use 'next_offset' from the previous page.")
+    limit: int = Field(default=5, description="Number of records per page.")
+    field: str = Field(default="data", description="Field of the stored result to page through, e.g. 'data' or 'raw_data'.")
+
 
 @tool(args_schema=OpenAppInput)
+@traced("tool.open_app_tool")
 def open_app_tool(app_name: str) -> str:
     """
     ✅ Use this tool to open an app on the laptop. Args defined in schema.
@@ -168,24 +234,24 @@ def open_app_tool(app_name: str) -> str:
         app_name = json.loads(app_name).get("app_name","chrome")
 
     logger.info(f"Attempting to open app: {app_name}")
-    speaker.speak(f"Certainly.Attempting to open {app_name} for you.")
-    time.sleep(0.5)
+    narrator.say(f"Certainly.Attempting to open {app_name} for you.")
     try:
         success = open_app(app_name=app_name)
         if success:
             logger.info(f"✅ App '{app_name}' opened successfully.")
-            speaker.speak(f"{app_name} has been opened successfully,Boss.")
+            narrator.speak(f"{app_name} has been opened successfully,Boss.")
             return f"✅ Successfully opened app: {app_name}"
         else:
             logger.warning(f"⚠️ Failed to open app '{app_name}'.")
-            speaker.speak(f"I was unable to open {app_name}. It might not be installed or found.")
+            narrator.speak(f"I was unable to open {app_name}. It might not be installed or found.")
             return f"⚠️ Could not open app: {app_name}. It might not be installed or found."
     except Exception as e:
         logger.error(f"❌ Unexpected error opening app '{app_name}': {e}", exc_info=True)
-        speaker.speak(f"An unexpected error occurred while trying to open {app_name}.")
+        narrator.speak(f"An unexpected error occurred while trying to open {app_name}.")
         return f"❌ Error opening app: {app_name}. Reason: {e}"
 
 @tool(args_schema=OpenWebsiteInput)
+@traced("tool.open_website_tool")
 def open_website_tool(web_site_name: str) -> str:
     """
     ✅ Use this tool to open a website. Args defined in schema.
@@ -194,24 +260,26 @@ def open_website_tool(web_site_name: str) -> str:
         web_site_name = json.loads(web_site_name).get("web_site_name","google")
 
     logger.info(f"Attempting to open website: '{web_site_name}'")
-    speaker.speak(f"Accessing the web. Opening {web_site_name} now.")
-    time.sleep(0.5)
+    narrator.say(f"Accessing the web. Opening {web_site_name} now.")
     try:
         success = open_website(site_name=web_site_name)
         if success:
             logger.info(f"✅ Website '{web_site_name}' opened successfully.")
-            speaker.speak(f"The website {web_site_name} is now openned successfully, Boss")
+            narrator.speak(f"The website {web_site_name} is now openned successfully, Boss")
             return f"✅ Website {web_site_name} opened successfully"
         else:
             logger.warning(f"⚠️ Failed to open website '{web_site_name}'.")
-            speaker.speak(f"I encountered an issue opening {web_site_name}.Please check the URL or your network connection.")
+            narrator.speak(f"I encountered an issue opening {web_site_name}.Please check the URL or your network connection.")
             return f"⚠️ Could not open website: {web_site_name}. Check the URL or network."
     except Exception as e:
         logger.error(f"❌ Unexpected error opening website '{web_site_name}': {e}", exc_info=True)
-        speaker.speak(f"An unexpected error occurred with the website request for {web_site_name}.")
+        narrator.speak(f"An unexpected error occurred with the website request for {web_site_name}.")
         return f"❌ Error opening website: {web_site_name}. Reason: {e}"
 
 @tool(args_schema=AmazonScraperInput)
+@traced("tool.amazon_web_scrapper")
+@enveloped_result("amazon_web_scrapper")
+@session_cached("amazon_web_scrapper")
 def amazon_web_scrapper(
     product_name: str,
     user_preferences: Optional[Dict[str, Any]] = None,
@@ -237,19 +305,18 @@ def amazon_web_scrapper(
 
     prefs_str = f" with preferences {user_preferences}" if user_preferences else ""
     logger.info(f"Tool: Starting Amazon search for '{product_name}'{prefs_str}")
-    speaker.speak(f"Initiating search on Amazon for {product_name}{prefs_str}. One moment Sir.")
+    narrator.say(f"Initiating search on Amazon for {product_name}{prefs_str}. One moment Sir.")
     try:
         search_url = get_amazon_search_url(query=product_name, domain="in", use_brightdata=False)
-        speaker.speak("I have the search parameters. Accessing Amazon now.")
-        time.sleep(0.5)
+        narrator.say("I have the search parameters. Accessing Amazon now.")
         raw_product_data = extract_amazon_info(search_url=search_url, user_preferences=user_preferences)
         if raw_product_data is None:
             raw_product_data = []
         logger.info(f"Extracted {len(raw_product_data)} raw Amazon entries.")
-        speaker.speak(f"I've gathered {len(raw_product_data)} initial product listings. Now structuring the data.")
+        narrator.say(f"I've gathered {len(raw_product_data)} initial product listings. Now structuring the data.")
         
         if not raw_product_data:
-            speaker.speak(f"I couldn't find any initial listings for {product_name} on Amazon, sir.")
+            narrator.speak(f"I couldn't find any initial listings for {product_name} on Amazon, sir.")
             return json.dumps({"status": "not_found", "message": f"No product listings found for {product_name}."})
         
         if not COHERE_API_KEY:
@@ -257,24 +324,27 @@ def amazon_web_scrapper(
         
         product_list = structure_products_with_cohere(raw_product_data_text=raw_product_data, max_input_chars=100000)
         if not product_list:
-            speaker.speak(f"After processing, I couldn't identify suitable products for {product_name} matching your criteria.")
+            narrator.speak(f"After processing, I couldn't identify suitable products for {product_name} matching your criteria.")
             return json.dumps({"status": "not_found_structured", "message": "Could not structure product data.", "raw_data": raw_product_data}, indent=2)
         
         logger.info(f"✅ Successfully retrieved {len(product_list)} product(s) for: '{product_name}'")
-        speaker.speak(f"Search complete. I found {len(product_list)} product options for {product_name}.")
+        narrator.speak(f"Search complete. I found {len(product_list)} product options for {product_name}.")
         return json.dumps({"status": "success", "data": product_list}, indent=2)
     
     except requests.exceptions.RequestException as e:
          logger.error(f"❌ Network error (Amazon): {e}")
-         speaker.speak("I'm experiencing a network issue while trying to reach Amazon.")
+         narrator.speak("I'm experiencing a network issue while trying to reach Amazon.")
          return json.dumps({"status": "error", "message": "Network error during Amazon search."})
     
     except Exception as e:
          logger.error(f"❌ Unexpected error (Amazon): {e}", exc_info=True)
-         speaker.speak("An unexpected error occurred during the Amazon search.")
+         narrator.speak("An unexpected error occurred during the Amazon search.")
          return json.dumps({"status": "error", "message": f"Amazon search failed: {str(e)}"})
 
 @tool(args_schema=GoogleHotelInput)
+@traced("tool.google_hotel_scrapper")
+@enveloped_result("google_hotel_scrapper")
+@session_cached("google_hotel_scrapper")
 def google_hotel_scrapper(
     location: str,
     check_in_date: str,
@@ -305,21 +375,20 @@ def google_hotel_scrapper(
     prefs = user_preferences or {}
     prefs_str = f" with preferences {prefs}" if prefs else ""
     logger.info(f"Tool: Google Hotel search for '{location}' ({check_in_date} to {check_out_date}){prefs_str}")
-    speaker.speak(f"Searching for hotels in {location} from {check_in_date} to {check_out_date}{prefs_str}. Please wait...")
+    narrator.say(f"Searching for hotels in {location} from {check_in_date} to {check_out_date}{prefs_str}. Please wait...")
     
     try:
         search_url = generate_travel_search_url(user_proxy=False, location=location, check_in_date=check_in_date, check_out_date=check_out_date)
-        speaker.speak("I'm now accessing Google Hotels with the search parameters.")
-        time.sleep(0.5)
+        narrator.say("I'm now accessing Google Hotels with the search parameters.")
         raw_hotel_data = extract_hotel_info(search_url=search_url, user_preferences=prefs)
         
         if raw_hotel_data is None: 
             raw_hotel_data = []
         logger.info(f"Extracted {len(raw_hotel_data)} raw hotel entries.")
-        speaker.speak(f"I've retrieved {len(raw_hotel_data)} initial hotel listings. Processing this information now.")
+        narrator.say(f"I've retrieved {len(raw_hotel_data)} initial hotel listings. Processing this information now.")
         
         if not raw_hotel_data:
-            speaker.speak(f"I was unable to find any hotel listings for {location} on those dates.")
+            narrator.speak(f"I was unable to find any hotel listings for {location} on those dates.")
             return json.dumps({"status": "not_found", "message": f"No hotel listings found for {location}."})
         
         if not COHERE_API_KEY:
@@ -327,29 +396,32 @@ def google_hotel_scrapper(
         hotel_list = structure_hotels_with_cohere(raw_hotel_data_input=raw_hotel_data, max_input_chars=100000)
         
         if not hotel_list:
-            speaker.speak(f"I couldn't structure the hotel data as expected for {location}.")
+            narrator.speak(f"I couldn't structure the hotel data as expected for {location}.")
             return json.dumps({"status": "not_found_structured", "message": "Could not structure hotel data.", "raw_data": raw_hotel_data}, indent=2)
         
         logger.info(f"✅ Successfully retrieved {len(hotel_list)} hotel(s) for: '{location}'")
-        speaker.speak(f"Hotel search complete. I found {len(hotel_list)} options in {location}.")
+        narrator.speak(f"Hotel search complete. I found {len(hotel_list)} options in {location}.")
         return json.dumps({"status": "success", "data": hotel_list}, indent=2)
     
     except ToolException as te:
         logger.error(f"❌ Tool Input Error (Hotels): {te}", exc_info=True)
-        speaker.speak(f"There was an input error for the hotel search: {te}")
+        narrator.speak(f"There was an input error for the hotel search: {te}")
         return json.dumps({"status": "error", "message": f"Hotel search input error: {te}"})
     
     except requests.exceptions.RequestException as e:
         logger.error(f"❌ Network error (Hotels): {e}")
-        speaker.speak("A network problem occurred while searching for hotels.")
+        narrator.speak("A network problem occurred while searching for hotels.")
         return json.dumps({"status": "error", "message": "Network error during hotel search."})
     
     except Exception as e:
         logger.error(f"❌ Unexpected error (Hotels): {e}", exc_info=True)
-        speaker.speak("An unexpected error occurred while searching for hotels.")
+        narrator.speak("An unexpected error occurred while searching for hotels.")
         return json.dumps({"status": "error", "message": f"Hotel search failed: {str(e)}"})
 
 @tool(args_schema=GoogleFlightInput)
+@traced("tool.google_flight_scrapper")
+@enveloped_result("google_flight_scrapper")
+@session_cached("google_flight_scrapper")
 def google_flight_scrapper(
     to_place: str,
     departure_date: str,
@@ -385,23 +457,22 @@ def google_flight_scrapper(
     prefs = user_preferences or {}
     prefs_str = f" with preferences {prefs}" if prefs else ""
     logger.info(f"Tool: Google Flight search: {from_loc} -> {to_place} ({departure_date} to {returned_date}){prefs_str}")
-    speaker.speak(f"Searching for flights from {from_loc} to {to_place}, departing {departure_date} and returning {returned_date}{prefs_str}.")
+    narrator.say(f"Searching for flights from {from_loc} to {to_place}, departing {departure_date} and returning {returned_date}{prefs_str}.")
     
     if not from_place: 
-        speaker.speak("Departure location not specified, results might be broad.")
+        narrator.speak("Departure location not specified, results might be broad.")
     try:
         search_url = generate_search_url(from_airport=from_place, to_airport=to_place, depart_on=departure_date, return_on=returned_date)
-        speaker.speak("Accessing Google Flights...")
-        time.sleep(0.5)
+        narrator.say("Accessing Google Flights...")
         raw_flight_data = extract_flight_info(search_url=search_url, user_preferences=prefs)
         
         if raw_flight_data is None: 
             raw_flight_data = []
         logger.info(f"Extracted {len(raw_flight_data)} raw flight entries.")
-        speaker.speak(f"I've found {len(raw_flight_data)} potential flight itineraries. Now structuring this data.")
+        narrator.say(f"I've found {len(raw_flight_data)} potential flight itineraries. Now structuring this data.")
         
         if not raw_flight_data:
-            speaker.speak(f"No flight information found for {from_loc} to {to_place} on those dates.")
+            narrator.speak(f"No flight information found for {from_loc} to {to_place} on those dates.")
             return json.dumps({"status": "not_found", "message": f"No flights found for {from_loc} -> {to_place}."})
         
         if not COHERE_API_KEY:
@@ -409,30 +480,32 @@ def google_flight_scrapper(
         flight_group_list = structure_flight_list_with_cohere(raw_flight_list_input=raw_flight_data, max_input_chars=100000)
         
         if not flight_group_list:
-            speaker.speak(f"Unable to structure flight data for this route.")
+            narrator.speak(f"Unable to structure flight data for this route.")
             return json.dumps({"status": "not_found_structured", "message": "No suitable flights found after structuring.", "raw_data": raw_flight_data}, indent=2)
         
         logger.info(f"✅ Successfully found {len(flight_group_list)} round-trip flight option(s).")
-        speaker.speak(f"Flight search complete. I have {len(flight_group_list)} round-trip options for you.")
+        narrator.speak(f"Flight search complete. I have {len(flight_group_list)} round-trip options for you.")
         return json.dumps({"status": "success", "data": flight_group_list}, indent=2)
     
     except ToolException as te:
         logger.error(f"❌ Tool Input Error (Flights): {te}", exc_info=True)
-        speaker.speak(f"There was an input error for the flight search: {te}")
+        narrator.speak(f"There was an input error for the flight search: {te}")
         return json.dumps({"status": "error", "message": f"Flight search input error: {te}"})
     
     except requests.exceptions.RequestException as e:
         logger.error(f"❌ Network error (Flights): {e}")
-        speaker.speak("I'm encountering a network issue while searching for flights.")
+        narrator.speak("I'm encountering a network issue while searching for flights.")
         return json.dumps({"status": "error", "message": "Network error during flight search."})
     
     except Exception as e:
         logger.error(f"❌ Unexpected error (Flights): {e}", exc_info=True)
-        speaker.speak("An unexpected error occurred during the flight search.")
+        narrator.speak("An unexpected error occurred during the flight search.")
         return json.dumps({"status": "error", "message": f"Flight search failed: {str(e)}"})
     
 
 @tool(args_schema=JarvesScannerInput)
+@traced("tool.jarves_ocr_scanner")
+@exclusive("camera")
 def jarves_ocr_scanner(
     document_type: str = "general document",
     custom_instructions: str = "Extract all key information. If it's an ID, get name, ID number, phone number. If a receipt, get store, total, date, items. For notes, summarize key points."
@@ -447,27 +520,25 @@ def jarves_ocr_scanner(
 
 
     logger.info(f"🛠️✨ Jarves Scanner: '{document_type}'")
-    speaker.speak(f"Initializing scanner for a {document_type}.Please prepare the document.")
+    narrator.say(f"Initializing scanner for a {document_type}.Please prepare the document.")
     captured_image: np.ndarray = None
     try:
-        time.sleep(0.5)
-        speaker.speak("Activating visual input. Camera module is now live. Please position the document.")
+        narrator.speak("Activating visual input. Camera module is now live. Please position the document.")
         captured_image = capture_image_from_camera()
         if captured_image is not None and captured_image.size > 0:
             logger.info("📸✅ Image captured.")
-            speaker.speak("Image acquired successfully.")
+            narrator.say("Image acquired successfully.")
         else:
             logger.warning("📸⚠️ No image captured or scan cancelled.")
-            speaker.speak("It appears the scan was cancelled or no image was acquired. Aborting scan.")
+            narrator.speak("It appears the scan was cancelled or no image was acquired. Aborting scan.")
             return json.dumps({"status": "cancelled", "message": "Image capture cancelled or failed by user."}, indent=2)
     except Exception as e:
         logger.error(f"📸💥 Capture error: {e}", exc_info=True)
-        speaker.speak(f"I've encountered a critical error during image capture: {str(e)}. Unable to proceed.")
+        narrator.speak(f"I've encountered a critical error during image capture: {str(e)}. Unable to proceed.")
         return json.dumps({"status": "error", "message": f"Critical error during image capture: {str(e)}"}, indent=2)
 
     if captured_image is not None and captured_image.size > 0 :
-        time.sleep(0.5)
-        speaker.speak("Processing the captured image.This may take a few moments.")
+        narrator.say("Processing the captured image.This may take a few moments.")
         structured_output_dict = process_captured_image_with_gemini(
             image_frame=captured_image,
             document_type=document_type,
@@ -476,21 +547,23 @@ def jarves_ocr_scanner(
         if "error" in structured_output_dict:
             logger.error(f"⚠️ Processing error: {structured_output_dict.get('error')}")
             error_detail = structured_output_dict.get('error', 'an unspecified issue')
-            if "OCR" in error_detail: speaker.speak(f"I had trouble reading the text from the image. The specific issue was: {error_detail}")
-            elif "LLM" in error_detail or "Gemini" in error_detail: speaker.speak(f"I encountered a problem while structuring the data. The error was: {error_detail}")
-            else: speaker.speak(f"There was a problem processing the image: {error_detail}")
+            if "OCR" in error_detail: narrator.speak(f"I had trouble reading the text from the image. The specific issue was: {error_detail}")
+            elif "LLM" in error_detail or "Gemini" in error_detail: narrator.speak(f"I encountered a problem while structuring the data. The error was: {error_detail}")
+            else: narrator.speak(f"There was a problem processing the image: {error_detail}")
             if "status" not in structured_output_dict: structured_output_dict["status"] = "error_processing"
             return json.dumps(structured_output_dict, indent=2)
         else:
             logger.info("📄🧠✅ Scan and structuring complete!")
-            speaker.speak("Processing complete.I have structured the information from the document.")
+            narrator.speak("Processing complete.I have structured the information from the document.")
             return json.dumps({"status": "success", "data": structured_output_dict}, indent=2)
     else:
         logger.error("🤔 Internal issue: captured_image is None/empty post-capture.")
-        speaker.speak("There was an unexpected internal issue, and the captured image is unavailable.")
+        narrator.speak("There was an unexpected internal issue, and the captured image is unavailable.")
         return json.dumps({"status": "error", "message": "Internal error: Captured image is unexpectedly unavailable."}, indent=2)
 
 @tool(args_schema=CodeAgentInput)
+@traced("tool.code_agent")
+@exclusive("console")
 def code_agent(
     end_keyword: str = "Ctrl+Z",
     language: str = "python",
@@ -507,28 +580,26 @@ def code_agent(
         task = input.get("task","debug")
 
     logger.info(f"🛠️🤖 Code Agent Tool Activated. Task: '{task}', Lang: '{language}', End keyword: '{end_keyword}'")
-    speaker.speak(f"Activating the Code Agent for {language} to perform task: {task}.")
-    time.sleep(0.5)
+    narrator.say(f"Activating the Code Agent for {language} to perform task: {task}.")
 
     user_code_input: str = ""
     explanation: Optional[str] = None
     fixed_code: Optional[str] = None
 
     try:
-        speaker.speak(f"Please paste or type your {language} code now. Type '{end_keyword}' on a new line when you are finished.")
+        narrator.speak(f"Please paste or type your {language} code now. Type '{end_keyword}' on a new line when you are finished.")
         user_code_input = open_code_input_portal(end_keyword=end_keyword)
 
         if not user_code_input:
             logger.warning("⌨️⚠️ Code input was cancelled or empty.")
-            speaker.speak("Code input was cancelled or no code was provided. Aborting Code Agent.")
+            narrator.speak("Code input was cancelled or no code was provided. Aborting Code Agent.")
             return json.dumps({"status": "cancelled", "message": "Code input cancelled or empty."}, indent=2)
 
         logger.info("⌨️✅ Code input received.")
-        speaker.speak("Thank you. I have received the code.")
-        time.sleep(0.5)
+        narrator.say("Thank you. I have received the code.")
 
         logger.info("🧠 Calling custom code agent for analysis...")
-        speaker.speak("Analyzing the code snippet now. This might take a moment, please wait.")
+        narrator.say("Analyzing the code snippet now. This might take a moment, please wait.")
 
         agent_task_string = f"# Language: {language}\n# Task: {task}\n# Code:\n{user_code_input}"
 
@@ -539,21 +610,20 @@ def code_agent(
 
         if isinstance(explanation_result, str) and ("error" in explanation_result.lower() or "failed" in explanation_result.lower()):
              logger.error(f"🧠❌ Agent analysis indicated failure. Explanation: {explanation_result}")
-             speaker.speak(f"error occured in code analysis.")
+             narrator.speak(f"error occured in code analysis.")
              return json.dumps({"status": "error", "message": f"Agent analysis failed: {explanation_result}", "fixed_code": fixed_code_result}, indent=2)
 
         explanation = explanation_result
         fixed_code = fixed_code_result
 
         logger.info("🧠✅ Code analysis complete.")
-        speaker.speak("Analysis complete. I have prepared an explanation and any necessary code corrections.")
-        time.sleep(0.2)
+        narrator.speak("Analysis complete. I have prepared an explanation and any necessary code corrections.")
 
         if explanation:
             summary = explanation.split('.')[0]
-            speaker.speak(f"Here's a summary: {summary}.")
+            narrator.speak(f"Here's a summary: {summary}.")
         if fixed_code:
-             speaker.speak("I have also prepared a corrected version of the code.")
+             narrator.speak("I have also prepared a corrected version of the code.")
 
         return json.dumps({
             "status": "success",
@@ -563,11 +633,13 @@ def code_agent(
 
     except Exception as e:
         logger.error(f"💥 UNEXPECTED ERROR in Code Agent Tool: {e}", exc_info=True)
-        speaker.speak(f"An unexpected error occurred while running the Code Agent: {str(e)}")
+        narrator.speak(f"An unexpected error occurred while running the Code Agent: {str(e)}")
         return json.dumps({"status": "error", "message": f"Unexpected error in Code Agent: {str(e)}"}, indent=2)
     
 
 @tool(args_schema=WebImageSearchInput)
+@traced("tool.web_and_image_searcher")
+@exclusive("camera")
 def web_and_image_searcher(query: str, include_image: bool = False) -> str:
     """
     🔎 Performs web searches to answer user questions. Can optionally capture and analyze an image
@@ -581,53 +653,50 @@ def web_and_image_searcher(query: str, include_image: bool = False) -> str:
         include_image = input.get("include_image",False)
 
     logger.info(f"🛠️🔎 Web/Image Search Tool Activated. Query: '{query}', Include Image: {include_image}")
-    speaker.speak(f"Searching the web for information regarding: {query}.")
-    time.sleep(0.5)
+    narrator.say(f"Searching the web for information regarding: {query}.")
     image_analysis_text: Optional[str] = None
     search_query = query
     if include_image:
         captured_image: Optional[np.ndarray] = None
         try:
-            speaker.speak("Please show the relevant image to the camera.")
+            narrator.speak("Please show the relevant image to the camera.")
             captured_image = capture_image_from_camera()
             if captured_image is None or captured_image.size == 0:
                 logger.warning("📸⚠️ Image capture cancelled or failed for search.")
-                speaker.speak("Image capture was cancelled or failed. Proceeding with text query only.")
+                narrator.speak("Image capture was cancelled or failed. Proceeding with text query only.")
             else:
                 logger.info("📸✅ Image captured for search query.")
-                speaker.speak("Image captured. Analyzing it now in relation to your query...")
-                time.sleep(0.5)
+                narrator.say("Image captured. Analyzing it now in relation to your query...")
                 is_success, buffer = cv2.imencode(".jpg", captured_image)
                 if not is_success: raise ValueError("Failed to encode image to JPEG.")
                 image_bytes = buffer.tobytes()
                 vision_result = analyze_image_with_langchain_ollama(image_bytes, query)
                 if "error" in vision_result:
                     logger.error(f"Image analysis failed: {vision_result['error']}")
-                    speaker.speak(f"I had trouble analyzing the image: {vision_result['error']}. I will try searching based on the text query alone.")
+                    narrator.speak(f"I had trouble analyzing the image: {vision_result['error']}. I will try searching based on the text query alone.")
                 else:
                     image_analysis_text = vision_result.get("analysis")
                     logger.info(f"Image analysis result: {image_analysis_text[:100]}...")
-                    speaker.speak("Image analysis complete.")
+                    narrator.say("Image analysis complete.")
         except Exception as img_err:
             logger.error(f"📸💥 Error during image handling for search: {img_err}", exc_info=True)
-            speaker.speak(f"An error occurred during image capture or processing:. Searching based on text query only.")
+            narrator.speak(f"An error occurred during image capture or processing:. Searching based on text query only.")
             image_analysis_text = None
 
     search_results_data = None
-    if tavily_client:
-        speaker.speak(f"Performing web search for: {search_query}")
+    if tavily_available():
+        narrator.say(f"Performing web search for: {search_query}")
         search_results_data = perform_web_search(search_query)
         if "error" in search_results_data:
             logger.error(f"Web search failed: {search_results_data['error']}")
-            speaker.speak(f"Web search encountered an error")
+            narrator.speak(f"Web search encountered an error")
     else:
         logger.error("Web search skipped: Tavily client not available.")
-        speaker.speak("Web search is currently unavailable.")
+        narrator.speak("Web search is currently unavailable.")
         if not image_analysis_text:
              return json.dumps({"status": "error", "message": "Web search unavailable and no image provided/analyzed."}, indent=2)
 
-    speaker.speak("Synthesizing the findings...")
-    time.sleep(0.5)
+    narrator.say("Synthesizing the findings...")
     final_result = synthesize_answer_with_gemini(
         original_query=query,
         search_results_data=search_results_data,
@@ -636,15 +705,104 @@ def web_and_image_searcher(query: str, include_image: bool = False) -> str:
 
     if "error" in final_result:
         logger.error(f"Answer synthesis failed: {final_result['error']}")
-        speaker.speak(f"I found some information but encountered an issue formulating the final answer")
+        narrator.speak(f"I found some information but encountered an issue formulating the final answer")
         return json.dumps({"status": "error", "message": final_result.get("error", "Synthesis failed.")}, indent=2)
     else:
         final_answer = final_result.get("answer", "Sorry, I couldn't determine a final answer.")
         logger.info("✅ Web/Image search and synthesis complete.")
-        speaker.speak("Web/Image search and synthesis complete.")
+        narrator.say("Web/Image search and synthesis complete.")
         return json.dumps({"status": "success", "answer": final_answer}, indent=2)
 
+FINDER_COLOR_BOX_OTHER = (255, 178, 50); FINDER_COLOR_BOX_TARGET = (0, 255, 0)
+FINDER_COLOR_TEXT = (255, 255, 255); FINDER_COLOR_BG_TEXT = (50, 50, 50)
+FINDER_COLOR_INFO_TEXT = (0, 255, 255)
+
+# Spoken names -> COCO class names of the YOLO detector.
+OBJECT_SYNONYMS: Dict[str, List[str]] = {
+    "phone": ["cell phone"], "mobile": ["cell phone"], "mobile phone": ["cell phone"], "smartphone": ["cell phone"],
+    "cellphone": ["cell phone"], "iphone": ["cell phone"],
+    "computer": ["laptop"], "macbook": ["laptop"],
+    "television": ["tv"], "monitor": ["tv"], "screen": ["tv"],
+    "remote control": ["remote"], "tv remote": ["remote"],
+    "bag": ["backpack", "handbag", "suitcase"], "purse": ["handbag"], "luggage": ["suitcase"],
+    "mug": ["cup"], "glass": ["wine glass", "cup"], "water bottle": ["bottle"],
+    "sofa": ["couch"], "table": ["dining table"], "desk": ["dining table"], "plant": ["potted plant"],
+    "bike": ["bicycle"], "motorbike": ["motorcycle"], "people": ["person"], "man": ["person"], "woman": ["person"],
+    "kid": ["person"], "child": ["person"], "cat": ["cat"], "puppy": ["dog"], "notebook": ["book", "laptop"],
+}
+
+def _resolve_target_classes(object_name: str, class_names: Dict[int, str]) -> Dict[int, str]:
+    """Class ids (and names) of the detector that correspond to `object_name`; empty if none match."""
+    wanted = re.sub(r"^(my|the|a|an)\s+", "", " ".join(object_name.lower().split())).strip(" .?!")
+    candidates = [wanted]
+    if wanted.endswith("es"): candidates.append(wanted[:-2])
+    if wanted.endswith("s"): candidates.append(wanted[:-1])
+    by_name = {name.lower(): cls_id for cls_id, name in class_names.items()}
+    for candidate in candidates:
+        if candidate in by_name:
+            return {by_name[candidate]: candidate}
+        if candidate in OBJECT_SYNONYMS:
+            return {by_name[n]: n for n in OBJECT_SYNONYMS[candidate] if n in by_name}
+    close = get_close_matches(wanted, list(by_name), n=1, cutoff=0.8)
+    if close:
+        return {by_name[close[0]]: close[0]}
+    return {cls_id: name for name, cls_id in by_name.items() if wanted in name}
+
+def _describe_location(box: List[int], frame_w: int, frame_h: int) -> str:
+    x1, y1, x2, y2 = box
+    center_x, center_y = (x1 + x2) // 2, (y1 + y2) // 2
+    loc_desc = ""
+    if center_y < frame_h / 3: loc_desc += "Top "
+    elif center_y > frame_h * 2 / 3: loc_desc += "Bottom "
+    else: loc_desc += "Center "
+    if center_x < frame_w / 3: loc_desc += "Left"
+    elif center_x > frame_w * 2 / 3: loc_desc += "Right"
+    elif loc_desc == "Center ": loc_desc = "Center"
+    else: loc_desc = loc_desc.strip()
+    return loc_desc
+
+def _yolo_detections(model, frame, confidence_threshold: float, imgsz: int = YOLO_DEFAULT_IMGSZ,
+                     classes: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+    # Always explicit: the shared model would otherwise reuse the previous caller's imgsz/classes.
+    results = model.predict(frame, verbose=False, conf=confidence_threshold, imgsz=imgsz, classes=classes or None)
+    detections = []
+    for result in results:
+        for box in result.boxes:
+            cls_id = int(box.cls[0])
+            detections.append({
+                "label": model.names[cls_id], "cls_id": cls_id,
+                "confidence": float(box.conf[0]), "box": list(map(int, box.xyxy[0])),
+            })
+    return detections
+
+def _draw_detections(frame, detections: List[Dict[str, Any]], target_object_lower: str, object_name: str,
+                     target_class_ids: Optional[Dict[int, str]] = None) -> Optional[Dict[str, Any]]:
+    """Draws the boxes on `frame` and returns the details of the most confident target detection, if any."""
+    frame_h, frame_w = frame.shape[:2]
+    best = None
+    for det in detections:
+        x1, y1, x2, y2 = det["box"]
+        label, conf = det["label"], det["confidence"]
+        is_target = det["cls_id"] in target_class_ids if target_class_ids else target_object_lower in label.lower()
+
+        box_color = FINDER_COLOR_BOX_TARGET if is_target else FINDER_COLOR_BOX_OTHER
+        cv2.rectangle(frame, (x1, y1), (x2, y2), box_color, 2)
+        text = f"{label}: {conf:.2f}"
+        text_org_y = y1 - 10 if y1 > 20 else y1 + 20
+        put_text_with_bg(frame, text, (x1, text_org_y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, FINDER_COLOR_TEXT, FINDER_COLOR_BG_TEXT, padding=3)
+
+        if is_target and (best is None or conf > best["confidence"]):
+            best = {
+                "status": "found", "object_name": object_name,
+                "detected_name": label, "confidence": round(conf, 3),
+                "location_description": _describe_location(det["box"], frame_w, frame_h),
+                "bounding_box": [x1, y1, x2, y2]
+            }
+    return best
+
 @tool(args_schema=VisualObjectFinderInput)
+@traced("tool.visual_object_finder")
+@exclusive("camera")
 def visual_object_finder(
     object_name: str,
     confidence_threshold: float = 0.4,
@@ -654,6 +812,7 @@ def visual_object_finder(
     """
     👀 Activates the camera to visually search for a specific object in the real-time feed using YOLO object detection.
     Shows a live view with brightness/contrast controls and detected objects boxed.
+    Only the requested kind of object is detected, and the search ends as soon as it is seen steadily.
     Use this when the user asks "where is my [object]?" or asks you to "find my [object]" visually.
 
     Args defined in schema.
@@ -668,127 +827,138 @@ def visual_object_finder(
         search_duration_seconds = input.get("search_duration_seconds",30)
         
     logger.info(f"🛠️👀 Visual Object Finder Activated. Searching for: '{object_name}'")
-    speaker.speak(f"Activating visual search. Looking for a {object_name}. Use W/X for brightness, A/D for contrast. Press Q to quit.")
-    time.sleep(0.5)
+    narrator.speak(f"Activating visual search. Looking for a {object_name}. Use W/X for brightness, A/D for contrast. Press Q to quit.")
 
     model_name = 'yolov8n.pt'
     target_object_lower = object_name.lower()
     window_name = "Jarvis - Visual Object Finder"
 
-    COLOR_BOX_OTHER = (255, 178, 50); COLOR_BOX_TARGET = (0, 255, 0)
-    COLOR_TEXT = (255, 255, 255); COLOR_BG_TEXT = (50, 50, 50)
-    COLOR_INFO_TEXT = (0, 255, 255)
-
     found_object_details = None
     start_time = time.time()
-    brightness, contrast = 0, 0
+    adjustments = {"brightness": 0, "contrast": 0}
     user_quit = False
     cap = None
+    grabber = worker = render_meter = None
+    pipeline_report = None
+
+    def _preprocess(frame):
+        if adjustments["brightness"] != 0 or adjustments["contrast"] != 0:
+            return apply_brightness_contrast(frame, adjustments["brightness"], adjustments["contrast"])
+        return frame
 
     try:
-        logger.info(f"Loading YOLO model: {model_name}")
-        model = YOLO(model_name)
-        logger.info("YOLO model loaded successfully.")
+        # Loaded and warmed up once per process; later searches reuse the same detector.
+        with span("yolo.get_model", model=model_name):
+            model = get_yolo_model(model_name)
+
+        # Only the requested classes are detected and drawn; unknown names fall back to all classes.
+        target_classes = _resolve_target_classes(object_name, model.names)
+        class_filter = sorted(target_classes) or None
+        if target_classes:
+            logger.info(f"🎯 '{object_name}' resolved to detector classes {target_classes}.")
+        else:
+            logger.warning(f"'{object_name}' does not match any detector class; scanning all classes.")
 
         cap = cv2.VideoCapture(camera_index)
         if not cap.isOpened():
             raise IOError(f"Could not open camera index {camera_index}.")
 
-        logger.info(f"📷 Camera {camera_index} opened. Starting detection loop (max {search_duration_seconds}s).")
+        if VISION_PIPELINE_ENABLED:
+            # Capture, inference and display run at their own pace; the window shows the newest frame
+            # with the most recent detections instead of waiting for every inference.
+            grabber = LatestFrameGrabber(cap).start()
+            worker = InferenceWorker(
+                grabber, lambda f: _yolo_detections(model, _preprocess(f), confidence_threshold, imgsz=VISION_IMGSZ, classes=class_filter),
+                stride=VISION_STRIDE,
+            ).start()
+            render_meter = RateMeter()
+        mode = f"pipelined, imgsz {VISION_IMGSZ}, stride {VISION_STRIDE}" if worker else "sequential"
+        logger.info(f"📷 Camera {camera_index} opened. Starting detection loop ({mode}, max {search_duration_seconds}s).")
         print(f"👀 Live View Active: Searching for '{object_name}'. Controls: [W/X] Brightness | [A/D] Contrast | [Q] Quit")
-        
+
+        last_frame_seq = last_result_seq = 0
+        stable_hits = 0
         while True:
             elapsed_time = time.time() - start_time
             if elapsed_time > search_duration_seconds:
                 logger.info(f"⏰ Search duration ({search_duration_seconds}s) exceeded.")
-                speaker.speak("Search time limit reached.")
+                narrator.speak("Search time limit reached.")
                 break
 
-            ret, frame = cap.read()
-            if not ret:
-                logger.warning("⚠️ Camera frame read error."); time.sleep(0.1); continue
-
-            display_frame = frame.copy()
-            if brightness != 0 or contrast != 0:
-                display_frame = apply_brightness_contrast(display_frame, brightness, contrast)
-
-            frame_h, frame_w = display_frame.shape[:2]
-            results = model(display_frame, stream=False, verbose=False, conf=confidence_threshold)
-
-            object_found_in_frame = False
-            current_highest_conf = 0.0
-            temp_found_details = None
-
-            for result in results:
-                boxes = result.boxes
-                for box in boxes:
-                    x1, y1, x2, y2 = map(int, box.xyxy[0])
-                    conf = float(box.conf[0])
-                    cls_id = int(box.cls[0])
-                    label = model.names[cls_id]
-                    is_target = target_object_lower in label.lower()
-
-                    box_color = COLOR_BOX_TARGET if is_target else COLOR_BOX_OTHER
-                    cv2.rectangle(display_frame, (x1, y1), (x2, y2), box_color, 2)
-                    text = f"{label}: {conf:.2f}"
-                    text_org_y = y1 - 10 if y1 > 20 else y1 + 20
-                    put_text_with_bg(display_frame, text, (x1, text_org_y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, COLOR_TEXT, COLOR_BG_TEXT, padding=3)
-
-                    if is_target and conf > current_highest_conf:
-                        object_found_in_frame = True
-                        current_highest_conf = conf
-                        center_x, center_y = (x1 + x2) // 2, (y1 + y2) // 2
-                        loc_desc = ""
-                        if center_y < frame_h / 3: loc_desc += "Top "
-                        elif center_y > frame_h * 2 / 3: loc_desc += "Bottom "
-                        else: loc_desc += "Center "
-                        if center_x < frame_w / 3: loc_desc += "Left"
-                        elif center_x > frame_w * 2 / 3: loc_desc += "Right"
-                        elif loc_desc == "Center ": loc_desc = "Center"
-                        else: loc_desc = loc_desc.strip()
-                        temp_found_details = {
-                            "status": "found", "object_name": object_name,
-                            "detected_name": label, "confidence": round(conf, 3),
-                            "location_description": loc_desc,
-                            "bounding_box": [x1, y1, x2, y2]
-                        }
-
-            if temp_found_details:
+            if worker:
+                packet = grabber.wait_newer(last_frame_seq, timeout=0.1)
+                if packet is None:
+                    continue
+                last_frame_seq = packet.seq
+                display_frame = _preprocess(packet.frame).copy()
+                result = worker.latest_result()
+                detections = result.detections if result else []
+                fresh_detections = result is not None and result.seq != last_result_seq
+                if fresh_detections:
+                    last_result_seq = result.seq
+                render_meter.tick()
+            else:
+                ret, frame = cap.read()
+                if not ret:
+                    logger.warning("⚠️ Camera frame read error."); time.sleep(0.1); continue
+                display_frame = _preprocess(frame.copy())
+                detections = _yolo_detections(model, display_frame, confidence_threshold, classes=class_filter)
+                fresh_detections = True
+
+            temp_found_details = _draw_detections(display_frame, detections, target_object_lower, object_name, target_classes)
+            if fresh_detections:
+                stable_hits = stable_hits + 1 if temp_found_details else 0
+            if fresh_detections and temp_found_details:
                 if found_object_details is None or temp_found_details['confidence'] > found_object_details.get('confidence', 0.0):
                     found_object_details = temp_found_details
 
             remaining_time = max(0, int(search_duration_seconds - elapsed_time))
-            status_text = f"Searching: {object_name} | T Left: {remaining_time}s | B:{brightness} C:{contrast} | Q:Quit"
+            status_text = f"Searching: {object_name} | T Left: {remaining_time}s | B:{adjustments['brightness']} C:{adjustments['contrast']} | Q:Quit"
             if found_object_details and temp_found_details and found_object_details['bounding_box'] == temp_found_details['bounding_box']: # Show live best match
                  status_text += f" | Found: {found_object_details['detected_name']} ({found_object_details['confidence']:.2f}) at {found_object_details['location_description']}"
 
-            put_text_with_bg(display_frame, status_text,(10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, COLOR_INFO_TEXT, COLOR_BG_TEXT, 1)
+            put_text_with_bg(display_frame, status_text,(10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, FINDER_COLOR_INFO_TEXT, FINDER_COLOR_BG_TEXT, 1)
+            if worker:
+                perf_text = f"Cam {grabber.meter.rate():.0f} fps | Det {worker.meter.rate():.1f} fps | View {render_meter.rate():.0f} fps"
+                put_text_with_bg(display_frame, perf_text, (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.5, FINDER_COLOR_INFO_TEXT, FINDER_COLOR_BG_TEXT, 1)
             cv2.imshow(window_name, display_frame)
 
+            if VISION_STABLE_FRAMES > 0 and stable_hits >= VISION_STABLE_FRAMES:
+                logger.info(f"🎯 '{object_name}' detected in {stable_hits} consecutive inferences after {elapsed_time:.1f}s; ending search early.")
+                found_object_details["stable_frames"] = stable_hits
+                found_object_details["search_seconds"] = round(elapsed_time, 2)
+                cv2.waitKey(1)
+                break
+
             key = cv2.waitKey(1) & 0xFF
             if key == ord('q') or key == ord('Q'):
                 logger.info("🛑 User quit visual search early via 'Q' key.")
-                speaker.speak("Stopping visual search as requested.")
+                narrator.speak("Stopping visual search as requested.")
                 user_quit = True
                 break
-            elif key == ord('w'): brightness = min(255, brightness + 10)
-            elif key == ord('x'): brightness = max(-255, brightness - 10)
-            elif key == ord('a'): contrast = max(-127, contrast - 10)
-            elif key == ord('d'): contrast = min(127, contrast + 10)
+            elif key == ord('w'): adjustments["brightness"] = min(255, adjustments["brightness"] + 10)
+            elif key == ord('x'): adjustments["brightness"] = max(-255, adjustments["brightness"] - 10)
+            elif key == ord('a'): adjustments["contrast"] = max(-127, adjustments["contrast"] - 10)
+            elif key == ord('d'): adjustments["contrast"] = min(127, adjustments["contrast"] + 10)
 
     except ImportError:
         logger.critical("💥 Ultralytics YOLO library not found. Please run 'pip install ultralytics'")
-        speaker.speak("I cannot perform visual search as the required library is missing.")
+        narrator.speak("I cannot perform visual search as the required library is missing.")
         return json.dumps({"status": "error", "message": "YOLO library not installed."}, indent=2)
     except IOError as e: 
          logger.error(f"📸💥 Camera Error: {e}", exc_info=True)
-         speaker.speak(f"I encountered an error accessing the camera")
+         narrator.speak(f"I encountered an error accessing the camera")
          return json.dumps({"status": "error", "message": f"Camera access error: {e}"}, indent=2)
     except Exception as e:
         logger.error(f"💥 UNEXPECTED ERROR in Visual Object Finder: {e}", exc_info=True)
-        speaker.speak(f"An unexpected error occurred during the visual search")
+        narrator.speak(f"An unexpected error occurred during the visual search")
         return json.dumps({"status": "error", "message": f"Unexpected error during visual search: {str(e)}"}, indent=2)
     finally:
+        if worker: worker.stop()
+        if grabber:
+            grabber.stop()
+            pipeline_report = pipeline_stats(grabber, worker, render_meter)
+            logger.info(f"📊 Visual search pipeline: {pipeline_report}")
         if cap and cap.isOpened(): cap.release()
         cv2.destroyAllWindows()
         logger.info("Camera feed closed.")
@@ -800,15 +970,19 @@ def visual_object_finder(
          loc = found_object_details['location_description'].lower()
          det_name = found_object_details['detected_name']
          conf = found_object_details['confidence']
-         speaker.speak(f"Search complete. I located the {det_name} in the {loc} area of the view with {conf:.0%} confidence.")
+         narrator.speak(f"Search complete. I located the {det_name} in the {loc} area of the view with {conf:.0%} confidence.")
+         if pipeline_report: found_object_details["pipeline_stats"] = pipeline_report
          return json.dumps(found_object_details, indent=2)
     else:
          logger.warning(f"🚫 Object '{object_name}' not found within time/confidence limit.")
-         speaker.speak(f"Search complete. I did not visually locate the {object_name}.")
-         return json.dumps({"status": "not_found", "object_name": object_name, "message": "Object not detected in the video feed within time/confidence limits."}, indent=2)
+         narrator.speak(f"Search complete. I did not visually locate the {object_name}.")
+         not_found = {"status": "not_found", "object_name": object_name, "message": "Object not detected in the video feed within time/confidence limits."}
+         if pipeline_report: not_found["pipeline_stats"] = pipeline_report
+         return json.dumps(not_found, indent=2)
     
 
 @tool(args_schema=EmailToolInput)
+@traced("tool.email_manager")
 def email_manager(
     action: str, max_emails_to_check: int = 3, recipient_email: Optional[str] = None,
     subject: Optional[str] = None, body: Optional[str] = None, original_message_id: Optional[str] = None,
@@ -833,11 +1007,10 @@ def email_manager(
         original_subject = parsed_data_dict.get("original_subject")
         original_body_snippet = parsed_data_dict.get("original_body_snippet")
 
-    if not EMAIL_TOOL_AVAILABLE:
+    if not email_tool_available():
         return json.dumps({"status": "error", "message": "Email tool logic unavailable."})
     logger.info(f"🛠️📧 Email Manager: Action '{action}'")
-    speaker.speak(f"Accessing email systems for action: {action}.")
-    time.sleep(0.5)
+    narrator.say(f"Accessing email systems for action: {action}.")
     service = None
     try:
         service = get_gmail_service()
@@ -846,40 +1019,42 @@ def email_manager(
     except Exception as e: return json.dumps({"status": "error_authentication", "message": f"Auth error: {str(e)}"})
 
     if action == "check_new":
-        speaker.speak(f"Checking for up to {max_emails_to_check} new unread emails.")
+        narrator.say(f"Checking for up to {max_emails_to_check} new unread emails.")
         unread_emails = get_unread_emails(max_results=max_emails_to_check)
         if not unread_emails:
-            speaker.speak("No new unread emails found.")
+            narrator.speak("No new unread emails found.")
             return json.dumps({"status": "success", "message": "No new unread emails."})
         processed_emails = []
         for email_data in unread_emails:
-            speaker.speak(f"Processing email from {email_data['sender_email']} about {email_data['subject'][:30]}.")
+            narrator.say(f"Processing email from {email_data['sender_email']} about {email_data['subject'][:30]}.")
             history = get_conversation_history(email_data['sender_email'], email_data['subject'].split())
             draft_reply = draft_reply_with_llm(email_data['body'], email_data['sender_email'], email_data['subject'], history)
             processed_emails.append({"original_email": email_data, "suggested_draft_reply": draft_reply, "requires_action": not ("no reply needed" in draft_reply.lower() or "mark as read" in draft_reply.lower())})
             if "mark as read" in draft_reply.lower() or "no reply needed" in draft_reply.lower():
                  mark_email_as_read(service, email_data['id'])
-                 speaker.speak(f"Email regarding '{email_data['subject'][:30]}' marked as read.")
+                 narrator.say(f"Email regarding '{email_data['subject'][:30]}' marked as read.")
         num_actionable = sum(1 for e in processed_emails if e["requires_action"])
-        speaker.speak(f"Checked emails. Found {len(unread_emails)} new. {num_actionable} may require a reply.")
+        narrator.speak(f"Checked emails. Found {len(unread_emails)} new. {num_actionable} may require a reply.")
         return json.dumps({"status": "success", "processed_emails": processed_emails}, indent=2)
     elif action == "send_draft":
         if not all([recipient_email, subject, body]):
             return json.dumps({"status": "error_input", "message": "Recipient, subject, and body required for send_draft."})
-        speaker.speak(f"Preparing to send email to {recipient_email} with subject {subject[:30]}.")
+        narrator.say(f"Preparing to send email to {recipient_email} with subject {subject[:30]}.")
         success, message = send_email(service, recipient_email, subject, body, original_thread_id)
         if success:
-            speaker.speak("Email sent successfully.")
+            narrator.speak("Email sent successfully.")
             if all([original_sender, original_subject, original_body_snippet]):
                  add_to_memory(original_sender, original_subject, original_body_snippet, body)
             if original_message_id: mark_email_as_read(service, original_message_id)
-        else: speaker.speak(f"Failed to send email: {message}")
+        else: narrator.speak(f"Failed to send email: {message}")
         return json.dumps({"status": "success" if success else "error_send", "message": message}, indent=2)
     else:
         return json.dumps({"status": "error_action", "message": f"Unknown action: {action}."}, indent=2)
 
 
 @tool(args_schema=ResumeAnalyzerInput)
+@traced("tool.resume_analyzer")
+@exclusive("console")
 def resume_analyzer(
     job_description_end_keyword: str = "END_JD",
     config: Optional[RunnableConfig] = None
@@ -894,41 +1069,127 @@ def resume_analyzer(
 
     resume_pdf_path = "C:/Users/Debajyoti/OneDrive/Desktop/Jarves full agent/ResumeAnalyser/resume.pdf"
     logger.info(f"🛠️📄 Resume Analyzer Tool Activated.")
-    speaker.speak("Activating Resume Analyzer. I'll need the job description first.")
-    time.sleep(0.5)
+    narrator.say("Activating Resume Analyzer. I'll need the job description first.")
 
-    speaker.speak(f"Please paste or type the job description. Type '{job_description_end_keyword}' on a new line when finished.")
+    narrator.speak(f"Please paste or type the job description. Type '{job_description_end_keyword}' on a new line when finished.")
     job_description_text = open_code_input_portal(
         prompt_message="▶️ Enter Job Description:",
         end_keyword=job_description_end_keyword
     )
     if not job_description_text:
-        speaker.speak("No job description provided. Aborting resume analysis.")
+        narrator.speak("No job description provided. Aborting resume analysis.")
         return json.dumps({"status": "cancelled", "message": "Job description input cancelled or empty."}, indent=2)
-    speaker.speak("Job description received.")
-    time.sleep(0.2)
+    narrator.say("Job description received.")
 
     actual_resume_path = resume_pdf_path or os.getenv("RESUME_PDF_PATH")
     if not actual_resume_path:
         msg = "Path to your resume PDF not configured. Set YOUR_RESUME_PDF_PATH or provide 'resume_pdf_path'."
-        speaker.speak(msg); return json.dumps({"status": "error_configuration", "message": msg})
+        narrator.speak(msg); return json.dumps({"status": "error_configuration", "message": msg})
 
-    speaker.speak(f"Reading your resume...")
+    narrator.say(f"Reading your resume...")
     resume_text = extract_text_from_pdf(actual_resume_path)
     if not resume_text:
         msg = f"Could not extract text from your resume PDF at {actual_resume_path}."
-        speaker.speak(msg)
+        narrator.speak(msg)
         return json.dumps({"status": "error_resume_read", "message": msg})
     
-    speaker.speak("Resume content extracted.")
-    time.sleep(0.2)
+    narrator.say("Resume content extracted.")
 
-    speaker.speak("Comparing your resume against the job description. This might take a moment...")
+    narrator.say("Comparing your resume against the job description. This might take a moment...")
     analysis_result = analyze_resume_with_llm(resume_text, job_description_text)
 
     if "error" in analysis_result:
-        speaker.speak(f"Issue during analysis: {analysis_result.get('error')}")
+        narrator.speak(f"Issue during analysis: {analysis_result.get('error')}")
         return json.dumps({"status": "error_analysis", **analysis_result}, indent=2)
     else:
-        speaker.speak("Resume analysis complete. I have the results.")
+        narrator.speak("Resume analysis complete. I have the results.")
         return json.dumps({"status": "success", "analysis": analysis_result}, indent=2)
+
+@tool(args_schema=PreviousResultsQueryInput)
+@traced("tool.query_previous_results")
+def query_previous_results(
+    result_id: Optional[str] = None,
+    tool_name: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    sort_by: Optional[str] = None,
+    descending: bool = False,
+    limit: int = 5
+) -> str:
+    """
+    🗂️ Answers follow-up questions about results already fetched in this session (products, hotels, flights)
+    without searching again, e.g. "which of those laptops is cheapest?" or "only the hotels rated above 4".
+    Filters and sorts the stored records; no network access. Use it before re-running a search tool.
+    Returns JSON with the matching records, or status 'not_found' if nothing is stored.
+    """
+    if result_id and result_id.startswith("{"):
+        try:
+            input_data = json.loads(result_id)
+            result_id, tool_name = input_data.get("result_id"), input_data.get("tool_name", tool_name)
+            filters, sort_by = input_data.get("filters", filters), input_data.get("sort_by", sort_by)
+            descending, limit = input_data.get("descending", descending), input_data.get("limit", limit)
+        except json.JSONDecodeError:
+            return json.dumps({"status": "error", "message": "Invalid JSON input format for result_id field."})
+
+    entry = session_results.get(result_id) if result_id else session_results.latest(tool_name)
+    if entry is None:
+        available = [{"result_id": e["result_id"], "tool": e["tool"], "args": e["args"]} for e in session_results.entries()]
+        return json.dumps({"status": "not_found", "message": "No matching earlier result in this session (it may have expired).",
+                           "available_results": available})
+
+    records = entry["result"].get("data")
+    if not isinstance(records, list):
+        return json.dumps({"status": "success", "result_id": entry["result_id"], "tool": entry["tool"], "data": entry["result"]})
+    try:
+        matched = query_records(records, filters=filters, sort_by=sort_by, descending=descending)
+    except Exception as e:
+        return json.dumps({"status": "error", "message": f"Could not apply the query: {e}"})
+    logger.info(f"Session query on {entry['result_id']} ({entry['tool']}): {len(matched)}/{len(records)} records match.")
+    return dumps_compact({
+        "status": "success",
+        "result_id": entry["result_id"],
+        "tool": entry["tool"],
+        "search_args": entry["args"],
+        "age_seconds": round(time.time() - entry["created_at"]),
+        "total_records": len(records),
+        "matched_records": len(matched),
+        "data": [compact_record(r) for r in matched[:max(1, int(limit))]],
+    })
+
+@tool(args_schema=StoredResultPageInput)
+@traced("tool.get_stored_result")
+def get_stored_result(result_id: str, offset: int = 0, limit: int = 5, field: str = "data") -> str:
+    """
+    📄 Pages through the full data of an earlier tool result that was shortened for you
+    (the observation showed 'more_records' or a '*_preview' field and a 'result_id', or
+    ended with 'full payload: obs-...'; pass that obs-... handle as result_id).
+    Returns records offset..offset+limit of the stored list (or a chunk of a text field) and 'next_offset'.
+    Local only; no network access.
+    """
+    if result_id.startswith("{"):
+        try:
+            input_data = json.loads(result_id)
+            result_id = input_data.get("result_id", "")
+            offset, limit = int(input_data.get("offset", offset)), int(input_data.get("limit", limit))
+            field = input_data.get("field", field)
+        except (json.JSONDecodeError, TypeError, ValueError):
+            return json.dumps({"status": "error", "message": "Invalid JSON input format for result_id field."})
+    entry = session_results.get(result_id) or _stored_payload_entry(result_id)
+    if entry is None:
+        return json.dumps({"status": "not_found", "message": f"No stored result '{result_id}' (it may have expired)."})
+    return dumps_compact(result_page(entry, field=field, offset=offset, limit=limit))
+
+def _stored_payload_entry(handle: str) -> Optional[Dict[str, Any]]:
+    """A full observation the scratchpad compacted (handle 'obs-...'), shaped like a session_results entry."""
+    if not handle.startswith(f"{payload_store.prefix}-"):
+        return None
+    item = payload_store.get(handle)
+    if item is None:
+        return None
+    try:
+        result = json.loads(item["payload"])
+    except (TypeError, json.JSONDecodeError):
+        result = None
+    if not isinstance(result, dict):
+        # Plain-text observations are paged as the text of a "data" field.
+        result = {"data": item["payload"]}
+    return {"result_id": handle, "tool": item["source"].split(":", 1)[0], "result": result}
@@ -1,10 +1,17 @@
+import os
+import sys
 import pyttsx3
 import speech_recognition as sr
 import config
 
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path: sys.path.append(project_root)
+from utils.speech_to_text import get_stt_backend, listen_streaming
+
 class SpeechService:
     def __init__(self):
         self.recognizer = sr.Recognizer()
+        self.stt = get_stt_backend(self.recognizer)
         self.speaker = pyttsx3.init()
 
     def speak(self, text):
@@ -15,19 +22,27 @@ class SpeechService:
         except Exception as e:
             print(f"TTS Error: {e}")
 
-    def listen(self, prompt_text=None):
+    def listen(self, prompt_text=None, early_phrases=()):
         if prompt_text:
             self.speak(prompt_text)
         with sr.Microphone() as source:
             print("Listening...")
             self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
             try:
-                audio = self.recognizer.listen(
-                    source,
-                    timeout=config.SPEECH_TIMEOUT_SECONDS,
-                    phrase_time_limit=config.SPEECH_PHRASE_LIMIT_SECONDS
-                )
-                recognized_text = self.recognizer.recognize_google(audio)
+                if self.stt.streaming:
+                    recognized_text = listen_streaming(
+                        self.stt, iter(lambda: source.stream.read(source.CHUNK), None), source.SAMPLE_RATE,
+                        timeout=config.SPEECH_TIMEOUT_SECONDS,
+                        phrase_time_limit=config.SPEECH_PHRASE_LIMIT_SECONDS,
+                        is_complete=lambda partial: partial.strip().lower() in early_phrases
+                    )["text"]
+                else:
+                    audio = self.recognizer.listen(
+                        source,
+                        timeout=config.SPEECH_TIMEOUT_SECONDS,
+                        phrase_time_limit=config.SPEECH_PHRASE_LIMIT_SECONDS
+                    )
+                    recognized_text = self.stt.transcribe(audio)
                 print(f"You: {recognized_text}")
                 return recognized_text.lower()
             except sr.WaitTimeoutError:
@@ -64,7 +64,7 @@ class WhatsAppVoiceAssistant:
     def run(self):
         self.speaker.speak("WhatsApp Voice Assistant activated! How can I help?")
         while True:
-            user_command = self.speaker.listen()
+            user_command = self.speaker.listen(early_phrases=("exit", "stop"))
             if user_command is None:
                 time.sleep(1)
                 continue
@@ -83,7 +83,8 @@ class YouTubeVoiceAssistant:
                 self.browser.highlight_element(video_element)
                 self.browser.hover_element(video_element)
                 
-                hover_command = self.recognizer.listen_for_command(listen_timeout=HOVER_LISTEN_TIMEOUT_SECONDS)
+                hover_command = self.recognizer.listen_for_command(listen_timeout=HOVER_LISTEN_TIMEOUT_SECONDS,
+                                                                   early_phrases=("stop", "play video"))
                 
                 self.browser.highlight_element(video_element, remove=True)
                 self.last_hovered_element = None
@@ -190,7 +191,8 @@ class YouTubeVoiceAssistant:
         running = True
         while running:
             self.tts.speak(f"\nListening for general command... (Hover mode: {'ON' if self.hover_mode_active else 'OFF'})", console_only=True)
-            command = self.recognizer.listen_for_command(listen_timeout=GENERAL_LISTEN_TIMEOUT_SECONDS)
+            command = self.recognizer.listen_for_command(listen_timeout=GENERAL_LISTEN_TIMEOUT_SECONDS,
+                                                         early_phrases=("exit", "stop", "back", "start hover"))
             
             if not command:
                 continue
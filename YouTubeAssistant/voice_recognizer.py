@@ -1,11 +1,18 @@
+import os
+import sys
 import speech_recognition as sr
 from config import GENERAL_LISTEN_TIMEOUT_SECONDS, HOVER_LISTEN_TIMEOUT_SECONDS
 
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path: sys.path.append(project_root)
+from utils.speech_to_text import get_stt_backend, listen_streaming
+
 class VoiceRecognizer:
     def __init__(self, tts_manager=None):
         self.recognizer = sr.Recognizer()
         self.microphone = sr.Microphone()
         self.tts_manager = tts_manager
+        self.stt = get_stt_backend(self.recognizer)
         with self.microphone as source:
             print("VoiceRecognizer: Adjusting for ambient noise, please wait...")
             self.recognizer.adjust_for_ambient_noise(source, duration=1.5)
@@ -18,7 +25,7 @@ class VoiceRecognizer:
         else:
             print(f"RECOGNIZER: {message}")
 
-    def listen_for_command(self, listen_timeout=GENERAL_LISTEN_TIMEOUT_SECONDS, phrase_limit=5):
+    def listen_for_command(self, listen_timeout=GENERAL_LISTEN_TIMEOUT_SECONDS, phrase_limit=5, early_phrases=()):
         with self.microphone as source:
             speak_listening_prompt = listen_timeout >= GENERAL_LISTEN_TIMEOUT_SECONDS - 0.1
             if speak_listening_prompt:
@@ -27,8 +34,15 @@ class VoiceRecognizer:
                 print(f"Listening for command ({listen_timeout}s)...")
             
             try:
-                audio = self.recognizer.listen(source, timeout=listen_timeout, phrase_time_limit=phrase_limit)
-                command = self.recognizer.recognize_google(audio).lower()
+                if self.stt.streaming:
+                    # Short commands such as "stop" are acted on from a stable partial transcript.
+                    command = listen_streaming(
+                        self.stt, iter(lambda: source.stream.read(source.CHUNK), None), source.SAMPLE_RATE,
+                        timeout=listen_timeout, phrase_time_limit=phrase_limit,
+                        is_complete=lambda partial: partial.strip().lower() in early_phrases)["text"].lower()
+                else:
+                    audio = self.recognizer.listen(source, timeout=listen_timeout, phrase_time_limit=phrase_limit)
+                    command = self.stt.transcribe(audio).lower()
                 self._provide_feedback(f"You said: {command}")
                 return command
             except sr.WaitTimeoutError:
@@ -39,5 +53,5 @@ class VoiceRecognizer:
                 self._provide_feedback("Could not understand audio.")
                 return None
             except sr.RequestError as e:
-                self._provide_feedback(f"Google Speech Recognition service error; {e}")
+                self._provide_feedback(f"Speech recognition service error; {e}")
                 return None
\ No newline at end of file
@@ -0,0 +1,21 @@
+import importlib.util
+import os
+import sys
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+
+def load_module(relative_path: str, name: str):
+    """
+    Imports one module file without running its package's __init__ (MainAgent/__init__ builds the
+    agent and needs an API key; JarvesVoice/__init__ loads the audio stack).
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(project_root, relative_path))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
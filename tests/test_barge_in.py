@@ -0,0 +1,53 @@
+import pytest
+
+from conftest import load_module
+
+barge_in = load_module("JarvesVoice/barge_in.py", "jarvis_test_barge_in")
+
+
+def monitor(speaking: str = ""):
+    return barge_in.BargeInMonitor(audio_stream=None, on_barge_in=lambda event: None,
+                                   phrases=("stop", "jarvis stop", "stop jarvis", "cancel", "that's enough", "be quiet"),
+                                   current_text=lambda: speaking)
+
+
+@pytest.mark.parametrize("transcript, expected", [
+    ("stop", "stop"),
+    ("Stop!", "stop"),
+    ("okay okay stop", "stop"),
+    ("Jarvis, stop.", "jarvis stop"),
+    ("stop jarvis", "stop jarvis"),
+    ("please cancel", "cancel"),
+    ("alright that's enough", "that's enough"),
+    ("can you be quiet", "be quiet"),
+    ("stop talking about the weather", None),
+    ("the bus stop", "stop"),
+    ("nonstop", None),
+    ("cancellation", None),
+    ("", None),
+])
+def test_phrase_at_end(transcript, expected):
+    assert monitor()._phrase_at_end(transcript) == expected
+
+
+@pytest.mark.parametrize("speaking, transcript, expected", [
+    ("The next bus stop is Main Street.", "the next bus stop", None),
+    ("You can cancel the order online.", "you can cancel", None),
+    ("Nonstop flights are cheaper.", "stop", "stop"),
+    ("Cancellation is free.", "please cancel", "cancel"),
+    ("Say stop, Jarvis.", "stop jarvis", None),
+    ("Say stop.", "stop jarvis", "stop jarvis"),
+])
+def test_phrase_spoken_by_jarvis_is_ignored(speaking, transcript, expected):
+    assert monitor(speaking)._phrase_at_end(transcript) == expected
+
+
+@pytest.mark.parametrize("speaking, expected", [
+    ("I am Jarvis, your assistant.", True),
+    ("JARVES here.", True),
+    ("The weather is sunny.", False),
+    ("Jarvisville is a town.", False),
+    ("", False),
+])
+def test_speaking_wake_word(speaking, expected):
+    assert monitor(speaking)._speaking_wake_word() is expected
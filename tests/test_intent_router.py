@@ -0,0 +1,108 @@
+import pytest
+
+from conftest import load_module
+
+intent_router = load_module("MainAgent/intent_router.py", "jarvis_test_intent_router")
+
+APPS = {"word": "winword", "notepad": "notepad", "calculator": "calc", "chrome": "chrome", "spotify": "spotify",
+        "vs code": "code", "whatsapp": "whatsapp"}
+SITES = {"youtube": "https://youtube.com", "gmail": "https://mail.google.com", "github": "https://github.com",
+         "amazon": "https://amazon.in"}
+
+
+class FakeTool:
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = []
+
+    def invoke(self, args):
+        self.calls.append(args)
+        return f"✅ {self.name} {args}"
+
+
+@pytest.fixture
+def router():
+    return intent_router.IntentRouter(FakeTool("open_app_tool"), FakeTool("open_website_tool"),
+                                      min_confidence=0.85, app_commands=APPS, websites=SITES)
+
+
+@pytest.mark.parametrize("command, tool, target", [
+    ("open notepad", "open_app_tool", "notepad"),
+    ("Open Notepad.", "open_app_tool", "notepad"),
+    ("hey jarvis, please open the calculator", "open_app_tool", "calculator"),
+    ("could you launch vs code for me", "open_app_tool", "vs code"),
+    ("start spotify now", "open_app_tool", "spotify"),
+    ("bring up my chrome app", "open_app_tool", "chrome"),
+    ("open youtube", "open_website_tool", "youtube"),
+    ("go to github.com", "open_website_tool", "github"),
+    ("open the amazon website", "open_website_tool", "amazon"),
+    ("open gmail dot com", "open_website_tool", "gmail"),
+    ("open calculater", "open_app_tool", "calculator"),
+    ("open spotfy", "open_app_tool", "spotify"),
+])
+def test_routes_simple_open_commands(router, command, tool, target):
+    route = router.match(command)
+    assert route is not None
+    assert (route["tool"].name, route["target"]) == (tool, target)
+    assert route["confidence"] >= router.min_confidence
+    assert router.dispatch(command) is not None
+    assert route["tool"].calls, "dispatch should invoke the matched tool"
+
+
+@pytest.mark.parametrize("command", [
+    "open notepad and type hello",
+    "open youtube then play lofi music",
+    "open chrome, then github",
+    "open youtube and search for cats",
+    "open spotify with my liked songs",
+    "open amazon to find a keyboard about cats",
+    "launch chrome after the meeting",
+    "open notepad if it is closed",
+    "what is the capital of France?",
+    "tell me how to open a jar",
+    "can you find flights to delhi",
+])
+def test_compound_or_qualified_commands_fall_back(router, command):
+    assert router.match(command) is None
+    assert router.dispatch(command) is None
+    assert not router.app_tool.calls and not router.website_tool.calls
+
+
+@pytest.mark.parametrize("command", [
+    "start work",
+    "open mail",
+    "open tube",
+    "run the numbers",
+    "open the pod bay doors",
+    "open whats new",
+])
+def test_low_confidence_matches_fall_back(router, command):
+    route = router.match(command)
+    assert route is None or route["confidence"] < router.min_confidence
+    assert router.dispatch(command) is None
+    assert not router.app_tool.calls and not router.website_tool.calls
+
+
+def test_explicit_kind_picks_the_tool(router):
+    both = intent_router.IntentRouter(FakeTool("open_app_tool"), FakeTool("open_website_tool"),
+                                      app_commands={"whatsapp": "x"}, websites={"whatsapp": "y"})
+    assert both.match("open whatsapp app")["tool"].name == "open_app_tool"
+    assert both.match("open whatsapp website")["tool"].name == "open_website_tool"
+
+
+def test_threshold_is_configurable():
+    lenient = intent_router.IntentRouter(FakeTool("open_app_tool"), FakeTool("open_website_tool"),
+                                         min_confidence=0.7, app_commands=APPS, websites=SITES)
+    assert lenient.dispatch("open calculater") is not None
+    strict = intent_router.IntentRouter(FakeTool("open_app_tool"), FakeTool("open_website_tool"),
+                                        min_confidence=1.0, app_commands=APPS, websites=SITES)
+    assert strict.dispatch("open calculater") is None
+    assert strict.dispatch("open calculator") is not None
+
+
+def test_stats_count_hits_and_misses(router):
+    router.dispatch("open notepad")
+    router.dispatch("open notepad and type hello")
+    stats = router.stats()
+    assert (stats["hits"], stats["misses"], stats["total"]) == (1, 1, 2)
+    assert stats["llm_calls_avoided"] == 2
@@ -0,0 +1,77 @@
+import pytest
+
+from conftest import load_module
+
+sentence_stream = load_module("JarvesVoice/sentence_stream.py", "jarvis_test_sentence_stream")
+split_sentences = sentence_stream.split_sentences
+SentenceAccumulator = sentence_stream.SentenceAccumulator
+
+
+def stream(text: str, step: int, min_chars: int = 12):
+    """Feeds `text` in chunks of `step` characters; returns the sentences and the flushed remainder."""
+    accumulator = SentenceAccumulator(min_chars=min_chars)
+    sentences = []
+    for i in range(0, len(text), step):
+        sentences.extend(accumulator.feed(text[i:i + step]))
+    return sentences, accumulator.flush()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("It is sunny. Take a hat! Are you ready?", ["It is sunny.", "Take a hat!", "Are you ready?"]),
+    ('He said "go home." Then he left.', ['He said "go home."', "Then he left."]),
+    ("Your meeting with Dr. Patel is at five. Don't be late.", ["Your meeting with Dr. Patel is at five.", "Don't be late."]),
+    ("Ask Mr. and Mrs. Smith first. Then call.", ["Ask Mr. and Mrs. Smith first.", "Then call."]),
+    ("Bring snacks, e.g. chips or nuts. Thanks.", ["Bring snacks, e.g. chips or nuts.", "Thanks."]),
+    ("The book is by J. K. Rowling. It is long.", ["The book is by J. K. Rowling.", "It is long."]),
+    ("He moved to the U.S. last year.", ["He moved to the U.S. last year."]),
+    ("So do I. Me too.", ["So do I.", "Me too."]),
+    ("Pi is 3.14 and e is 2.71. Both are irrational.", ["Pi is 3.14 and e is 2.71.", "Both are irrational."]),
+    ("The price is $1,299.50 today. Buy it.", ["The price is $1,299.50 today.", "Buy it."]),
+    ("Wait... what happened?", ["Wait...", "what happened?"]),
+    ("Steps:\n- open it\n- close it", ["Steps:", "- open it", "- close it"]),
+    ("First paragraph\n\nSecond paragraph", ["First paragraph", "Second paragraph"]),
+    ("no punctuation at all", ["no punctuation at all"]),
+    ("", []),
+])
+def test_split_sentences(text, expected):
+    assert split_sentences(text) == expected
+
+
+def test_split_sentences_merges_short_fragments():
+    assert split_sentences("Yes. Sure. It is done now.", min_chars=12) == ["Yes. Sure. It is done now."]
+    assert split_sentences("Okay. That is all for today.", min_chars=5) == ["Okay.", "That is all for today."]
+    assert split_sentences("Hi.", min_chars=20) == ["Hi."]
+
+
+@pytest.mark.parametrize("step", [1, 2, 3, 7, 1000])
+def test_accumulator_matches_split_regardless_of_chunking(step):
+    text = "Your meeting with Dr. Patel is at 3.30 today. The room is B2, e.g. the big one! Bring the notes"
+    sentences, remainder = stream(text, step)
+    assert sentences == ["Your meeting with Dr. Patel is at 3.30 today.", "The room is B2, e.g. the big one!"]
+    assert remainder == "Bring the notes"
+
+
+def test_accumulator_does_not_cut_a_decimal_in_half():
+    accumulator = SentenceAccumulator()
+    assert accumulator.feed("The total comes to 12.") == []
+    assert accumulator.feed("75 dollars. ") == ["The total comes to 12.75 dollars."]
+
+
+def test_accumulator_holds_short_sentences_until_long_enough():
+    accumulator = SentenceAccumulator(min_chars=12)
+    assert accumulator.feed("Sure. ") == []
+    assert accumulator.feed("It is done now. ") == ["Sure. It is done now."]
+
+
+def test_flush_returns_the_tail_once():
+    accumulator = SentenceAccumulator()
+    assert accumulator.feed("A sentence without an ending") == []
+    assert accumulator.feed("") == []
+    assert accumulator.flush() == "A sentence without an ending"
+    assert accumulator.flush() is None
+
+
+def test_flush_of_whitespace_is_none():
+    accumulator = SentenceAccumulator()
+    assert accumulator.feed("That is everything for now. ") == ["That is everything for now."]
+    assert accumulator.flush() is None
@@ -0,0 +1,160 @@
+import json
+
+import pytest
+
+from utils import session_store
+from utils.session_store import SessionResultStore, canonical_args, matches_condition, query_records
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(session_store.time, "time", fake)
+    return fake
+
+
+def test_canonical_args_ignores_key_order_case_and_whitespace():
+    a = canonical_args({"query": "  Ergonomic   KEYBOARD ", "max_results": 5})
+    b = canonical_args({"max_results": 5, "query": "ergonomic keyboard"})
+    assert a == b
+
+
+def test_canonical_args_drops_none_and_injected_config():
+    assert canonical_args({"query": "mouse", "page": None, "config": object(), "callbacks": []}) == \
+        canonical_args({"query": "mouse"})
+
+
+def test_canonical_args_unpacks_react_style_json_string():
+    assert canonical_args({"tool_input": '{"Query": "x", "limit": 3}'}) == canonical_args({"Query": "X", "limit": 3})
+
+
+def test_canonical_args_keeps_different_values_apart():
+    assert canonical_args({"query": "mouse"}) != canonical_args({"query": "mice"})
+
+
+def test_lookup_hits_until_ttl_expires(clock):
+    store = SessionResultStore(ttl_s=60, max_entries=8)
+    result_id = store.put("amazon", {"query": "mouse"}, {"status": "success"})
+    clock.now += 59
+    assert store.lookup("amazon", {"query": " MOUSE "})["result_id"] == result_id
+    clock.now += 2
+    assert store.lookup("amazon", {"query": "mouse"}) is None
+    assert store.get(result_id) is None
+    assert (store.hits, store.misses) == (1, 1)
+
+
+def test_oldest_entry_is_evicted_beyond_max_entries(clock):
+    store = SessionResultStore(ttl_s=600, max_entries=2)
+    first = store.put("t", {"q": 1}, {})
+    clock.now += 1
+    second = store.put("t", {"q": 2}, {})
+    clock.now += 1
+    third = store.put("t", {"q": 3}, {})
+    assert store.get(first) is None
+    assert [e["result_id"] for e in store.entries()] == [third, second]
+    assert store.lookup("t", {"q": 1}) is None
+
+
+def test_same_arguments_replace_the_previous_entry(clock):
+    store = SessionResultStore(ttl_s=600, max_entries=8)
+    old = store.put("t", {"q": "a"}, {"v": 1})
+    new = store.put("t", {"q": "A"}, {"v": 2})
+    assert store.get(old) is None
+    assert store.lookup("t", {"q": "a"})["result"] == {"v": 2}
+    assert len(store) == 1 and new != old
+
+
+def test_uncacheable_entries_are_kept_but_never_served(clock):
+    store = SessionResultStore(ttl_s=600, max_entries=8)
+    result_id = store.put("t", {"q": "a"}, {"v": 1}, cacheable=False)
+    assert store.get(result_id)["result"] == {"v": 1}
+    assert store.lookup("t", {"q": "a"}) is None
+    assert store.entries() == []
+
+
+def test_session_cached_runs_the_tool_once(clock):
+    store = SessionResultStore(ttl_s=600, max_entries=8)
+    calls = []
+
+    @session_store.session_cached("search", store=store)
+    def search(query: str) -> str:
+        calls.append(query)
+        return json.dumps({"status": "success", "data": [query]})
+
+    first = json.loads(search("Lamp"))
+    second = json.loads(search(query="lamp"))
+    assert calls == ["Lamp"]
+    assert second["cached"] is True and second["result_id"] == first["result_id"]
+
+
+def test_session_cached_does_not_store_errors(clock):
+    store = SessionResultStore(ttl_s=600, max_entries=8)
+    calls = []
+
+    @session_store.session_cached("search", store=store)
+    def search(query: str) -> str:
+        calls.append(query)
+        return json.dumps({"status": "error", "message": "blocked"})
+
+    search("lamp")
+    search("lamp")
+    assert len(calls) == 2 and len(store) == 0
+
+
+@pytest.mark.parametrize("value, condition, expected", [
+    ("₹1,299", "< 1300", True),
+    ("₹1,299", "<= 1299", True),
+    ("₹1,299", "> 1299", False),
+    ("4.2 out of 5 stars", ">= 4", True),
+    ("4.2 out of 5 stars", "above 4.5", False),
+    ("9,919 reviews", "over 9000", True),
+    ("5,000", "under 5000", False),
+    ("4,999", "below 5000", True),
+    (3, "at least 3", True),
+    (3, "at most 2", False),
+    ("2", "== 2", True),
+    ("2", "= 2.0", True),
+    ("2", "!= 2", False),
+    ("Non-stop", "!= non-stop", False),
+    ("Free WiFi, Pool", "contains wifi", True),
+    (["Pool", "Gym"], "contains gym", True),
+    (["Pool", "Gym"], "gym", True),
+    ("Delhi", "delhi", True),
+    ("Delhi", "mumbai", False),
+    (2, 2, True),
+    ("2 stops", 2, True),
+    (True, True, True),
+    (None, "> 1", False),
+    ("n/a", "> 1", False),
+])
+def test_matches_condition(value, condition, expected):
+    assert matches_condition(value, condition) is expected
+
+
+RECORDS = [
+    {"name": "A", "price": "₹900", "rating": "4.5 out of 5", "flight": {"num_stops": 0}},
+    {"name": "B", "price": "₹1,500", "rating": "3.9 out of 5", "flight": {"num_stops": 1}},
+    {"name": "C", "price": "₹700", "rating": None, "flight": {"num_stops": 0}},
+    {"name": "D", "price": "₹1,100", "rating": "4.1 out of 5", "flight": {"num_stops": 2}},
+]
+
+
+def test_query_records_filters_on_nested_fields():
+    assert [r["name"] for r in query_records(RECORDS, {"flight.num_stops": 0})] == ["A", "C"]
+
+
+def test_query_records_combines_filters():
+    assert [r["name"] for r in query_records(RECORDS, {"price": "under 1200", "rating": ">= 4"})] == ["A", "D"]
+
+
+def test_query_records_sorts_missing_values_last_and_limits():
+    assert [r["name"] for r in query_records(RECORDS, sort_by="rating", descending=True)] == ["A", "D", "B", "C"]
+    assert [r["name"] for r in query_records(RECORDS, sort_by="price", limit=2)] == ["C", "A"]
@@ -0,0 +1,212 @@
+import argparse
+import importlib
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("LazyToolLoader")
+if not logger.hasHandlers():
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+DEFAULT_STARTUP_BUDGET_MS = float(os.getenv("JARVIS_STARTUP_BUDGET_MS", "2000"))
+
+_registry_lock = threading.RLock()
+_LAZY_MODULES: Dict[str, "LazyModule"] = {}
+_IMPORT_TIMINGS: Dict[str, float] = {}
+
+
+class LazyModule:
+    """Stands in for a module and imports it the first time an attribute is accessed."""
+
+    def __init__(self, module_name: str):
+        self._module_name = module_name
+        self._module = None
+
+    @property
+    def module_name(self) -> str:
+        return self._module_name
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._module is not None
+
+    def load(self):
+        if self._module is not None:
+            return self._module
+        with _registry_lock:
+            if self._module is None:
+                start = time.perf_counter()
+                module = importlib.import_module(self._module_name)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                _IMPORT_TIMINGS[self._module_name] = elapsed_ms
+                logger.info(f"Lazy-loaded '{self._module_name}' in {elapsed_ms:.1f} ms.")
+                self._module = module
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("__") and attr.endswith("__"):
+            raise AttributeError(attr)
+        return getattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyModule '{self._module_name}' ({state})>"
+
+
+class LazyCallable:
+    """Callable proxy for `module.attr`; the module is imported on the first call."""
+
+    def __init__(self, module: LazyModule, attr: str):
+        self._module = module
+        self._attr = attr
+        self.__name__ = attr
+
+    def resolve(self) -> Callable:
+        return getattr(self._module.load(), self._attr)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<LazyCallable '{self._module.module_name}.{self._attr}'>"
+
+
+class LazyObject:
+    """Builds an object from `factory` on first attribute access and forwards to it afterwards."""
+
+    def __init__(self, name: str, factory: Callable[[], Any]):
+        self._name = name
+        self._factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_initialized(self) -> bool:
+        return self._instance is not None
+
+    def get(self) -> Any:
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    start = time.perf_counter()
+                    self._instance = self._factory()
+                    elapsed_ms = (time.perf_counter() - start) * 1000
+                    _IMPORT_TIMINGS[f"<init {self._name}>"] = elapsed_ms
+                    logger.info(f"Initialized '{self._name}' in {elapsed_ms:.1f} ms.")
+        return self._instance
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("__") and attr.endswith("__"):
+            raise AttributeError(attr)
+        return getattr(self.get(), attr)
+
+
+def lazy_import(module_name: str) -> LazyModule:
+    with _registry_lock:
+        module = _LAZY_MODULES.get(module_name)
+        if module is None:
+            module = LazyModule(module_name)
+            _LAZY_MODULES[module_name] = module
+        return module
+
+
+def lazy_attr(module_name: str, attr: str) -> LazyCallable:
+    return LazyCallable(lazy_import(module_name), attr)
+
+
+def registered_modules() -> List[str]:
+    with _registry_lock:
+        return list(_LAZY_MODULES.keys())
+
+
+def preload(module_names: Optional[List[str]] = None) -> Dict[str, Optional[str]]:
+    """Imports the given lazy modules (all registered ones by default). Returns module -> error message or None."""
+    errors: Dict[str, Optional[str]] = {}
+    for name in registered_modules() if module_names is None else module_names:
+        try:
+            lazy_import(name).load()
+            errors[name] = None
+        except Exception as e:
+            logger.warning(f"Preloading '{name}' failed: {e}")
+            errors[name] = str(e)
+    return errors
+
+
+def import_timings() -> Dict[str, float]:
+    """In-process cost (ms) of every lazy import / initialization performed so far."""
+    return dict(_IMPORT_TIMINGS)
+
+
+STARTUP_MODULES: List[str] = ["MainAgent.tools", "JarvesVoice"]
+
+
+def measure_cold_import(module_names: List[str], python: str = sys.executable, timeout: float = 300) -> Tuple[Optional[float], Optional[str]]:
+    """Imports `module_names` in a fresh interpreter so shared dependencies are not already cached."""
+    code = (
+        "import sys, time, importlib\n"
+        "start = time.perf_counter()\n"
+        "for name in sys.argv[1:]: importlib.import_module(name)\n"
+        "print('IMPORT_MS=%.3f' % ((time.perf_counter() - start) * 1000))\n"
+    )
+    try:
+        proc = subprocess.run([python, "-c", code, *module_names], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return None, f"timed out after {timeout}s"
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith("IMPORT_MS="):
+            return float(line.split("=", 1)[1]), None
+    error_lines = (proc.stderr or proc.stdout).strip().splitlines()
+    return None, error_lines[-1] if error_lines else f"exit code {proc.returncode}"
+
+
+def startup_report(budget_ms: float = DEFAULT_STARTUP_BUDGET_MS) -> Tuple[List[Dict[str, Any]], bool]:
+    """Cold import cost of the startup path and of every subsystem the tools load on demand."""
+    if PROJECT_ROOT not in sys.path:
+        sys.path.append(PROJECT_ROOT)
+    try:
+        importlib.import_module("MainAgent.tools")
+    except Exception as e:
+        logger.warning(f"Could not import MainAgent.tools to discover lazy subsystems: {e}")
+
+    rows: List[Dict[str, Any]] = []
+    startup_ms, startup_err = measure_cold_import(STARTUP_MODULES)
+    within_budget = startup_ms is not None and startup_ms <= budget_ms
+    rows.append({"module": " + ".join(STARTUP_MODULES), "kind": "startup", "ms": startup_ms, "error": startup_err})
+    for name in sorted(registered_modules()):
+        ms, err = measure_cold_import([name])
+        rows.append({"module": name, "kind": "on-demand", "ms": ms, "error": err})
+    return rows, within_budget
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Per-module import cost of the Jarvis tool layer.")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_STARTUP_BUDGET_MS,
+                        help="Maximum allowed cold import time of the startup modules (default: JARVIS_STARTUP_BUDGET_MS or 2000).")
+    args = parser.parse_args(argv)
+
+    rows, within_budget = startup_report(budget_ms=args.budget_ms)
+    print(f"{'module':<36} {'kind':<10} {'import ms':>10}")
+    print("-" * 60)
+    for row in rows:
+        cost = f"{row['ms']:.1f}" if row["ms"] is not None else "failed"
+        print(f"{row['module']:<36} {row['kind']:<10} {cost:>10}" + (f"  ({row['error']})" if row["error"] else ""))
+    print("-" * 60)
+    startup_ms = rows[0]["ms"]
+    if within_budget:
+        print(f"✅ Startup import within budget ({startup_ms:.1f} ms <= {args.budget_ms:.0f} ms).")
+        return 0
+    print(f"❌ Startup import over budget ({rows[0]['ms'] or rows[0]['error']} vs {args.budget_ms:.0f} ms).")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+import gc
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger("ModelRegistry")
+
+# Seconds a model may sit unused before it is unloaded; 0 keeps models for the whole process.
+MODEL_IDLE_UNLOAD_S = float(os.getenv("JARVIS_MODEL_IDLE_UNLOAD", "600"))
+YOLO_WARMUP_IMGSZ = int(os.getenv("JARVIS_YOLO_WARMUP_IMGSZ", "320"))
+# ultralytics' own default input size. A shared YOLO keeps the predict() arguments of the previous
+# call for any argument left out, so every caller passes imgsz and classes explicitly.
+YOLO_DEFAULT_IMGSZ = 640
+
+
+class _ModelEntry:
+    def __init__(self, name: str, loader: Callable[[], Any], warm_up: Optional[Callable[[Any], None]]):
+        self.name = name
+        self.loader = loader
+        self.warm_up = warm_up
+        self.model: Any = None
+        self.lock = threading.Lock()
+        self.users = 0
+        self.last_used = 0.0
+        self.load_count = 0
+        self.uses = 0
+        self.last_load_ms = 0.0
+        self.total_load_ms = 0.0
+        self.last_warmup_ms = 0.0
+
+
+class ModelRegistry:
+    """
+    Loads each registered model once per process, runs its warm-up inference right after loading,
+    and hands the same instance to every caller. Models unused for `idle_unload_s` are dropped
+    (and reloaded on the next request); `stats()` reports load counts and load times.
+    """
+
+    def __init__(self, idle_unload_s: float = MODEL_IDLE_UNLOAD_S):
+        self.idle_unload_s = idle_unload_s
+        self._entries: Dict[str, _ModelEntry] = {}
+        self._guard = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+
+    def register(self, name: str, loader: Callable[[], Any], warm_up: Optional[Callable[[Any], None]] = None):
+        with self._guard:
+            if name not in self._entries:
+                self._entries[name] = _ModelEntry(name, loader, warm_up)
+
+    def is_registered(self, name: str) -> bool:
+        return name in self._entries
+
+    def _entry(self, name: str) -> _ModelEntry:
+        try:
+            return self._entries[name]
+        except KeyError:
+            raise KeyError(f"Model '{name}' is not registered.") from None
+
+    def _load(self, entry: _ModelEntry):
+        start = time.perf_counter()
+        model = entry.loader()
+        entry.last_load_ms = (time.perf_counter() - start) * 1000
+        entry.total_load_ms += entry.last_load_ms
+        entry.load_count += 1
+        if entry.warm_up is not None:
+            start = time.perf_counter()
+            try:
+                entry.warm_up(model)
+            except Exception as e:
+                logger.warning(f"Warm-up inference for '{entry.name}' failed: {e}")
+            entry.last_warmup_ms = (time.perf_counter() - start) * 1000
+        entry.model = model
+        logger.info(f"Loaded model '{entry.name}' in {entry.last_load_ms:.0f} ms "
+                    f"(warm-up {entry.last_warmup_ms:.0f} ms, load #{entry.load_count}).")
+
+    def get(self, name: str) -> Any:
+        """Returns the shared instance, loading and warming it up on first use."""
+        entry = self._entry(name)
+        with entry.lock:
+            if entry.model is None:
+                self._load(entry)
+            entry.last_used = time.monotonic()
+            entry.uses += 1
+            model = entry.model
+        self._ensure_reaper()
+        return model
+
+    @contextmanager
+    def use(self, name: str) -> Iterator[Any]:
+        """Like `get`, but the model is never unloaded for idleness while the block runs."""
+        model = self.get(name)
+        entry = self._entry(name)
+        with entry.lock:
+            entry.users += 1
+        try:
+            yield model
+        finally:
+            with entry.lock:
+                entry.users -= 1
+                entry.last_used = time.monotonic()
+
+    def unload(self, name: str) -> bool:
+        entry = self._entry(name)
+        with entry.lock:
+            if entry.model is None or entry.users > 0:
+                return False
+            entry.model = None
+        gc.collect()
+        torch = sys.modules.get("torch")
+        if torch is not None and getattr(torch, "cuda", None) is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        logger.info(f"Unloaded model '{name}'.")
+        return True
+
+    def unload_idle(self) -> int:
+        if self.idle_unload_s <= 0:
+            return 0
+        now = time.monotonic()
+        idle = [e.name for e in list(self._entries.values())
+                if e.model is not None and e.users == 0 and now - e.last_used > self.idle_unload_s]
+        return sum(1 for name in idle if self.unload(name))
+
+    def _ensure_reaper(self):
+        if self.idle_unload_s <= 0 or (self._reaper is not None and self._reaper.is_alive()):
+            return
+        with self._guard:
+            if self._reaper is None or not self._reaper.is_alive():
+                self._reaper = threading.Thread(target=self._reap_loop, name="ModelRegistryReaper", daemon=True)
+                self._reaper.start()
+
+    def _reap_loop(self):
+        interval = max(1.0, min(60.0, self.idle_unload_s / 4))
+        while True:
+            time.sleep(interval)
+            try:
+                self.unload_idle()
+            except Exception as e:
+                logger.warning(f"Idle model unload failed: {e}")
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic()
+        return {
+            e.name: {
+                "loaded": e.model is not None,
+                "load_count": e.load_count,
+                "uses": e.uses,
+                "last_load_ms": round(e.last_load_ms, 1),
+                "total_load_ms": round(e.total_load_ms, 1),
+                "last_warmup_ms": round(e.last_warmup_ms, 1),
+                "idle_s": round(now - e.last_used, 1) if e.last_used else None,
+            }
+            for e in list(self._entries.values())
+        }
+
+
+model_registry = ModelRegistry()
+
+
+def _warm_up_yolo(model: Any):
+    import numpy as np
+    model.predict(np.zeros((YOLO_WARMUP_IMGSZ, YOLO_WARMUP_IMGSZ, 3), dtype=np.uint8), imgsz=YOLO_WARMUP_IMGSZ, classes=None, verbose=False)
+
+
+def yolo_model_name(weights: str) -> str:
+    return f"yolo:{weights}"
+
+
+def get_yolo_model(weights: str = "yolov8n.pt") -> Any:
+    """Shared, warmed-up ultralytics YOLO detector for `weights`."""
+    name = yolo_model_name(weights)
+    if not model_registry.is_registered(name):
+        def _load():
+            from ultralytics import YOLO
+            return YOLO(weights)
+        model_registry.register(name, _load, warm_up=_warm_up_yolo)
+    return model_registry.get(name)
+
+
+@contextmanager
+def using_yolo_model(weights: str = "yolov8n.pt") -> Iterator[Any]:
+    """`get_yolo_model` that keeps the detector loaded for the duration of the block."""
+    get_yolo_model(weights)
+    with model_registry.use(yolo_model_name(weights)) as model:
+        yield model
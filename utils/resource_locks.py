@@ -0,0 +1,42 @@
+import functools
+import logging
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import Callable, Dict, Iterator
+
+logger = logging.getLogger(__name__)
+
+_resource_locks: Dict[str, threading.Lock] = {}
+_resource_locks_guard = threading.Lock()
+
+
+def resource_lock(resource: str) -> threading.Lock:
+    with _resource_locks_guard:
+        lock = _resource_locks.get(resource)
+        if lock is None:
+            lock = _resource_locks[resource] = threading.Lock()
+        return lock
+
+
+@contextmanager
+def hold_resources(*resources: str) -> Iterator[None]:
+    # Always acquire in sorted order so two tools needing overlapping resources cannot deadlock.
+    with ExitStack() as stack:
+        for resource in sorted(set(resources)):
+            lock = resource_lock(resource)
+            if not lock.acquire(blocking=False):
+                logger.info(f"Waiting for exclusive resource '{resource}'...")
+                lock.acquire()
+            stack.callback(lock.release)
+        yield
+
+
+def exclusive(*resources: str) -> Callable:
+    """Serializes a tool function on shared hardware or I/O (camera, console input portal)."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with hold_resources(*resources):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
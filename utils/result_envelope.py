@@ -0,0 +1,121 @@
+import functools
+import inspect
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.session_store import SessionResultStore, session_results
+
+logger = logging.getLogger("ResultEnvelope")
+
+RESULT_TOP_N = int(os.getenv("JARVIS_RESULT_TOP_N", "5"))
+RESULT_FIELD_CHARS = int(os.getenv("JARVIS_RESULT_FIELD_CHARS", "160"))
+RESULT_PREVIEW_CHARS = int(os.getenv("JARVIS_RESULT_PREVIEW_CHARS", "300"))
+RESULT_PAGE_CHARS = int(os.getenv("JARVIS_RESULT_PAGE_CHARS", "2000"))
+# Bulky fields that never go to the model inline; only a preview and their size do.
+BULK_FIELDS = ("raw_data", "raw_output", "details")
+
+
+def dumps_compact(payload: Any) -> str:
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def compact_record(record: Any, max_chars: int = RESULT_FIELD_CHARS) -> Any:
+    """Drops empty fields and shortens long strings; nested dicts and lists are compacted recursively."""
+    if isinstance(record, dict):
+        out = {}
+        for key, value in record.items():
+            if value in (None, "", [], {}):
+                continue
+            out[key] = compact_record(value, max_chars)
+        return out
+    if isinstance(record, list):
+        return [compact_record(v, max_chars) for v in record]
+    if isinstance(record, str) and len(record) > max_chars:
+        return record[:max_chars] + "…"
+    return record
+
+
+def _preview(value: Any) -> str:
+    text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False, default=str)
+    return text[:RESULT_PREVIEW_CHARS] + ("…" if len(text) > RESULT_PREVIEW_CHARS else "")
+
+
+def make_envelope(result: Dict[str, Any], result_id: Optional[str], top_n: int = RESULT_TOP_N) -> Dict[str, Any]:
+    """
+    Model-facing view of a tool result: status and message fields as-is, the first `top_n` records
+    compacted, and previews instead of bulky fields. The full result stays in the session store
+    under `result_id`.
+    """
+    envelope: Dict[str, Any] = {}
+    for key, value in result.items():
+        if key == "data" and isinstance(value, list):
+            envelope["data"] = [compact_record(r) for r in value[:top_n]]
+            envelope["total_records"] = len(value)
+            if len(value) > top_n:
+                envelope["more_records"] = len(value) - top_n
+        elif key in BULK_FIELDS and value:
+            envelope[f"{key}_preview"] = _preview(value)
+            envelope[f"{key}_chars"] = len(value if isinstance(value, str) else json.dumps(value, default=str))
+        else:
+            envelope[key] = compact_record(value)
+    if result_id:
+        envelope["result_id"] = result_id
+        if envelope.get("more_records") or any(k in result for k in BULK_FIELDS):
+            envelope["full_result"] = f"page through it with get_stored_result(result_id='{result_id}')"
+    return envelope
+
+
+def enveloped_result(tool_name: str, top_n: int = RESULT_TOP_N, store: Optional[SessionResultStore] = None) -> Callable:
+    """
+    Turns a tool's JSON output into a compact envelope. Results already stored by `session_cached`
+    keep their `result_id`; other results with records or bulky fields are stored here (not reused as a cache),
+    so no data is lost.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            results = store if store is not None else session_results
+            output = func(*args, **kwargs)
+            try:
+                parsed = json.loads(output) if isinstance(output, str) else None
+            except json.JSONDecodeError:
+                parsed = None
+            if not isinstance(parsed, dict):
+                return output
+            result_id = parsed.pop("result_id", None)
+            needs_store = isinstance(parsed.get("data"), list) and len(parsed["data"]) > top_n
+            if result_id is None and (needs_store or any(parsed.get(k) for k in BULK_FIELDS)):
+                call_args = dict(kwargs)
+                if args:
+                    call_args.update(inspect.signature(func).bind_partial(*args).arguments)
+                result_id = results.put(tool_name, call_args, parsed, cacheable=False)
+            compact = dumps_compact(make_envelope(parsed, result_id, top_n))
+            logger.info(f"{tool_name} result: {len(output)} chars -> {len(compact)} chars for the model"
+                        + (f" (full result {result_id})" if result_id else "") + ".")
+            return compact
+        return wrapper
+    return decorator
+
+
+def result_page(entry: Dict[str, Any], field: str = "data", offset: int = 0, limit: int = RESULT_TOP_N) -> Dict[str, Any]:
+    """One page of a stored result: `limit` records of a list field, or RESULT_PAGE_CHARS characters of a text field."""
+    result = entry["result"]
+    value = result.get(field)
+    page: Dict[str, Any] = {"status": "success", "result_id": entry["result_id"], "tool": entry["tool"], "field": field}
+    if value is None:
+        page.update(status="not_found", message=f"Field '{field}' is not in this result.",
+                    available_fields=sorted(k for k in result if k != "status"))
+    elif isinstance(value, list):
+        offset = max(0, offset)
+        records: List[Any] = value[offset:offset + max(1, limit)]
+        page.update(offset=offset, total_records=len(value), data=[compact_record(r) for r in records],
+                    next_offset=offset + len(records) if offset + len(records) < len(value) else None)
+    else:
+        text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False, default=str)
+        offset = max(0, offset)
+        chunk = text[offset:offset + RESULT_PAGE_CHARS]
+        page.update(offset=offset, total_chars=len(text), text=chunk,
+                    next_offset=offset + len(chunk) if offset + len(chunk) < len(text) else None)
+    return page
@@ -0,0 +1,232 @@
+import functools
+import inspect
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("SessionResultStore")
+
+SESSION_RESULT_TTL_S = float(os.getenv("JARVIS_SESSION_RESULT_TTL", "900"))
+SESSION_RESULT_MAX_ENTRIES = int(os.getenv("JARVIS_SESSION_RESULT_MAX_ENTRIES", "32"))
+
+NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+CONDITION_RE = re.compile(r"^\s*(>=|<=|!=|==|>|<|=|contains|under|below|above|over|at least|at most)\s*(.+?)\s*$", re.IGNORECASE)
+OPERATOR_ALIASES = {"under": "<", "below": "<", "above": ">", "over": ">", "at least": ">=", "at most": "<=", "=": "=="}
+
+
+def canonical_args(args: Dict[str, Any]) -> str:
+    """
+    Stable key for tool arguments: drops None values and injected config, lowercases and trims strings,
+    sorts keys. A JSON object passed inside the first string field (ReAct style) is unpacked first.
+    """
+    def _norm(value: Any) -> Any:
+        if isinstance(value, str):
+            return " ".join(value.lower().split())
+        if isinstance(value, dict):
+            return {k: _norm(v) for k, v in value.items() if v is not None}
+        if isinstance(value, (list, tuple)):
+            return [_norm(v) for v in value]
+        return value
+
+    cleaned = {k: v for k, v in args.items() if v is not None and k not in ("config", "run_manager", "callbacks")}
+    for key, value in list(cleaned.items()):
+        if isinstance(value, str) and value.lstrip().startswith("{"):
+            try:
+                embedded = json.loads(value)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(embedded, dict):
+                cleaned.pop(key)
+                cleaned = {**embedded, **cleaned}
+            break
+    return json.dumps(_norm(cleaned), sort_keys=True, ensure_ascii=False, default=str)
+
+
+def as_number(value: Any) -> Optional[float]:
+    """Numeric value of scraped fields such as '₹1,299', '4.2 out of 5 stars' or '9,919 reviews'."""
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        m = NUMBER_RE.search(value.replace(",", ""))
+        if m:
+            return float(m.group())
+    return None
+
+
+def field_value(record: Any, path: str) -> Any:
+    """Looks up `path` in a record; dotted paths reach nested fields (e.g. 'outbound_flight.num_stops')."""
+    value = record
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def matches_condition(value: Any, condition: Any) -> bool:
+    """
+    `condition` is a literal (equality, case-insensitive for strings) or a string such as
+    '>= 4', '< 5000', 'under 5000', 'above 4.0' or 'contains wifi'.
+    """
+    if value is None:
+        return False
+    if not isinstance(condition, str):
+        if isinstance(condition, (int, float)) and not isinstance(condition, bool):
+            number = as_number(value)
+            return number is not None and number == float(condition)
+        return value == condition
+    m = CONDITION_RE.match(condition)
+    if not m:
+        if isinstance(value, list):
+            return any(condition.lower() == str(v).lower() for v in value)
+        return str(value).strip().lower() == condition.strip().lower()
+    op = OPERATOR_ALIASES.get(m.group(1).lower(), m.group(1).lower())
+    operand = m.group(2)
+    if op == "contains":
+        haystack = " ".join(str(v) for v in value) if isinstance(value, list) else str(value)
+        return operand.lower() in haystack.lower()
+    left, right = as_number(value), as_number(operand)
+    if left is None or right is None:
+        if op in ("==", "!="):
+            return (str(value).lower() == operand.lower()) == (op == "==")
+        return False
+    return {"<": left < right, "<=": left <= right, ">": left > right, ">=": left >= right,
+            "==": left == right, "!=": left != right}[op]
+
+
+def query_records(records: List[Any], filters: Optional[Dict[str, Any]] = None, sort_by: Optional[str] = None,
+                  descending: bool = False, limit: Optional[int] = None) -> List[Any]:
+    selected = [r for r in records if all(matches_condition(field_value(r, k), c) for k, c in (filters or {}).items())]
+    if sort_by:
+        with_value = [r for r in selected if as_number(field_value(r, sort_by)) is not None]
+        without_value = [r for r in selected if as_number(field_value(r, sort_by)) is None]
+        with_value.sort(key=lambda r: as_number(field_value(r, sort_by)), reverse=descending)
+        selected = with_value + without_value
+    return selected[:limit] if limit else selected
+
+
+class SessionResultStore:
+    """
+    Successful tool results of this Jarvis session, keyed by tool name and canonical arguments.
+    Entries expire after `ttl_s`; the oldest entry is evicted beyond `max_entries`.
+    """
+
+    def __init__(self, ttl_s: float = SESSION_RESULT_TTL_S, max_entries: int = SESSION_RESULT_MAX_ENTRIES):
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._by_key: Dict[str, str] = {}
+        self._counter = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _purge(self, now: float):
+        for result_id, entry in list(self._entries.items()):
+            if now - entry["created_at"] > self.ttl_s:
+                self._drop(result_id)
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, result_id: str):
+        entry = self._entries.pop(result_id, None)
+        if entry and self._by_key.get(entry["key"]) == result_id:
+            del self._by_key[entry["key"]]
+
+    def lookup(self, tool_name: str, args: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        key = f"{tool_name}:{canonical_args(args)}"
+        with self._lock:
+            self._purge(time.time())
+            result_id = self._by_key.get(key)
+            if result_id is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return self._entries[result_id]
+
+    def put(self, tool_name: str, args: Dict[str, Any], result: Any, cacheable: bool = True) -> str:
+        """Stores `result` and returns its id. Only `cacheable` entries are served again by `lookup`."""
+        key = f"{tool_name}:{canonical_args(args)}"
+        with self._lock:
+            self._counter += 1
+            result_id = f"res-{self._counter}"
+            if cacheable:
+                previous = self._by_key.get(key)
+                if previous:
+                    self._drop(previous)
+            self._entries[result_id] = {"result_id": result_id, "tool": tool_name, "key": key,
+                                        "args": json.loads(canonical_args(args)), "result": result,
+                                        "created_at": time.time(), "cacheable": cacheable}
+            if cacheable:
+                self._by_key[key] = result_id
+            self._purge(time.time())
+            return result_id
+
+    def get(self, result_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._purge(time.time())
+            return self._entries.get(result_id)
+
+    def latest(self, tool_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Most recent successful result (of `tool_name`, if given)."""
+        entries = self.entries(tool_name)
+        return entries[0] if entries else None
+
+    def entries(self, tool_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Live successful entries, newest first."""
+        with self._lock:
+            self._purge(time.time())
+            return [e for e in reversed(self._entries.values())
+                    if (tool_name is None or e["tool"] == tool_name) and e.get("cacheable", True)]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_key.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+session_results = SessionResultStore()
+
+
+def session_cached(tool_name: str, store: Optional[SessionResultStore] = None) -> Callable:
+    """
+    Serves repeated calls with the same arguments from the session store instead of re-running the tool.
+    Only JSON results with status "success" are stored; the stored result carries a `result_id`
+    that `query_previous_results` accepts.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            results = store if store is not None else session_results
+            call_args = dict(kwargs)
+            if args:
+                call_args.update(inspect.signature(func).bind_partial(*args).arguments)
+            cached = results.lookup(tool_name, call_args)
+            if cached is not None:
+                age = time.time() - cached["created_at"]
+                logger.info(f"Session store hit for {tool_name} ({cached['result_id']}, {age:.0f}s old); skipping the tool run.")
+                return json.dumps({**cached["result"], "result_id": cached["result_id"], "cached": True,
+                                   "age_seconds": round(age)}, indent=2)
+
+            output = func(*args, **kwargs)
+            try:
+                parsed = json.loads(output) if isinstance(output, str) else None
+            except json.JSONDecodeError:
+                parsed = None
+            if isinstance(parsed, dict) and parsed.get("status") == "success":
+                result_id = results.put(tool_name, call_args, parsed)
+                return json.dumps({**parsed, "result_id": result_id}, indent=2)
+            return output
+        return wrapper
+    return decorator
@@ -0,0 +1,196 @@
+import itertools
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import speech_recognition as sr
+
+from utils.model_registry import model_registry
+
+logger = logging.getLogger("SpeechToText")
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# "auto": the local Vosk engine when its model is on disk, otherwise Google; "vosk" / "google" force one.
+STT_ENGINE = os.getenv("JARVIS_STT_ENGINE", "auto").lower()
+STT_LANGUAGE = os.getenv("JARVIS_STT_LANGUAGE", "en-US")
+VOSK_MODEL_PATH = os.getenv("JARVIS_VOSK_MODEL", os.path.join(PROJECT_ROOT, "models", "vosk-model-small-en-us-0.15"))
+# Seconds a partial hypothesis must stay unchanged before a caller may act on it.
+PARTIAL_STABLE_S = float(os.getenv("JARVIS_STT_PARTIAL_STABLE", "0.3"))
+VOSK_CHUNK_BYTES = 8000
+
+
+class SpeechToTextBackend(ABC):
+    """
+    Turns audio into text. Failures follow speech_recognition: `sr.UnknownValueError` when nothing
+    was understood, `sr.RequestError` when the engine cannot be reached.
+    Streaming backends also hand out incremental sessions through `start_stream`.
+    """
+    name = "base"
+    streaming = False
+
+    @abstractmethod
+    def transcribe(self, audio: sr.AudioData) -> str:
+        ...
+
+    def start_stream(self, sample_rate: int) -> "SpeechStream":
+        raise NotImplementedError(f"The {self.name} backend does not stream.")
+
+
+class SpeechStream(ABC):
+    """One incremental recognition: feed raw int16 mono chunks, get partial and final hypotheses."""
+
+    @abstractmethod
+    def accept(self, chunk: bytes) -> Optional[Dict[str, str]]:
+        """{"type": "partial" | "final", "text": ...} when the hypothesis changed, else None."""
+
+    @abstractmethod
+    def finish(self) -> str:
+        """Flushes the audio still buffered and returns its final text."""
+
+
+class GoogleSpeechBackend(SpeechToTextBackend):
+    """`Recognizer.recognize_google`; with `offline_fallback`, connection failures go to that backend instead."""
+    name = "google"
+
+    def __init__(self, recognizer: Optional[sr.Recognizer] = None, language: str = STT_LANGUAGE,
+                 offline_fallback: Optional[SpeechToTextBackend] = None):
+        self.recognizer = recognizer or sr.Recognizer()
+        self.language = language
+        self.offline_fallback = offline_fallback
+
+    def transcribe(self, audio: sr.AudioData) -> str:
+        try:
+            return self.recognizer.recognize_google(audio, language=self.language)
+        except sr.RequestError as e:
+            if self.offline_fallback is None:
+                raise
+            logger.warning(f"Google speech recognition unreachable ({e}); using {self.offline_fallback.name}.")
+            return self.offline_fallback.transcribe(audio)
+
+
+class _VoskStream(SpeechStream):
+    def __init__(self, recognizer: Any):
+        self._recognizer = recognizer
+        self._partial = ""
+
+    def accept(self, chunk: bytes) -> Optional[Dict[str, str]]:
+        if self._recognizer.AcceptWaveform(chunk):
+            self._partial = ""
+            return {"type": "final", "text": json.loads(self._recognizer.Result()).get("text", "")}
+        partial = json.loads(self._recognizer.PartialResult()).get("partial", "")
+        if partial == self._partial:
+            return None
+        self._partial = partial
+        return {"type": "partial", "text": partial}
+
+    def finish(self) -> str:
+        self._partial = ""
+        return json.loads(self._recognizer.FinalResult()).get("text", "")
+
+
+class VoskSpeechBackend(SpeechToTextBackend):
+    """
+    Local Kaldi recognizer (vosk) on the CPU. The model is loaded once through the model registry;
+    each stream gets its own lightweight `KaldiRecognizer`.
+    """
+    name = "vosk"
+    streaming = True
+
+    def __init__(self, model_path: str = VOSK_MODEL_PATH):
+        self.model_path = model_path
+        self._model_name = f"vosk:{model_path}"
+        if not model_registry.is_registered(self._model_name):
+            def _load():
+                import vosk
+                vosk.SetLogLevel(-1)
+                return vosk.Model(model_path)
+            model_registry.register(self._model_name, _load)
+
+    def start_stream(self, sample_rate: int) -> SpeechStream:
+        import vosk
+        return _VoskStream(vosk.KaldiRecognizer(model_registry.get(self._model_name), sample_rate))
+
+    def transcribe(self, audio: sr.AudioData) -> str:
+        raw = audio.get_raw_data(convert_width=2)
+        stream = self.start_stream(audio.sample_rate)
+        pieces: List[str] = []
+        for start in range(0, len(raw), VOSK_CHUNK_BYTES):
+            event = stream.accept(raw[start:start + VOSK_CHUNK_BYTES])
+            if event and event["type"] == "final" and event["text"]:
+                pieces.append(event["text"])
+        pieces.append(stream.finish())
+        text = " ".join(p for p in pieces if p)
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+
+def vosk_available(model_path: str = VOSK_MODEL_PATH) -> bool:
+    if not os.path.isdir(model_path):
+        return False
+    try:
+        import vosk  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_stt_backend(recognizer: Optional[sr.Recognizer] = None, engine: str = STT_ENGINE,
+                    language: str = STT_LANGUAGE) -> SpeechToTextBackend:
+    """Backend for `engine`; Google keeps the local engine (when installed) as its offline fallback."""
+    local = VoskSpeechBackend() if engine in ("auto", "vosk", "google") and vosk_available() else None
+    if engine == "vosk" and local is None:
+        logger.warning(f"Vosk engine requested but vosk or its model ({VOSK_MODEL_PATH}) is missing; using Google.")
+    if engine in ("auto", "vosk") and local is not None:
+        logger.info(f"Speech-to-text: local vosk model at {VOSK_MODEL_PATH}.")
+        return local
+    return GoogleSpeechBackend(recognizer, language, offline_fallback=local)
+
+
+def listen_streaming(backend: SpeechToTextBackend, chunks: Iterable[bytes], sample_rate: int,
+                     timeout: float, phrase_time_limit: float, preroll: bytes = b"",
+                     is_complete: Optional[Callable[[str], bool]] = None,
+                     on_partial: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    """
+    Recognizes one phrase from live int16 chunks (b"" means none arrived; the clocks still run).
+    Returns when the engine ends the phrase, after `phrase_time_limit` seconds of speech, or as soon as
+    a partial has been stable for PARTIAL_STABLE_S and `is_complete(partial)` is true ("early").
+    Raises sr.WaitTimeoutError when no speech starts within `timeout`, sr.UnknownValueError on an empty result.
+    """
+    stream = backend.start_stream(sample_rate)
+    start = time.monotonic()
+    speech_at: Optional[float] = None
+    partial, partial_at = "", 0.0
+    partials = 0
+    finals: List[str] = []
+    early = False
+    for chunk in itertools.chain([preroll] if preroll else [], chunks):
+        now = time.monotonic()
+        event = stream.accept(chunk) if chunk else None
+        if event and event["text"] and speech_at is None:
+            speech_at = now
+        if event and event["type"] == "final":
+            if event["text"]:
+                finals.append(event["text"])
+                break
+        elif event:
+            partials += 1
+            partial, partial_at = event["text"], now
+            if on_partial and partial:
+                on_partial(partial)
+        if is_complete and partial and now - partial_at >= PARTIAL_STABLE_S and is_complete(partial):
+            early = True
+            break
+        if speech_at is None and now - start >= timeout:
+            raise sr.WaitTimeoutError("No speech within the timeout.")
+        if speech_at is not None and now - speech_at >= phrase_time_limit:
+            break
+    text = partial if early else " ".join(t for t in finals + [stream.finish()] if t)
+    if not text:
+        raise sr.UnknownValueError()
+    return {"text": text, "early": early, "partials": partials,
+            "speech_after_s": None if speech_at is None else round(speech_at - start, 3),
+            "elapsed_s": round(time.monotonic() - start, 3)}
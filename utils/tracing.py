@@ -0,0 +1,205 @@
+import argparse
+import contextvars
+import functools
+import glob
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("JarvisTracing")
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+TRACE_FILE = os.getenv("JARVIS_TRACE_FILE", os.path.join(PROJECT_ROOT, "jarvis_traces.jsonl"))
+TRACING_ENABLED = os.getenv("JARVIS_TRACING", "true").lower() in ("1", "true", "yes")
+SESSION_ID = uuid.uuid4().hex[:12]
+
+# (trace_id, span_id) of the innermost open span. A ContextVar rather than a thread-local so that
+# asyncio tasks and pool threads started through `contextvars.copy_context().run` keep their parent.
+_current_span: contextvars.ContextVar[Optional[Tuple[str, str]]] = contextvars.ContextVar("jarvis_span", default=None)
+
+
+class _JsonlSink:
+    """Appends one JSON object per line; a single lock keeps lines from interleaving across threads."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._failed = False
+
+    def write(self, record: Dict[str, Any]):
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            except OSError as e:
+                if not self._failed:
+                    logger.warning(f"Could not write trace spans to {self.path}: {e}")
+                    self._failed = True
+
+
+_sink = _JsonlSink(TRACE_FILE)
+
+
+def set_trace_file(path: str):
+    global _sink
+    _sink = _JsonlSink(path)
+
+
+def current_trace_id() -> Optional[str]:
+    parent = _current_span.get()
+    return parent[0] if parent else None
+
+
+def start_span(name: str, **attrs: Any) -> Dict[str, Any]:
+    """Opens a span without entering it; pair with `end_span`. Used where start and end are separate callbacks."""
+    parent = _current_span.get()
+    return {
+        "session_id": SESSION_ID,
+        "trace_id": parent[0] if parent else uuid.uuid4().hex[:16],
+        "span_id": uuid.uuid4().hex[:16],
+        "parent_id": parent[1] if parent else None,
+        "name": name,
+        "attrs": dict(attrs),
+        "_start": time.perf_counter(),
+    }
+
+
+def end_span(record: Dict[str, Any], error: Optional[BaseException] = None):
+    if not TRACING_ENABLED:
+        return
+    start = record.pop("_start")
+    record["start_ts"] = round(time.time() - (time.perf_counter() - start), 6)
+    record["duration_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    record["status"] = "error" if error is not None else "ok"
+    if error is not None:
+        record["error"] = repr(error)[:500]
+    record["thread"] = threading.current_thread().name
+    _sink.write(record)
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Times the enclosed block as one span. Spans nest: the outermost span of a command starts a new
+    trace id and every span opened inside it (in this context) records it as parent.
+    Yields the span's attribute dict so callers can attach results (e.g. token counts).
+    """
+    record = start_span(name, **attrs)
+    token = _current_span.set((record["trace_id"], record["span_id"]))
+    try:
+        yield record["attrs"]
+    except BaseException as e:
+        _current_span.reset(token)
+        end_span(record, error=e)
+        raise
+    _current_span.reset(token)
+    end_span(record)
+
+
+def traced(name: Optional[str] = None, **static_attrs: Any) -> Callable:
+    """Decorator form of `span`; the span name defaults to the function's qualified name."""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name, **static_attrs):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def submit_in_context(pool, fn: Callable, *args, **kwargs):
+    """`pool.submit` that carries the caller's open span into the worker thread."""
+    ctx = contextvars.copy_context()
+    return pool.submit(ctx.run, fn, *args, **kwargs)
+
+
+def load_spans(paths: List[str]) -> List[Dict[str, Any]]:
+    spans: List[Dict[str, Any]] = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    spans.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    return spans
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize_spans(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    by_name: Dict[str, List[Dict[str, Any]]] = {}
+    for s in spans:
+        by_name.setdefault(s.get("name", "?"), []).append(s)
+    rows = []
+    for name, group in by_name.items():
+        durations = sorted(float(s.get("duration_ms", 0.0)) for s in group)
+        rows.append({
+            "name": name,
+            "count": len(group),
+            "errors": sum(1 for s in group if s.get("status") == "error"),
+            "sessions": len({s.get("session_id") for s in group}),
+            "p50_ms": _percentile(durations, 50),
+            "p95_ms": _percentile(durations, 95),
+            "max_ms": durations[-1],
+            "total_ms": sum(durations),
+        })
+    rows.sort(key=lambda r: r["total_ms"], reverse=True)
+    return rows
+
+
+def print_summary(rows: List[Dict[str, Any]]):
+    print(f"{'span':<44} {'count':>6} {'errors':>6} {'sessions':>8} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10} {'total s':>9}")
+    print("-" * 110)
+    for r in rows:
+        print(f"{r['name'][:44]:<44} {r['count']:>6} {r['errors']:>6} {r['sessions']:>8} "
+              f"{r['p50_ms']:>10.1f} {r['p95_ms']:>10.1f} {r['max_ms']:>10.1f} {r['total_ms'] / 1000:>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize Jarvis trace spans (p50/p95 per span name).")
+    sub = parser.add_subparsers(dest="command", required=True)
+    summary = sub.add_parser("summary", help="Print latency percentiles per span name.")
+    summary.add_argument("files", nargs="*", help=f"JSONL trace files or globs (default: {TRACE_FILE}).")
+    summary.add_argument("--name", help="Only include span names containing this text.")
+    summary.add_argument("--json", action="store_true", help="Print the rows as JSON instead of a table.")
+    args = parser.parse_args()
+
+    paths: List[str] = []
+    for pattern in args.files or [TRACE_FILE]:
+        paths.extend(sorted(glob.glob(pattern)) or [pattern])
+    paths = [p for p in paths if os.path.exists(p)]
+    if not paths:
+        print("No trace files found.")
+        return
+    spans = load_spans(paths)
+    if args.name:
+        spans = [s for s in spans if args.name in s.get("name", "")]
+    rows = summarize_spans(spans)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(f"{len(spans)} spans from {len(paths)} file(s), {len({s.get('session_id') for s in spans})} session(s)\n")
+        print_summary(rows)
+
+
+if __name__ == "__main__":
+    main()
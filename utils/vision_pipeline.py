@@ -0,0 +1,186 @@
+import logging
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger("VisionPipeline")
+
+VISION_PIPELINE_ENABLED = os.getenv("JARVIS_VISION_PIPELINE", "true").lower() in ("1", "true", "yes")
+# Inference input size (pixels, longest side) and stride (run on every Nth captured frame).
+VISION_IMGSZ = int(os.getenv("JARVIS_VISION_IMGSZ", "416"))
+VISION_STRIDE = max(1, int(os.getenv("JARVIS_VISION_STRIDE", "1")))
+# A search ends once the target is found in this many consecutive inferences (0 = search the full duration).
+VISION_STABLE_FRAMES = int(os.getenv("JARVIS_VISION_STABLE_FRAMES", "3"))
+
+
+class RateMeter:
+    """Events per second over a sliding window of the last `window` events."""
+
+    def __init__(self, window: int = 30):
+        self._stamps: Deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def tick(self, now: Optional[float] = None):
+        self._stamps.append(time.perf_counter() if now is None else now)
+        self.count += 1
+
+    def rate(self) -> float:
+        if len(self._stamps) < 2:
+            return 0.0
+        span = self._stamps[-1] - self._stamps[0]
+        return (len(self._stamps) - 1) / span if span > 0 else 0.0
+
+
+class FramePacket:
+    __slots__ = ("seq", "captured_at", "frame")
+
+    def __init__(self, seq: int, captured_at: float, frame: Any):
+        self.seq = seq
+        self.captured_at = captured_at
+        self.frame = frame
+
+
+class LatestFrameGrabber:
+    """
+    Reads the camera on its own thread and keeps only the newest frame, so consumers never
+    work on frames that sat in the driver buffer. Older frames are simply overwritten.
+    """
+
+    def __init__(self, cap: Any, name: str = "CameraCapture"):
+        self.cap = cap
+        self.name = name
+        self.meter = RateMeter()
+        self.read_failures = 0
+        self._latest: Optional[FramePacket] = None
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        try:
+            import cv2
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        except Exception:
+            pass
+
+    def start(self) -> "LatestFrameGrabber":
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        seq = 0
+        while not self._stop.is_set():
+            ok, frame = self.cap.read()
+            if not ok:
+                self.read_failures += 1
+                time.sleep(0.05)
+                continue
+            seq += 1
+            now = time.perf_counter()
+            self.meter.tick(now)
+            with self._cond:
+                self._latest = FramePacket(seq, now, frame)
+                self._cond.notify_all()
+
+    def latest(self) -> Optional[FramePacket]:
+        with self._cond:
+            return self._latest
+
+    def wait_newer(self, after_seq: int, timeout: float = 0.5) -> Optional[FramePacket]:
+        """Newest frame with a sequence number above `after_seq`, or None on timeout/stop."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._stop.is_set() or (self._latest is not None and self._latest.seq > after_seq),
+                                timeout=timeout)
+            if self._latest is not None and self._latest.seq > after_seq:
+                return self._latest
+            return None
+
+    def stop(self):
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+
+class InferenceResult:
+    __slots__ = ("seq", "captured_at", "finished_at", "detections")
+
+    def __init__(self, seq: int, captured_at: float, finished_at: float, detections: List[Dict[str, Any]]):
+        self.seq = seq
+        self.captured_at = captured_at
+        self.finished_at = finished_at
+        self.detections = detections
+
+
+class InferenceWorker:
+    """
+    Runs `infer(frame) -> detections` on the newest captured frame, skipping to every `stride`-th
+    frame, on its own thread. The render loop reads `latest_result()` and never waits for inference.
+    """
+
+    def __init__(self, grabber: LatestFrameGrabber, infer: Callable[[Any], List[Dict[str, Any]]],
+                 stride: int = VISION_STRIDE, name: str = "VisionInference"):
+        self.grabber = grabber
+        self.infer = infer
+        self.stride = max(1, stride)
+        self.name = name
+        self.meter = RateMeter()
+        self.latencies_ms: Deque[float] = deque(maxlen=300)
+        self.errors = 0
+        self._result: Optional[InferenceResult] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "InferenceWorker":
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        last_seq = 0
+        while not self._stop.is_set():
+            packet = self.grabber.wait_newer(last_seq + self.stride - 1, timeout=0.5)
+            if packet is None:
+                continue
+            last_seq = packet.seq
+            try:
+                detections = self.infer(packet.frame)
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Inference failed on frame {packet.seq}: {e}")
+                continue
+            finished = time.perf_counter()
+            self.meter.tick(finished)
+            self.latencies_ms.append((finished - packet.captured_at) * 1000)
+            with self._lock:
+                self._result = InferenceResult(packet.seq, packet.captured_at, finished, detections)
+
+    def latest_result(self) -> Optional[InferenceResult]:
+        with self._lock:
+            return self._result
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+def pipeline_stats(grabber: LatestFrameGrabber, worker: InferenceWorker, render_meter: Optional[RateMeter] = None) -> Dict[str, Any]:
+    """Capture FPS, inference FPS, render FPS and capture-to-detection latency (ms) of a pipelined run."""
+    latencies = sorted(worker.latencies_ms)
+    stats: Dict[str, Any] = {
+        "capture_fps": round(grabber.meter.rate(), 1),
+        "inference_fps": round(worker.meter.rate(), 1),
+        "frames_captured": grabber.meter.count,
+        "frames_inferred": worker.meter.count,
+        "inference_stride": worker.stride,
+        "detection_latency_ms_p50": round(statistics.median(latencies), 1) if latencies else None,
+        "detection_latency_ms_p95": round(latencies[int(0.95 * (len(latencies) - 1))], 1) if latencies else None,
+    }
+    if render_meter is not None:
+        stats["render_fps"] = round(render_meter.rate(), 1)
+    return stats